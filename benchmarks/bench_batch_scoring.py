@@ -0,0 +1,41 @@
+"""Benchmarks vectorized batch re-scoring against the row-at-a-time path.
+
+Usage:
+    $ python -m benchmarks.bench_batch_scoring [rows] [candidates per row]
+"""
+import random
+import sys
+from time import perf_counter
+
+from pandas import DataFrame
+
+from benchmarks.bench_scoring import make_profile, make_row
+from src.alumnifinder.finder import batch, scoring
+
+
+def main(size: int = 50000, candidates: int = 3) -> None:
+    rand = random.Random(0)
+    rows = DataFrame([make_row(rand) for _ in range(size)])
+    profiles = {'https://www.linkedin.com/in/{}/'.format(i): make_profile(rand) for i in range(size)}
+    links = list(profiles)
+    pairs = DataFrame({'row': [i // candidates for i in range(size * candidates)],
+                       'profile': [rand.choice(links) for _ in range(size * candidates)]})
+
+    start = perf_counter()
+    totals = []
+    for index, row in rows.iterrows():
+        for link in pairs['profile'].values[index * candidates:(index + 1) * candidates]:
+            totals.append(scoring.score_profile(row, profiles[link], 'Software Engineer', 'Buffalo').total)
+    row_elapsed = perf_counter() - start
+
+    start = perf_counter()
+    scores = batch.score_pairs(rows, profiles, pairs, 'Software Engineer', 'Buffalo')
+    batch_elapsed = perf_counter() - start
+
+    assert scores['total'].tolist() == totals, 'batch scores differ from the row-at-a-time path'
+    print('{} pairs, row-at-a-time: {:.3f}s, vectorized: {:.3f}s, speedup: {:.1f}x'.format(
+        len(pairs), row_elapsed, batch_elapsed, row_elapsed / batch_elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
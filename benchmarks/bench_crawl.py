@@ -0,0 +1,64 @@
+"""Benchmarks the crawl pipeline end to end against the local stand-in site, in rows per minute.
+
+Runs pipeline.CrawlPipeline, the path the GUI and the command line crawl through, with --browsers browsers. Requires
+Google Chrome and the bundled chromedriver. Exits with status 1 when throughput is below --min-rows-per-minute,
+so that CI fails on regressions.
+
+Usage:
+    $ python -m benchmarks.bench_crawl [--rows 20] [--browsers 1] [--latency 0.05] [--min-rows-per-minute 0]
+"""
+import argparse
+import json
+import sys
+from time import perf_counter
+
+from pandas import DataFrame
+
+from src.alumnifinder.excel.writer import ResultSink
+from src.alumnifinder.finder.pipeline import CrawlPipeline
+from tests.conftest import get_test_data
+from tests.fixtures.site import Site
+
+
+def input_rows(rows: int) -> DataFrame:
+    """Cycles through the test data, with distinct last names so that the search cache does not kick in."""
+    data = DataFrame(get_test_data())
+    data = data.iloc[[i % len(data) for i in range(rows)]].reset_index(drop=True)
+    data['LAST_NAME'] = [name + str(i) for i, name in enumerate(data['LAST_NAME'])]
+    return data
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20)
+    parser.add_argument('--browsers', type=int, default=1)
+    parser.add_argument('--candidates', type=int, default=3, help='matching search results per name')
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds added to every response')
+    parser.add_argument('--min-rows-per-minute', type=float, default=0.0, help='regression budget')
+    args = parser.parse_args(argv)
+
+    site = Site(candidates=args.candidates, latency=args.latency)
+    base_url = site.start()
+    try:
+        output = ResultSink()
+        pipeline = CrawlPipeline(input_rows(args.rows), output, browsers=args.browsers, rate=0, base_url=base_url,
+                                 pause=(0, 0))
+        start = perf_counter()
+        pipeline.crawl_linkedin()
+        elapsed = perf_counter() - start
+    finally:
+        site.stop()
+
+    rows_per_minute = args.rows / elapsed * 60
+    print(json.dumps({'rows': args.rows, 'browsers': args.browsers, 'seconds': round(elapsed, 3),
+                      'rows_per_minute': round(rows_per_minute, 1), 'requests': site.requests,
+                      'output_rows': len(output)}))
+    if rows_per_minute < args.min_rows_per_minute:
+        print('FAILED: {:.1f} rows/min is below the budget of {} rows/min'.format(
+            rows_per_minute, args.min_rows_per_minute), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
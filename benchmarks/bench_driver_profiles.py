@@ -0,0 +1,92 @@
+"""Benchmarks resident memory and page load time of every driver profile against the local stand-in site.
+
+Resident memory is the sum of the RSS of chromedriver and every Chrome process it started, read from /proc (Linux
+only), after loading --pages profile pages. Requires Google Chrome and the bundled chromedriver.
+
+Usage:
+    $ python -m benchmarks.bench_driver_profiles [--pages 20] [--latency 0.05] [--profile lightweight]
+"""
+import argparse
+import json
+import os
+import sys
+from time import perf_counter
+
+from src.alumnifinder.finder import browser, drivers
+from src.alumnifinder.finder.metrics import percentile
+from tests.fixtures.site import Site, slugify
+
+
+def children(pid: int) -> list:
+    """Direct child process ids of pid."""
+    pids = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open('/proc/{}/stat'.format(entry)) as stat_file:
+                stat = stat_file.read()
+        except OSError:
+            continue  # exited meanwhile
+        if int(stat.rsplit(')', 1)[1].split()[1]) == pid:
+            pids.append(int(entry))
+    return pids
+
+
+def tree_rss(pid: int) -> int:
+    """Resident bytes of pid and all of its descendants."""
+    rss = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open('/proc/{}/statm'.format(current)) as statm_file:
+                rss += int(statm_file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except OSError:
+            continue
+        pending.extend(children(current))
+    return rss
+
+
+def measure(profile: browser.DriverProfile, base_url: str, pages: int) -> dict:
+    start = perf_counter()
+    driver, profile_dir = profile.launch(drivers.LINUX_DRIVER_PATH)
+    launch = perf_counter() - start
+    try:
+        loads = []
+        for i in range(pages):
+            start = perf_counter()
+            driver.get('{}/in/{}/'.format(base_url, slugify('jane jones', i)))
+            loads.append(perf_counter() - start)
+        rss = tree_rss(driver.service.process.pid)
+    finally:
+        browser.quit_driver(driver, profile_dir)
+    loads.sort()
+    return {'profile': profile.name, 'launch_seconds': round(launch, 3), 'rss_mb': round(rss / 2 ** 20, 1),
+            'load_p50_ms': round(percentile(loads, 50) * 1000, 1),
+            'load_p95_ms': round(percentile(loads, 95) * 1000, 1)}
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds added to every response')
+    parser.add_argument('--profile', action='append', choices=sorted(browser.PROFILES),
+                        help='profile to measure, repeatable, all of them by default')
+    args = parser.parse_args(argv)
+    if not sys.platform.startswith('linux'):
+        print('FAILED: resident memory is read from /proc, Linux only', file=sys.stderr)
+        return 1
+
+    site = Site(latency=args.latency)
+    base_url = site.start()
+    try:
+        for name in args.profile or sorted(browser.PROFILES):
+            print(json.dumps(measure(browser.PROFILES[name], base_url, args.pages)))
+    finally:
+        site.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
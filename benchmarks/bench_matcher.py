@@ -0,0 +1,56 @@
+"""Benchmarks the patterns.json synonym matchers over synthetic education text.
+
+Compares one scan of each category's combined expression with searching every synonym one at a time, and reports the
+memoized Matcher.mask that scoring uses, since profiles repeat the same few texts.
+
+Usage:
+    $ python -m benchmarks.bench_matcher [texts]
+"""
+import random
+import re
+import sys
+from time import perf_counter
+
+from benchmarks.bench_scoring import DEGREES, MAJORS, SCHOOLS
+from src.alumnifinder.finder import matcher
+from src.alumnifinder.utils import jsonreader
+
+
+def make_text(rand: random.Random) -> str:
+    return '{}, {}, {} {}'.format(rand.choice(SCHOOLS), rand.choice(DEGREES), rand.choice(MAJORS),
+                                  rand.randint(1980, 2017))
+
+
+def one_by_one(patterns: list) -> list:
+    """Every synonym as its own expression, the way a hand-written chain of checks scans a text."""
+    regexes = []
+    for category in patterns:
+        for entry in category['data']:
+            synonyms = entry['synonyms'] if isinstance(entry, dict) else [entry]
+            regexes += [re.compile(r'(?<!\w){}(?!\w)'.format(matcher.synonym_pattern(synonym)), re.IGNORECASE)
+                        for synonym in synonyms]
+    return regexes
+
+
+def timed(label: str, texts: list, classify) -> None:
+    start = perf_counter()
+    found = sum(1 for text in texts if classify(text))
+    elapsed = perf_counter() - start
+    print('{:<12} {} texts in {:.3f}s, {:.0f} texts/s ({} matched)'.format(label, len(texts), elapsed,
+                                                                           len(texts) / elapsed, found))
+
+
+def main(texts: int = 200000) -> None:
+    rand = random.Random(0)
+    # unique texts, so that only the memoized run hits its cache
+    texts = ['{} #{}'.format(make_text(rand), i) for i in range(texts)]
+    matchers = list(matcher.get_matchers().values())
+    regexes = one_by_one(jsonreader.get_patterns())
+    timed('one-by-one', texts, lambda text: any([regex.search(text) is not None for regex in regexes]))
+    timed('compiled', texts, lambda text: any([m.scan(text) for m in matchers]))
+    repeated = [make_text(rand) for _ in range(len(texts))]
+    timed('memoized', repeated, lambda text: any([m.mask(text) for m in matchers]))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
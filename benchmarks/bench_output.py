@@ -0,0 +1,58 @@
+"""Benchmarks time and memory per result rows, DataFrame enlargement with .at against the ResultSink.
+
+Usage:
+    $ python -m benchmarks.bench_output [rows]
+"""
+import sys
+import tracemalloc
+from time import perf_counter
+
+from pandas import DataFrame
+
+from src.alumnifinder.excel.writer import OUTPUT_COLUMNS, ResultSink
+
+
+def result_rows(rows: int):
+    for i in range(rows):
+        yield {'ROW_NUMBER': str(i + 2), 'ID_NUMBER': '{:010d}'.format(i), 'KEYWORD': 'Jane Jones',
+               'FULL_NAME_ON_LINKEDIN': 'Jane Jones', 'JOB_TITLE': 'Software Engineer', 'COMPANY_NAME': 'IBM',
+               'COMPANY_LOCATION': 'Buffalo, New York', 'PROFILE_LINK': 'https://www.linkedin.com/in/jane-jones/',
+               'ACCURACY_SCORE': str(i % 10)}
+
+
+def enlarge_frame(rows: int) -> DataFrame:
+    """The crawler's former output path, one .at insert per cell on a row index that does not exist yet."""
+    output = DataFrame(data='', index=[0], columns=OUTPUT_COLUMNS)
+    for index, record in enumerate(result_rows(rows)):
+        for column, value in record.items():
+            output.at[index, column] = value
+    return output
+
+
+def fill_sink(rows: int) -> DataFrame:
+    output = ResultSink(OUTPUT_COLUMNS)
+    for record in result_rows(rows):
+        for column, value in record.items():
+            output.set(column, value)
+        output.end_row()
+    return output.to_frame()
+
+
+def measure(function, rows: int) -> (float, float):
+    tracemalloc.start()
+    start = perf_counter()
+    function(rows)
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+def main(rows: int = 10000) -> None:
+    for name, function in (('DataFrame.at', enlarge_frame), ('ResultSink', fill_sink)):
+        elapsed, peak = measure(function, rows)
+        print('{:<12} {} rows: {:.3f}s, peak {:.1f} MiB'.format(name, rows, elapsed, peak))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,62 @@
+"""Benchmarks time and memory of reading a 100 row search range out of a large export, whole-file pandas.read_excel
+against the streaming reader and the workbook cache (converted on a first run, not timed).
+
+Usage:
+    $ python -m benchmarks.bench_reader [rows]
+"""
+import os
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from pandas import DataFrame, read_csv, read_excel
+
+from src.alumnifinder.excel import reader
+from src.alumnifinder.excel.cache import WorkbookCache
+from tests.conftest import get_test_data
+
+START = 1000
+END = 1100
+
+
+def write_export(rows: int, directory: str) -> (str, str):
+    data = DataFrame(get_test_data())
+    data = data.iloc[[i % len(data) for i in range(rows)]].reset_index(drop=True)
+    for i in range(1, 11):
+        data['EXTRA{}'.format(i)] = 'a column the crawler does not use'
+    xlsx_path = os.path.join(directory, 'export.xlsx')
+    csv_path = os.path.join(directory, 'export.csv')
+    data.to_excel(xlsx_path, index=False)
+    data.to_csv(csv_path, index=False)
+    return xlsx_path, csv_path
+
+
+def measure(function, *args) -> (float, float):
+    tracemalloc.start()
+    start = perf_counter()
+    rows = function(*args)
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert len(rows) == END - START
+    return elapsed, peak / 2 ** 20
+
+
+def main(rows: int = 20000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        xlsx_path, csv_path = write_export(rows, directory)
+        cache = WorkbookCache(os.path.join(directory, 'workbooks'))
+        cache.open(xlsx_path)
+        for name, function, path in (
+                ('read_excel', lambda path: read_excel(path).iloc[START:END], xlsx_path),
+                ('reader xlsx', lambda path: reader.read_range(path, START, END), xlsx_path),
+                ('cached xlsx', lambda path: cache.open(path).read_range(START, END), xlsx_path),
+                ('read_csv', lambda path: read_csv(path).iloc[START:END], csv_path),
+                ('reader csv', lambda path: reader.read_range(path, START, END), csv_path)):
+            elapsed, peak = measure(function, path)
+            print('{:<12} rows {}-{} of {}: {:.3f}s, peak {:.1f} MiB'.format(name, START, END, rows, elapsed, peak))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
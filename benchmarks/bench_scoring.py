@@ -0,0 +1,55 @@
+"""Benchmarks offline scoring throughput, no browser involved.
+
+Usage:
+    $ python -m benchmarks.bench_scoring [pairs]
+"""
+import random
+import sys
+from time import perf_counter
+
+from src.alumnifinder.finder import scoring
+from src.alumnifinder.finder.profile import Education, Job, Profile
+
+TITLES = ['Software Engineer', 'Project Manager', 'Business Analyst', 'Web Developer', 'Systems Administrator']
+COMPANIES = ['IBM', 'Amazon.com', 'Microsoft', 'M&T Bank', 'Oracle']
+SCHOOLS = ['University at Buffalo', 'State University of New York at Buffalo', 'Rochester Institute of Technology']
+DEGREES = ['Bachelor of Science (BS)', 'Master of Science (MS)', 'Bachelor of Arts (BA)', 'Doctor of Philosophy']
+MAJORS = ['Computer Science', 'Electrical Engineering', 'Economics', 'Civil Engineering']
+
+
+def make_profile(rand: random.Random) -> Profile:
+    jobs = [Job(rand.choice(TITLES), ['Company Name\n' + rand.choice(COMPANIES), 'Location\nBuffalo, New York'])
+            for _ in range(rand.randint(0, 4))]
+    educations = []
+    for _ in range(rand.randint(0, 3)):
+        year = rand.randint(1980, 2017)
+        educations.append(Education(rand.choice(SCHOOLS), [rand.choice(DEGREES), rand.choice(MAJORS)],
+                                    [str(year - 4), str(year)]))
+    return Profile(jobs, educations)
+
+
+def make_row(rand: random.Random) -> dict:
+    row = {'WORK_TITLE': rand.choice(TITLES), 'WORK_COMPANY_NAME1': rand.choice(COMPANIES)}
+    for i in range(1, 4):
+        filled = i == 1 or rand.random() < 0.3
+        row['SCHOOL{}'.format(i)] = 'School of Engineering & Applied Science' if filled else float('nan')
+        row['MAJOR{}'.format(i)] = rand.choice(MAJORS) if filled else ''
+        row['DEGREE_CODE{}'.format(i)] = rand.choice(['B.S.', 'M.S.', 'B.A.', 'Ph.D.']) if filled else ''
+        row['DEGREE_YEAR{}'.format(i)] = float(rand.randint(1980, 2017)) if filled else float('nan')
+    return row
+
+
+def main(pairs: int = 100000) -> None:
+    rand = random.Random(0)
+    rows = [make_row(rand) for _ in range(1000)]
+    profiles = [make_profile(rand) for _ in range(1000)]
+    start = perf_counter()
+    total = 0
+    for i in range(pairs):
+        total += scoring.score_profile(rows[i % 1000], profiles[(i * 7) % 1000], 'Software Engineer', 'Buffalo').total
+    elapsed = perf_counter() - start
+    print('scored {} pairs in {:.3f}s, {:.0f} pairs/s (checksum {})'.format(pairs, elapsed, pairs / elapsed, total))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,96 @@
+"""Benchmarks extracting the cards of a search results page, per page.
+
+Offline, times parse_search_results on the stand-in site's search pages. With --browser, also loads the pages in
+Chrome and compares the former extraction, a find_element chain and an XPath query per card, with a single page_source
+snapshot parsed in-process; the browser part requires Google Chrome and the bundled chromedriver.
+
+Usage:
+    $ python -m benchmarks.bench_search_results [--pages 20] [--candidates 10] [--browser]
+"""
+import argparse
+import json
+import sys
+from time import perf_counter
+
+from selenium.webdriver.common.by import By
+
+from src.alumnifinder import config
+from src.alumnifinder.finder import browser, drivers
+from src.alumnifinder.finder.metrics import percentile
+from src.alumnifinder.finder.profile import parse_search_results
+from tests.fixtures.site import Site
+
+CARDS = '//div[@class="search-result__info pt3 pb4 ph0"]'
+
+
+def per_card(driver) -> list:
+    """The former extraction, about 10 driver round trips per card."""
+    cards = []
+    for div in driver.find_elements(By.XPATH, CARDS):
+        anchor = div.find_element(By.TAG_NAME, 'a')
+        link = anchor.get_attribute('href')
+        h3_id = anchor.find_element(By.TAG_NAME, 'h3').get_attribute('id')
+        name = anchor.find_element(By.XPATH, '//h3[@id="' + h3_id + '"]/span[1]/span').text
+        sublines = [div.find_elements(By.CLASS_NAME, 'subline-level-{}'.format(level)) for level in (1, 2)]
+        cards.append((name, link) + tuple(elements[0].text if elements else '' for elements in sublines))
+    return cards
+
+
+def one_pass(driver) -> list:
+    """A single page_source round trip, parsed in-process."""
+    return [tuple(card) for card in parse_search_results(driver.page_source)]
+
+
+def timings(durations: list) -> dict:
+    durations = sorted(durations)
+    return {'p50_ms': round(percentile(durations, 50) * 1000, 2), 'p95_ms': round(percentile(durations, 95) * 1000, 2)}
+
+
+def offline(site: Site, pages: int) -> dict:
+    sources = [site.search_page('jane{} jones Buffalo'.format(i)) for i in range(pages)]
+    durations = []
+    for source in sources:
+        start = perf_counter()
+        parse_search_results(source)
+        durations.append(perf_counter() - start)
+    return dict({'method': 'parse only'}, **timings(durations))
+
+
+def in_browser(site: Site, pages: int) -> list:
+    base_url = site.start()
+    try:
+        driver, profile_dir = browser.get_profile(config.driver_profile).launch(drivers.LINUX_DRIVER_PATH)
+        try:
+            results = []
+            for name, extract in (('per card', per_card), ('one pass', one_pass)):
+                durations = []
+                for i in range(pages):
+                    driver.get('{}/search/results/people/?keywords=jane{}+jones+Buffalo'.format(base_url, i))
+                    start = perf_counter()
+                    cards = extract(driver)
+                    durations.append(perf_counter() - start)
+                results.append(dict({'method': name, 'cards_per_page': len(cards)}, **timings(durations)))
+            return results
+        finally:
+            browser.quit_driver(driver, profile_dir)
+    finally:
+        site.stop()
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--candidates', type=int, default=10, help='matching search results per page')
+    parser.add_argument('--browser', action='store_true', help='also time both extractions in Chrome')
+    args = parser.parse_args(argv)
+
+    site = Site(candidates=args.candidates)
+    print(json.dumps(offline(site, args.pages)))
+    if args.browser:
+        for result in in_browser(site, args.pages):
+            print(json.dumps(result))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Benchmarks cold start of the GUI and the command line, with a regression budget.
+
+Every target is started in a fresh interpreter with -X importtime. Reports the median wall time and the slowest
+modules of the package, and fails (exit code 1) if a target is over budget or imports one of the heavy dependencies
+that are only needed once a crawl starts.
+
+Usage:
+    $ python -m benchmarks.bench_startup [--runs 5] [--budget-ms 500]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    'gui': ['-c', 'import src.alumnifinder.gui.app'],  # everything main.py imports before the window appears
+    'cli --help': ['-m', 'src.alumnifinder', '--help'],
+}
+HEAVY = ['pandas', 'numpy', 'selenium', 'xlsxwriter', 'openpyxl', 'xlrd', 'lxml']
+
+
+def start(arguments: list) -> (float, list):
+    """Runs a target once.
+
+    Returns:
+        wall time in seconds, and the (module, cumulative microseconds) imports reported by -X importtime, module names
+        indented by nesting depth.
+    """
+    began = perf_counter()
+    completed = subprocess.run([sys.executable, '-X', 'importtime'] + arguments, cwd=ROOT, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    elapsed = perf_counter() - began
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        imports.append((module.rstrip(), int(cumulative)))  # nested imports are indented
+    return elapsed, imports
+
+
+def main(runs: int = 5, budget_ms: float = 500) -> int:
+    failed = False
+    for name, arguments in TARGETS.items():
+        results = [start(arguments) for _ in range(runs)]
+        wall = statistics.median(elapsed for elapsed, _ in results) * 1000
+        imports = results[-1][1]
+        heavy = sorted({module.strip() for module, _ in imports if module.strip() in HEAVY})
+        over = wall > budget_ms
+        failed = failed or over or bool(heavy)
+        print('{:<12} {:7.1f} ms median of {} (budget {:.0f} ms){}'.format(name, wall, runs, budget_ms,
+                                                                          '  OVER BUDGET' if over else ''))
+        if heavy:
+            print('             heavy imports: {}'.format(', '.join(heavy)))
+        own = [(module.strip(), cumulative) for module, cumulative in imports
+               if module.strip().startswith('src.alumnifinder')]
+        for module, cumulative in sorted(own, key=lambda item: -item[1])[:5]:
+            print('             {:7.1f} ms  {}'.format(cumulative / 1000, module))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=500)
+    args = parser.parse_args()
+    sys.exit(main(args.runs, args.budget_ms))
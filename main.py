@@ -1,6 +1,10 @@
+import logging
 from tkinter import Tk
 
 from src.alumnifinder.gui.app import App
+from src.alumnifinder.utils.logs import configure_logging
+
+configure_logging(logging.DEBUG)
 
 root = Tk()  # initializes tkinter
 app = App(root)  # creates window with bar and decorations specified by window manager
@@ -0,0 +1,5 @@
+import sys
+
+from src.alumnifinder.cli import main
+
+sys.exit(main())
@@ -0,0 +1,140 @@
+"""Command line entry point, for headless batch servers and scheduled runs.
+
+    $ python -m src.alumnifinder crawl alumni.xlsx --start-row 2 --end-row 501 --geolocation Buffalo
+
+Runs the same crawl as the GUI, without importing tkinter, and prints a JSON run summary. SIGINT and SIGTERM stop the
+crawl before its next row, the partial results are saved and the journal is kept, --resume picks it up again.
+
+Exit codes:
+    0   every row was crawled.
+    1   the crawl failed, the partial results are saved.
+    2   invalid arguments.
+    3   the input file is missing, not an .xlsx, .xls or .csv file, or could not be read, e.g. it has no headers.
+    130 the crawl was cancelled, the partial results are saved.
+"""
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+
+from src.alumnifinder.finder.browser import PROFILES
+from src.alumnifinder.utils.logs import configure_logging
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_INPUT = 3
+EXIT_CANCELLED = 130
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='alumnifinder', description='Finds alumni on LinkedIn.')
+    commands = parser.add_subparsers(dest='command')
+    crawl_parser = commands.add_parser('crawl', help='crawl a range of an input file')
+    crawl_parser.add_argument('input', help='input .xlsx, .xls or .csv file')
+    crawl_parser.add_argument('--start-row', type=int, help='first spreadsheet row, 2 or more, with --end-row')
+    crawl_parser.add_argument('--end-row', type=int, help='last spreadsheet row, with --start-row')
+    crawl_parser.add_argument('--geolocation', default='', help='target region')
+    crawl_parser.add_argument('--job-position', default='', help='current alumni job position')
+    crawl_parser.add_argument('--output', help='output file, next to the input file by default')
+    crawl_parser.add_argument('--format', dest='output_format', choices=['xlsx', 'csv'], default='xlsx',
+                              help='output format')
+    crawl_parser.add_argument('--workers', type=int, default=0, help='number of browsers, 0 for automatic')
+    crawl_parser.add_argument('--cache-dir', help='directory of the profile and workbook caches')
+    crawl_parser.add_argument('--driver-profile', choices=sorted(PROFILES), help='Chrome launch options')
+    crawl_parser.add_argument('--no-pruning', action='store_true',
+                              help='open every candidate profile instead of the best ranked search results only')
+    crawl_parser.add_argument('--resume', action='store_true', help='resume the previous run of the same output')
+    crawl_parser.add_argument('--summary', default='-', help='file the JSON run summary is written to, - for stdout')
+    crawl_parser.add_argument('--quiet', action='store_true', help='no progress lines on stderr')
+    crawl_parser.add_argument('--verbose', action='store_true', help='debug log of the crawler on stderr')
+    return parser
+
+
+def default_output(input_path: str, start_row: int, end_row: int, output_format: str) -> str:
+    """Output path next to the input file, named like the GUI names it."""
+    directory, file_name = os.path.split(os.path.abspath(input_path))
+    name = os.path.splitext(file_name)[0]
+    if start_row and end_row:
+        return os.path.join(directory, '{}_to_{}_{}.{}'.format(start_row, end_row, name, output_format))
+    return os.path.join(directory, 'all_range_{}.{}'.format(name, output_format))
+
+
+def check_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Exits with EXIT_USAGE on invalid arguments, as argparse does."""
+    if (args.start_row is None) != (args.end_row is None):
+        parser.error('--start-row and --end-row go together')
+    if args.start_row is not None and (args.start_row < 2 or args.start_row > args.end_row):
+        parser.error('--start-row must be 2 or more, and not larger than --end-row')
+    if args.workers < 0:
+        parser.error('--workers must be 0 or more')
+
+
+def write_summary(summary: dict, path: str) -> None:
+    text = json.dumps(summary, indent=2, sort_keys=True, default=str)
+    if path == '-':
+        print(text)
+    else:
+        with open(path, 'w') as summary_file:
+            summary_file.write(text + '\n')
+
+
+def crawl(args: argparse.Namespace) -> int:
+    # the crawler and its dependencies are only imported for a crawl, so that --help and usage errors stay fast
+    from src.alumnifinder.excel import reader
+    from src.alumnifinder.finder.job import CANCELLED, DONE, FAILED, Job, run_job, status
+
+    output = args.output or default_output(args.input, args.start_row, args.end_row, args.output_format)
+    options = {'geolocation': args.geolocation, 'job_position': args.job_position}
+    if args.driver_profile:
+        options['driver_profile'] = args.driver_profile
+    if args.no_pruning:
+        options.update(prune_top_k=0, confident_score=0)
+    job = Job(args.input, output, args.start_row, args.end_row, args.workers, args.resume, options,
+              args.output_format, args.cache_dir)
+    try:
+        if not os.path.isfile(args.input):
+            raise reader.InputError("Input file not found.")
+        reader.file_type(args.input)
+    except reader.InputError as e:
+        write_summary(dict(status(job, FAILED, str(e)).summary(), exit_code=EXIT_INPUT), args.summary)
+        return EXIT_INPUT
+
+    cancel = threading.Event()
+
+    def stop(signal_number, frame):
+        cancel.set()
+
+    previous = {number: signal.signal(number, stop) for number in (signal.SIGINT, signal.SIGTERM)}
+
+    def report(progress):
+        if not args.quiet:
+            print(progress.describe(), file=sys.stderr)
+
+    exit_code = None
+    try:
+        final = run_job(job, None, cancel, report)
+    except reader.InputError as e:  # raised by the Handler once the file is read
+        final, exit_code = status(job, FAILED, str(e)), EXIT_INPUT
+    except Exception as e:
+        final = status(job, FAILED, '{}: {}'.format(type(e).__name__, e))
+    finally:
+        for number, handler in previous.items():
+            signal.signal(number, handler)
+    if exit_code is None:
+        exit_code = {DONE: EXIT_OK, CANCELLED: EXIT_CANCELLED}.get(final.state, EXIT_FAILED)
+    write_summary(dict(final.summary(), exit_code=exit_code), args.summary)
+    return exit_code
+
+
+def main(argv: list = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command != 'crawl':
+        parser.error('a command is required')
+    check_args(parser, args)
+    configure_logging(logging.DEBUG if args.verbose else logging.WARNING)
+    return crawl(args)
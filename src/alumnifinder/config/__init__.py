@@ -3,3 +3,29 @@ import os
 credentials_path = os.path.join(os.path.dirname(__file__), "creds.json")
 login_path = os.path.join(os.path.dirname(__file__), "web.json")
 patterns_path = os.path.join(os.path.dirname(__file__), "patterns.json")
+
+# local caches, kept out of the source tree so that they survive rebuilds
+cache_dir = os.path.join(os.path.expanduser("~"), ".alumnifinder")
+profile_cache_path = os.path.join(cache_dir, "profiles.sqlite3")
+profile_cache_ttl = 30 * 24 * 60 * 60  # seconds, profiles older than this are fetched again
+profile_cache_size = 100000  # profiles, least recently used ones are evicted past this
+search_cache_path = os.path.join(cache_dir, "searches.sqlite3")
+search_cache_ttl = 7 * 24 * 60 * 60  # seconds, search results change faster than profiles
+workbook_cache_dir = os.path.join(cache_dir, "workbooks")  # input files converted to memory-mapped columns
+
+# page loads per second of a whole run, shared by every worker (a single crawler averages about one every 3 seconds)
+request_rate = 0.33
+
+# seconds a logged in browser is kept and reused across runs before it is replaced by a fresh login
+session_max_age = 12 * 60 * 60
+
+# Chrome launch options of crawl workers, a name of finder.browser.PROFILES: "lightweight", "visible" or "default"
+driver_profile = "lightweight"
+
+# candidate profiles a worker loads at once in browser tabs, 1 loads them one after the other
+profile_tabs = 4
+
+# candidate pruning, search result cards are scored against the row before any profile is opened, see finder.pruning
+prune_top_k = 3  # best ranked candidates always opened, 0 opens every candidate
+prune_threshold = 2  # candidates with a card score of at least this are opened too
+confident_score = 8  # accuracy score that stops opening the other candidates of a name, 0 never stops early
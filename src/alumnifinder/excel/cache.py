@@ -0,0 +1,186 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from pandas import DataFrame
+
+from src.alumnifinder import config
+from src.alumnifinder.excel import reader
+
+logger = logging.getLogger(__name__)
+
+META_FILE = 'meta.json'
+FORMAT = 2  # version of the conversion layout, conversions of another version are converted again
+TEXT = 'text'
+
+
+def segment_path(directory: str, column: int, segment: int, suffix: str) -> str:
+    return os.path.join(directory, '{}-{}.{}'.format(column, segment, suffix))
+
+
+def write_segment(directory: str, column: int, segment: int, values: np.ndarray) -> str:
+    """Writes a chunk of a column, returns its kind: the dtype of a numeric chunk, TEXT otherwise.
+
+    Text is stored at variable length, the UTF-8 bytes of the cells back to back in a .txt file and the end offset of
+    every cell in a .npy file, empty cells as empty strings.
+    """
+    if values.dtype.kind in 'biuf':
+        np.save(segment_path(directory, column, segment, 'npy'), values)
+        return values.dtype.str
+    cells = [b'' if value is None or value != value else str(value).encode('utf-8') for value in values]
+    ends = np.cumsum([len(cell) for cell in cells], dtype=np.int64)
+    np.save(segment_path(directory, column, segment, 'ends.npy'), ends)
+    with open(segment_path(directory, column, segment, 'txt'), 'wb') as text_file:
+        text_file.write(b''.join(cells))
+    return TEXT
+
+
+class CachedWorkbook:
+    """Input file converted to memory-mapped NumPy arrays, the columns the crawler uses only.
+
+    Columns are stored in segments of consecutive rows, as the file was read. Numeric segments keep their own dtype,
+    other segments are variable length UTF-8 text, so a long free text cell only costs its own length. Reading a range
+    of rows only touches the segments, and the pages of them, that hold the range.
+
+    Args:
+        directory (str): directory of the converted file.
+
+    Attributes:
+        headers (list of str): columns of the input file, in file order.
+        columns (list of str): columns stored, reader.INPUT_COLUMNS found in the file, in file order.
+        rows (int): number of rows, the header excluded.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, META_FILE)) as meta_file:
+            meta = json.load(meta_file)
+        self.path = meta['path']
+        self.headers = meta['headers']
+        self.columns = meta['columns']
+        self.rows = meta['rows']
+        self.segments = meta['segments']  # first row of every segment
+        self.kinds = meta['kinds']  # kind of every segment of every column
+
+    def segment(self, column: int, segment: int, start: int, end: int) -> np.ndarray:
+        """Rows start to end of a segment, (relative to the segment), text as objects with empty cells as NaN."""
+        if self.kinds[column][segment] != TEXT:
+            values = np.load(segment_path(self.directory, column, segment, 'npy'), mmap_mode='r')
+            return np.array(values[start:end])  # copied out of the memory map
+        ends = np.load(segment_path(self.directory, column, segment, 'ends.npy'), mmap_mode='r')[:end]
+        first = int(ends[start - 1]) if start else 0
+        with open(segment_path(self.directory, column, segment, 'txt'), 'rb') as text_file:
+            text_file.seek(first)
+            data = text_file.read(int(ends[-1]) - first if len(ends) else 0)
+        values = np.empty(end - start, dtype=object)
+        offset = 0
+        for i, cell_end in enumerate(ends[start:]):
+            cell_end = int(cell_end) - first
+            values[i] = data[offset:cell_end].decode('utf-8') if cell_end > offset else np.nan
+            offset = cell_end
+        return values
+
+    def read_range(self, start: int = 0, end: int = None, columns: list = reader.INPUT_COLUMNS) -> DataFrame:
+        """Reads the rows start to end (0-based, end excluded, None for the last row), as excel.reader.read_range.
+
+        Only the stored columns can be read, columns=None reads all of them.
+        """
+        end = self.rows if end is None else min(end, self.rows)
+        start = min(start, end)
+        bounds = self.segments + [self.rows]
+        data = {}
+        for index, header in enumerate(self.columns):
+            if columns is not None and header not in columns:
+                continue
+            pieces = [self.segment(index, segment, max(start, first) - first, min(end, bounds[segment + 1]) - first)
+                      for segment, first in enumerate(self.segments)
+                      if first < end and bounds[segment + 1] > start]
+            if not pieces:
+                data[header] = np.array([], dtype=object)
+            elif all(piece.dtype.kind in 'biuf' for piece in pieces):
+                data[header] = np.concatenate(pieces)  # int and float segments become float, as with pandas.concat
+            else:
+                data[header] = np.concatenate([piece.astype(object) for piece in pieces])
+        return DataFrame(data, columns=reader.selected(self.columns, columns), index=range(start, end))
+
+
+class WorkbookCache:
+    """Converts input files once into CachedWorkbook's, keyed by path, size and modification time.
+
+    Parsing a workbook is the slowest part of starting a run, and runs over different ranges of the same export parse
+    the same file again. The first run of a file converts all of its rows, and the columns the crawler uses, later runs
+    read their range from the memory-mapped arrays. A modified file gets a new key and is converted again, older
+    conversions of the same path are removed.
+
+    Args:
+        directory (str): directory of the converted files.
+        chunk_rows (int): rows converted at once, also the rows of a segment.
+    """
+
+    def __init__(self, directory: str = config.workbook_cache_dir, chunk_rows: int = reader.CHUNK_ROWS):
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+
+    def key(self, path: str) -> str:
+        stat = os.stat(path)
+        identity = '{}|{}|{}|{}'.format(os.path.abspath(path), stat.st_size, stat.st_mtime_ns, FORMAT)
+        return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+
+    def open(self, path: str) -> CachedWorkbook:
+        """Returns the conversion of path, converting it first if it is not cached yet."""
+        log_phase = 'Workbook-Cache'
+        entry = os.path.join(self.directory, self.key(path))
+        if os.path.exists(os.path.join(entry, META_FILE)):
+            logger.debug('{}: Cached: {}'.format(log_phase, path))
+            return CachedWorkbook(entry)
+        logger.debug('{}: Converting {}...'.format(log_phase, path))
+        self.remove(path)
+        os.makedirs(self.directory, exist_ok=True)
+        building = tempfile.mkdtemp(dir=self.directory, prefix='.building-')
+        try:
+            self.convert(path, building)
+            os.rename(building, entry)  # atomic, a crash leaves no half written entry behind
+        except OSError:
+            shutil.rmtree(building, ignore_errors=True)
+            if not os.path.exists(os.path.join(entry, META_FILE)):
+                raise
+            # converted meanwhile by another run
+        except Exception:
+            shutil.rmtree(building, ignore_errors=True)
+            raise
+        return CachedWorkbook(entry)
+
+    def convert(self, path: str, directory: str) -> None:
+        """Converts the reader.INPUT_COLUMNS of path chunk by chunk, as it is read."""
+        headers = reader.read_headers(path)
+        columns = reader.selected(headers, reader.INPUT_COLUMNS)
+        segments = []
+        kinds = [[] for _ in columns]
+        rows = 0
+        for chunk in reader.iter_chunks(path, columns=columns, chunk_rows=self.chunk_rows):
+            for index, header in enumerate(columns):
+                kinds[index].append(write_segment(directory, index, len(segments), chunk[header].values))
+            segments.append(rows)
+            rows += len(chunk)
+        with open(os.path.join(directory, META_FILE), 'w') as meta_file:
+            json.dump({'path': os.path.abspath(path), 'headers': headers, 'columns': columns, 'rows': rows,
+                       'segments': segments, 'kinds': kinds}, meta_file)
+
+    def remove(self, path: str) -> None:
+        """Removes every conversion of path."""
+        if not os.path.isdir(self.directory):
+            return
+        path = os.path.abspath(path)
+        for name in os.listdir(self.directory):
+            meta_path = os.path.join(self.directory, name, META_FILE)
+            try:
+                with open(meta_path) as meta_file:
+                    if json.load(meta_file)['path'] != path:
+                        continue
+            except (OSError, ValueError):
+                continue
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
@@ -1,108 +1,96 @@
-import numpy as np
-from pandas import read_excel, DataFrame
+from pandas import DataFrame
+
+from src.alumnifinder.excel import reader
+from src.alumnifinder.finder import batch
 
 
 class Handler:
     """Used to process the Excel file data.
 
+    Only the rows of the search range and the columns the crawler uses are read from the file (see excel.reader), so
+    opening a small range of a large export is fast and light. The rows are then prepared for scoring once, with
+    normalized text and integer year columns (see batch.prepare_rows).
+
     Args:
-        excel_file (str): the file path of input excel
+        excel_file (str): the file path of input excel, or csv
         start (int): start row number, 1-based row number in spread sheet
         end (int): end row number
+        columns (list of str): columns to read, all of them if None.
+        cache (WorkbookCache): converted input files, the file is read from its conversion instead of parsed.
 
     Attributes:
-        data (pandas DataFrame): DataFrame representation of the Excel file.
-        headers (list of str): all of the headers that exist in the DataFrame
-        size (int): number of rows in the DataFrame.
-        start_row(int): 0-based start row index in the DataFrame representation
-        end_row(int): end row index
+        data (pandas DataFrame): DataFrame representation of the search range of the Excel file, indexed by 0-based
+            row position in the file.
+        headers (list of str): all of the headers that exist in the file
+        size (int): number of rows of the search range, (only the range is read, not the whole file).
+        start_row(int): 0-based start row index in the file
+        end_row(int): end row index, None for the last row
+        divided_data (pandas DataFrame): the rows to crawl, the same DataFrame as data.
+        divided_data_size (int): number of rows to crawl, the same as size.
     """
 
-    def __init__(self, excel_file: str, start=None, end=None):
-        self.data = self.read_excel(excel_file)
-        self.headers = self.check_headers()
-        self.size = len(self.data)
-        if start and end:
-            self.check_start_finish(start, end)
+    def __init__(self, excel_file: str, start=None, end=None, columns: list = reader.INPUT_COLUMNS, cache=None):
+        """Reads the search range of excel_file.
+
+        Raises:
+            InputError: the file could not be read, has no headers, or the search range is invalid.
+        """
+        try:
+            self.workbook = cache.open(excel_file) if cache is not None else None
+            self.headers = self.check_headers(
+                self.workbook.headers if self.workbook is not None else reader.read_headers(excel_file))
+            if start and end:
+                self.check_start_finish(start, end)
             self.start_row, self.end_row = self.parse_search_range(start, end)
-            self.divided_data = self.data.iloc[self.start_row:self.end_row]
-            self.divided_data_size = len(self.divided_data)
-        elif not start and not end:
-            self.divided_data = self.data
-            self.divided_data_size = len(self.data)
+            self.data = batch.prepare_rows(self.read_excel(excel_file, columns))
+        except reader.InputError:
+            raise
+        except Exception as e:
+            raise reader.InputError("Input file could not be read: {}".format(e)) from e
+        self.size = len(self.data)
+        self.divided_data = self.data
+        self.divided_data_size = self.size
 
-    def read_excel(self, excel_file: str) -> DataFrame:
-        """Determines which engine to use based on type of excel file.
+    def read_excel(self, excel_file: str, columns: list = reader.INPUT_COLUMNS) -> DataFrame:
+        """Reads the search range of an excel or csv file.
 
         Args:
             excel_file: path to excel file
+            columns: columns to read, all of them if None.
 
         Returns:
              A 'pandas' DataFrame object. This allows for more flexible data analysis and does not modify the original
              excel file.
 
         Raises:
-            ValueError: Any file type other than excel.
+            ValueError: Any file type other than excel or csv.
         """
-        if excel_file.endswith(".xls"):
-            return read_excel(excel_file, engine='xlrd')
-        elif excel_file.endswith(".xlsx"):
-            return read_excel(excel_file)
-        else:
-            raise ValueError("Invalid file type.")
+        if self.workbook is not None:
+            return self.workbook.read_range(self.start_row, self.end_row, columns)
+        return reader.read_range(excel_file, self.start_row, self.end_row, columns)
 
-    def check_headers(self) -> list:
+    def check_headers(self, headers: list = None) -> list:
         """Checks if file contains headers.
 
         Stores headers as a member variable if true.
 
+        Args:
+            headers (list): header row of the file, the headers read on init if None.
+
         Returns:
              list containing all of the column headers
 
         Raises:
-            ValueError: If file doesn't contain headers, there's no way to interpret the data.
+            InputError: If file doesn't contain headers, there's no way to interpret the data.
         """
-        for col in list(self.data.columns.values):
+        if headers is None:
+            headers = self.headers
+        for col in headers:
             if type(col) is int:
-                raise ValueError("File must contain headers, not numerical values.")
+                raise reader.InputError("File must contain headers, not numerical values.")
             elif type(col) is not str:
-                raise ValueError("File must contain headers.")
-        return list(self.data.columns.values)
-
-    def find_divisor(self) -> int:
-        """Finds the highest divisor that can divide our data equally.
-
-        Returns:
-            (int) highest divisor that can divide our data equally.
-        """
-        if self.size < 2:
-            return 1
-        else:
-            # TODO: find maximum amount of drivers our machine can handle
-            max_drivers = 20  # amount of drivers we can run on our machine.
-            highest = 2
-            lowest = len(self.data)
-            for i in range(2, self.size):
-                if (self.size % i) <= lowest:
-                    lowest = self.size % i
-                    if highest < i < max_drivers:
-                        highest = i
-            return highest
-
-    def split_data(self, num: int) -> list:
-        """Splits DataFrame into a list of DataFrames.
-
-        In order to pass seperate sections of data to multiple Crawlers, we use this to split the DataFrame object by
-        some number.
-
-        Args:
-            num (int): number to divide all of the data by.
-
-        Returns:
-            list of DataFrames, each of these DataFrames hold the values of the headers. This is used for indexing the
-            rows by their column name, they are NOT part of the actual DataFrame object.
-        """
-        return np.array_split(self.data, num)
+                raise reader.InputError("File must contain headers.")
+        return list(headers)
 
     def parse_search_range(self, start: int, end: int) -> (int, int):
         """Parse input search range to 0-based index for the handler to divide
@@ -112,24 +100,23 @@ class Handler:
             end (int): end row number
 
         Returns:
-            A tuple of 0-based start and end index
+            A tuple of 0-based start and end index, end is None for the last row. Reading stops at the last row of the
+            file, so an end past it needs no clamping.
         """
         if not start or not end:
-            return 0, self.size
-        elif end > self.size:
-            return start - 2, self.size
+            return 0, None
         else:
             return start - 2, end - 1
 
     def check_start_finish(self, start: int, finish: int) -> None:
         """Error checking start and finish"""
         if start < 0:
-            raise ValueError("Start option cannot be negative")
+            raise reader.InputError("Start option cannot be negative")
         elif finish < 0:
-            raise ValueError("Finish option cannot be negative")
+            raise reader.InputError("Finish option cannot be negative")
         elif start > finish:
-            raise ValueError("Start option cannot be greater than finish option")
+            raise reader.InputError("Start option cannot be greater than finish option")
         elif finish < start:
-            raise ValueError("Finish option cannot be smaller than start option")
+            raise reader.InputError("Finish option cannot be smaller than start option")
         else:
             pass
@@ -0,0 +1,192 @@
+"""Streaming readers of the alumni export, reading only a range of rows and the columns the crawler uses.
+
+pandas.read_excel parses a whole workbook before a single row can be sliced, so the time and memory of a run grew with
+the size of the export rather than with the size of its search range. Each reader here yields the rows of a range as
+DataFrame chunks instead:
+
+    .xlsx   openpyxl in read-only mode, rows are parsed from the sheet's XML as they are iterated and the reader stops
+            at the end of the range. Falls back to pandas.read_excel when openpyxl is not installed.
+    .csv    pandas.read_csv in chunks, rows before the range are skipped without being parsed into a DataFrame.
+    .xls    xlrd, the legacy format holds at most 65,536 rows and xlrd always parses the whole sheet.
+
+Chunks are indexed by the 0-based row position in the sheet, the same index pandas.read_excel gives them. ID_NUMBER is
+read as text whatever the format, a numeric cell (e.g. 1234 or 1234.0) as its digits, so that the output has the same
+ID type for every input format and IDs with leading zeros keep them.
+"""
+from itertools import islice
+
+import numpy as np
+from pandas import DataFrame, concat, read_csv, read_excel
+
+INPUT_COLUMNS = ['ID_NUMBER', 'FIRST_NAME', 'LAST_NAME', 'WORK_TITLE', 'WORK_COMPANY_NAME1'] + [
+    '{}{}'.format(column, i) for i in range(1, 4) for column in ('SCHOOL', 'DEGREE_CODE', 'DEGREE_YEAR', 'MAJOR')]
+CHUNK_ROWS = 10000
+
+
+class InputError(ValueError):
+    """The input file is not an excel or csv file, could not be read, or its contents can not be crawled."""
+
+
+def file_type(path: str) -> str:
+    """Returns "xlsx", "xls" or "csv".
+
+    Raises:
+        InputError: Any file type other than excel or csv.
+    """
+    for extension in ('xlsx', 'xls', 'csv'):
+        if path.endswith('.' + extension):
+            return extension
+    raise InputError("Invalid file type.")
+
+
+def read_headers(path: str) -> list:
+    """Returns the header row of the first sheet of path, without reading any other row."""
+    kind = file_type(path)
+    if kind == 'csv':
+        return list(read_csv(path, nrows=0).columns)
+    if kind == 'xls':
+        import xlrd
+        sheet = xlrd.open_workbook(path, on_demand=True).sheet_by_index(0)
+        return header_names(sheet.row_values(0)) if sheet.nrows else []
+    try:
+        import openpyxl
+    except ImportError:
+        return list(read_excel(path).columns)
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        for row in workbook.worksheets[0].iter_rows(min_row=1, max_row=1):
+            return header_names([cell.value for cell in row])
+        return []
+    finally:
+        workbook.close()
+
+
+def iter_chunks(path: str, start: int = 0, end: int = None, columns: list = INPUT_COLUMNS,
+                chunk_rows: int = CHUNK_ROWS):
+    """Yields the rows start to end (0-based, end excluded, None for the last row) of path as DataFrame chunks.
+
+    Args:
+        path (str): path of the .xlsx, .xls or .csv export, the first sheet of a workbook is read.
+        columns (list of str): columns to read, columns missing from the file are left out, None reads them all.
+        chunk_rows (int): maximum number of rows per chunk.
+    """
+    kind = file_type(path)
+    if kind == 'csv':
+        chunks = iter_csv(path, start, end, columns, chunk_rows)
+    elif kind == 'xls':
+        chunks = iter_xls(path, start, end, columns, chunk_rows)
+    else:
+        chunks = iter_xlsx(path, start, end, columns, chunk_rows)
+    return (ids_as_text(chunk) for chunk in chunks)
+
+
+def read_range(path: str, start: int = 0, end: int = None, columns: list = INPUT_COLUMNS) -> DataFrame:
+    """Reads the rows start to end (0-based, end excluded, None for the last row) of path into a single DataFrame."""
+    chunks = list(iter_chunks(path, start, end, columns))
+    if not chunks:
+        return DataFrame(columns=selected(read_headers(path), columns))
+    return concat(chunks) if len(chunks) > 1 else chunks[0]
+
+
+def header_names(values: list) -> list:
+    """Header row values, empty header cells are named as pandas.read_excel names them."""
+    return ['Unnamed: {}'.format(i) if value is None or value == '' else value for i, value in enumerate(values)]
+
+
+def selected(headers: list, columns: list) -> list:
+    """Headers to read, in file order."""
+    return [header for header in headers if columns is None or header in columns]
+
+
+def cell_value(value):
+    """Empty cells become NaN, as in pandas.read_excel."""
+    return np.nan if value is None or value == '' else value
+
+
+def id_text(value):
+    """ID cell as text, numeric cells as their digits, empty cells stay NaN."""
+    if isinstance(value, str) or value is None or value != value:
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def ids_as_text(chunk: DataFrame) -> DataFrame:
+    if 'ID_NUMBER' in chunk.columns:
+        chunk['ID_NUMBER'] = [id_text(value) for value in chunk['ID_NUMBER']]
+    return chunk
+
+
+def build_chunk(headers: list, indexes: list, rows: list, first: int) -> DataFrame:
+    data = {headers[i]: [cell_value(row[i]) if i < len(row) else np.nan for row in rows] for i in indexes}
+    return DataFrame(data, columns=[headers[i] for i in indexes], index=range(first, first + len(rows)))
+
+
+def iter_rows(headers: list, rows, start: int, columns: list, chunk_rows: int):
+    """Groups the value lists of rows, starting at sheet row start, into DataFrame chunks."""
+    wanted = selected(headers, columns)
+    indexes = [i for i, header in enumerate(headers) if header in wanted]
+    chunk = []
+    first = start
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_rows:
+            yield build_chunk(headers, indexes, chunk, first)
+            first += len(chunk)
+            chunk = []
+    if chunk:
+        yield build_chunk(headers, indexes, chunk, first)
+
+
+def iter_xlsx(path: str, start: int, end: int, columns: list, chunk_rows: int):
+    try:
+        import openpyxl
+    except ImportError:
+        data = read_excel(path)
+        data = data.iloc[start:end]
+        yield data[selected(list(data.columns), columns)]
+        return
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet_rows = workbook.worksheets[0].iter_rows(min_row=1, max_row=None if end is None else end + 1)
+        headers = header_names([cell.value for cell in next(sheet_rows, [])])
+        values = ([cell.value for cell in row] for row in islice(sheet_rows, start, None))
+        for chunk in iter_rows(headers, values, start, columns, chunk_rows):
+            yield chunk
+    finally:
+        workbook.close()
+
+
+def iter_xls(path: str, start: int, end: int, columns: list, chunk_rows: int):
+    import xlrd
+    book = xlrd.open_workbook(path, on_demand=True)
+    try:
+        sheet = book.sheet_by_index(0)
+        headers = header_names(sheet.row_values(0)) if sheet.nrows else []
+        last = sheet.nrows - 1 if end is None else min(end, sheet.nrows - 1)
+
+        def values(index: int) -> list:
+            row = []
+            for cell in sheet.row(index + 1):
+                if cell.ctype == xlrd.XL_CELL_NUMBER and float(cell.value).is_integer():
+                    row.append(int(cell.value))  # as pandas.read_excel's convert_float
+                else:
+                    row.append(cell.value)
+            return row
+
+        for chunk in iter_rows(headers, (values(i) for i in range(start, last)), start, columns, chunk_rows):
+            yield chunk
+    finally:
+        book.release_resources()
+
+
+def iter_csv(path: str, start: int, end: int, columns: list, chunk_rows: int):
+    usecols = None if columns is None else (lambda header: header in columns)
+    reader = read_csv(path, usecols=usecols, dtype={'ID_NUMBER': str}, skiprows=range(1, start + 1),
+                      nrows=None if end is None else max(0, end - start), chunksize=chunk_rows)
+    first = start
+    for chunk in reader:
+        chunk.index = range(first, first + len(chunk))
+        first += len(chunk)
+        yield chunk
@@ -0,0 +1,88 @@
+import json
+
+from pandas import DataFrame, ExcelWriter
+
+OUTPUT_FORMATS = ['xlsx', 'csv']
+OUTPUT_COLUMNS = ['ROW_NUMBER', 'ID_NUMBER', 'KEYWORD', 'FULL_NAME_ON_LINKEDIN', 'JOB_TITLE', 'COMPANY_NAME',
+                  'COMPANY_LOCATION', 'PROFILE_LINK', 'ACCURACY_SCORE']
+
+
+class ResultSink:
+    """Append-only collector of crawl results, materialized into a DataFrame only once at the end.
+
+    Enlarging a DataFrame one row at a time copies it on every new row, instead results are kept as a list of
+    lightweight dict records. The crawler fills the current row with set and commits it with end_row.
+
+    Args:
+        columns (list of str): output columns, in order.
+        stream_path (str): optional JSON Lines file every committed row is also written to as soon as it is complete.
+
+    Attributes:
+        records (list of dict): committed rows, missing columns are empty.
+    """
+
+    def __init__(self, columns: list = OUTPUT_COLUMNS, stream_path: str = None):
+        self.columns = columns
+        self.records = []
+        self.current = {}
+        self.stream = open(stream_path, 'w') if stream_path else None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def set(self, column: str, value) -> None:
+        """Sets a column of the row currently being written."""
+        self.current[column] = value
+
+    def end_row(self) -> None:
+        """Commits the row currently being written and starts a new one."""
+        self.append(self.current)
+        self.current = {}
+
+    def append(self, record: dict) -> None:
+        """Commits a complete row."""
+        self.records.append(record)
+        if self.stream is not None:
+            self.stream.write(json.dumps(record, default=str) + '\n')
+
+    def to_frame(self) -> DataFrame:
+        """Materializes every committed row into a DataFrame, empty cells are empty strings."""
+        return DataFrame.from_records(self.records, columns=self.columns).fillna('')
+
+    def close(self) -> None:
+        if self.stream is not None:
+            self.stream.close()
+
+
+def save_excel(output_frame: DataFrame, path: str, columns: list = OUTPUT_COLUMNS) -> None:
+    """Formats the DataFrame and saves it as an Excel file
+
+    Args:
+        output_frame (pandas DataFrame): the crawler's results, (ResultSink.to_frame)
+        path (str): path of the .xlsx file.
+        columns (list of str): output columns, every one is made 25 characters wide.
+    """
+    writer = ExcelWriter(path, engine='xlsxwriter')
+    output_frame.to_excel(writer, index=False, sheet_name='Sheet1')
+    workbook = writer.book
+    workbook.set_size(2800, 1200)
+    worksheet = writer.sheets['Sheet1']
+    worksheet.set_zoom(100)
+    size = len(columns)
+    worksheet.set_column('A:'+chr(ord('A')+size-1), 25)
+    writer.close()
+
+
+def save_output(output_frame: DataFrame, path: str, output_format: str = 'xlsx',
+                columns: list = OUTPUT_COLUMNS) -> None:
+    """Saves the DataFrame in one of OUTPUT_FORMATS.
+
+    Raises:
+        ValueError: Any output format other than OUTPUT_FORMATS.
+    """
+    if output_format == 'xlsx':
+        save_excel(output_frame, path, columns)
+    elif output_format == 'csv':
+        output_frame.to_csv(path, index=False, columns=columns)
+    else:
+        raise ValueError("Invalid output format.")
@@ -0,0 +1,180 @@
+import numpy as np
+from pandas import DataFrame, Series, concat, factorize, to_numeric
+
+from src.alumnifinder.finder.matcher import DEGREES, MAJORS, SCHOOLS, Matcher, get_matcher
+from src.alumnifinder.finder.scoring import NON_WORD, NORMALIZED, TEXT_COLUMNS, YEAR_COLUMNS, Score, convert_str
+
+
+def normalize(column: Series) -> Series:
+    """Vectorized convert_str, non-string cells (NaN, numbers) become an empty string.
+
+    Exports repeat the same schools, degrees, majors and companies over and over, so only the distinct values are
+    normalized and then broadcast back with take.
+    """
+    codes, uniques = factorize(column)
+    normalized = [NON_WORD.sub('', value).lower() if type(value) is str else '' for value in uniques]
+    normalized.append('')  # missing values are factorized to -1, i.e. the last item
+    return Series(np.array(normalized, dtype=object).take(codes), index=column.index)
+
+
+def classify(column: Series, matcher: Matcher) -> np.ndarray:
+    """Vectorized Matcher.mask, only the distinct values are scanned."""
+    codes, uniques = factorize(column)
+    masks = [matcher.mask(value) for value in uniques]
+    masks.append(0)  # missing values
+    return np.array(masks, dtype=np.int64).take(codes)
+
+
+def years(column: Series) -> Series:
+    """Vectorized scoring.sheet_year, cells that are not a number become 0."""
+    return to_numeric(column, errors='coerce').fillna(0).astype(int)
+
+
+def prepare_rows(rows: DataFrame) -> DataFrame:
+    """Returns a copy of the alumni rows with the normalized text and integer years scoring reads.
+
+    Every TEXT_COLUMNS column gets a normalized "<column>_NORMALIZED" copy and every YEAR_COLUMNS column an integer
+    one, 0 for an empty year. Computed once per input file instead of once per (row, candidate profile) pair, scoring
+    uses them whenever a row has them.
+    """
+    rows = rows.copy()
+    for column in TEXT_COLUMNS:
+        if column in rows:
+            rows[column + NORMALIZED] = normalize(rows[column])
+    for column in YEAR_COLUMNS:
+        if column in rows:
+            rows[column + NORMALIZED] = years(rows[column])
+    return rows
+
+
+def normalized(rows: DataFrame, column: str) -> Series:
+    """Normalized text or integer years of a column, precomputed by prepare_rows when rows have them."""
+    if column + NORMALIZED in rows:
+        return rows[column + NORMALIZED]
+    return years(rows[column]) if column in YEAR_COLUMNS else normalize(rows[column])
+
+
+def contains(haystack, needle) -> np.ndarray:
+    """Element-wise 'needle in haystack' of two string arrays, either one can be a single string."""
+    return np.char.find(np.asarray(haystack, dtype=str), np.asarray(needle, dtype=str)) >= 0
+
+
+def profile_frames(profiles: dict) -> (DataFrame, DataFrame):
+    """Flattens Profile records into a job table and an education table.
+
+    Args:
+        profiles (dict): Profile records keyed by profile id, (e.g. profile link).
+
+    Returns:
+        A tuple of DataFrames, both with a 'profile' column holding the profile id:
+        - jobs: 'latest', 'title', 'company', 'description', normalized.
+        - educations: 'school', 'details', 'grad_year', with 'school' and 'details' normalized and integer years,
+          and the patterns.json classes of the raw texts: 'is_school', 'degree_mask' and 'major_mask'.
+    """
+    jobs = {'profile': [], 'latest': [], 'title': [], 'company': [], 'description': []}
+    educations = {'profile': [], 'school': [], 'details': [], 'text': [], 'grad_year': []}
+    for key, profile in profiles.items():
+        for position, job in enumerate(profile.jobs):
+            jobs['profile'].append(key)
+            jobs['latest'].append(position == 0)
+            jobs['title'].append(job.title)
+            jobs['company'].append(job.company)
+            jobs['description'].append(job.description)
+        for education in profile.educations:
+            educations['profile'].append(key)
+            educations['school'].append(education.school)
+            educations['details'].append(education.details)
+            educations['text'].append(', '.join(education.items))
+            educations['grad_year'].append(education.grad_year)
+    jobs = DataFrame(jobs, columns=['profile', 'latest', 'title', 'company', 'description'])
+    educations = DataFrame(educations, columns=['profile', 'school', 'details', 'text', 'grad_year'])
+    for column in ('title', 'company', 'description'):
+        jobs[column] = normalize(jobs[column])
+    educations['is_school'] = classify(educations['school'], get_matcher(SCHOOLS)) != 0
+    educations['degree_mask'] = classify(educations['text'], get_matcher(DEGREES))
+    educations['major_mask'] = classify(educations.pop('text'), get_matcher(MAJORS))
+    for column in ('school', 'details'):
+        educations[column] = normalize(educations[column])
+    educations['grad_year'] = years(educations['grad_year'])
+    return jobs, educations
+
+
+def degree_slots(rows: DataFrame) -> DataFrame:
+    """Melts the 3 school/major/degree/year column groups of the input rows into one row per filled school slot."""
+    slots = []
+    for i in range(1, 4):
+        school = rows['SCHOOL{}'.format(i)]
+        slot = DataFrame({'row': rows.index,
+                          'degree': normalized(rows, 'DEGREE_CODE{}'.format(i)).values,
+                          'major': normalized(rows, 'MAJOR{}'.format(i)).values,
+                          'year': normalized(rows, 'DEGREE_YEAR{}'.format(i)).values,
+                          'sheet_degree_mask': classify(rows['DEGREE_CODE{}'.format(i)], get_matcher(DEGREES)),
+                          'sheet_major_mask': classify(rows['MAJOR{}'.format(i)], get_matcher(MAJORS))})
+        # check current school value is a non-empty string, not other type
+        slots.append(slot[((school.map(type) == str) & (school != '')).values])
+    return concat(slots, ignore_index=True)
+
+
+def count(pair_ids: Series, matches: np.ndarray, size: int) -> np.ndarray:
+    """Number of matches per pair id."""
+    return np.bincount(pair_ids.values.astype(int), weights=matches, minlength=size).astype(int)
+
+
+def score_pairs(rows: DataFrame, profiles: dict, pairs: DataFrame, job_position: str = "",
+                geolocation: str = "") -> DataFrame:
+    """Scores every (input row, candidate profile) pair in one vectorized pass.
+
+    Produces the same scores as scoring.score_profile called pair by pair.
+
+    Args:
+        rows (pandas DataFrame): alumni rows, (Handler.divided_data).
+        profiles (dict): Profile records keyed by profile id, (e.g. profile link).
+        pairs (pandas DataFrame): one (input row, candidate profile) pair per row; 'row' holds an index label of rows
+            and 'profile' a key of profiles.
+        job_position (str): searched job position, empty to skip.
+        geolocation (str): searched region, empty to skip.
+
+    Returns:
+        pandas DataFrame indexed like pairs, with a column per Score field and a 'total' column.
+    """
+    size = len(pairs)
+    pair_frame = DataFrame({'pair': np.arange(size), 'row': pairs['row'].values, 'profile': pairs['profile'].values})
+    jobs, educations = profile_frames(profiles)
+    scores = DataFrame(0, index=pairs.index, columns=list(Score._fields))
+
+    # jobs, every job of the profile is matched with the row's current job
+    job_pairs = pair_frame.merge(jobs, on='profile')
+    excel_titles = normalized(rows, 'WORK_TITLE').loc[job_pairs['row']].values
+    excel_companies = normalized(rows, 'WORK_COMPANY_NAME1').loc[job_pairs['row']].values
+    has_title = excel_titles != ''  # an empty job on record is simply replaced, nothing to match against
+    titles = job_pairs['title'].values
+    companies = job_pairs['company'].values
+    title_match = has_title & (contains(excel_titles, titles) | contains(titles, excel_titles))
+    company_match = has_title & (contains(excel_companies, companies) | contains(companies, excel_companies))
+    scores['job_title'] = count(job_pairs['pair'], title_match, size)
+    scores['company'] = count(job_pairs['pair'], company_match, size)
+
+    # search keywords, matched with the latest job only
+    latest = job_pairs[job_pairs['latest'].values]
+    if job_position:
+        scores['position'] = count(latest['pair'], contains(convert_str(job_position), latest['title'].values), size)
+    if geolocation:
+        scores['location'] = count(latest['pair'], contains(latest['description'].values, convert_str(geolocation)),
+                                   size)
+
+    # educations, every filled school slot of the row is matched with every education of the profile
+    slot_pairs = pair_frame.merge(degree_slots(rows), on='row').merge(educations, on='profile')
+    web = slot_pairs['details'].values
+    web_degrees = slot_pairs['degree_mask'].values
+    degree_match = np.where(web_degrees != 0, (web_degrees & slot_pairs['sheet_degree_mask'].values) != 0,
+                            contains(web, slot_pairs['degree'].values))
+    major_match = (((slot_pairs['major_mask'].values & slot_pairs['sheet_major_mask'].values) != 0) |
+                   contains(web, slot_pairs['major'].values))
+    year_match = (slot_pairs['year'].values != 0) & (slot_pairs['grad_year'].values == slot_pairs['year'].values)
+    scores['school'] = count(slot_pairs['pair'], slot_pairs['is_school'].values, size)
+    scores['degree'] = count(slot_pairs['pair'], degree_match, size)
+    scores['major'] = count(slot_pairs['pair'], major_match, size)
+    scores['grad_year'] = count(slot_pairs['pair'], year_match, size)
+
+    scores['total'] = scores[list(Score._fields)].sum(axis=1)
+    return scores
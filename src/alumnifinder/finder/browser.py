@@ -0,0 +1,109 @@
+import shutil
+import tempfile
+from typing import NamedTuple
+
+BLOCK = 2  # Chrome content setting value of a blocked content type
+
+
+class DriverProfile(NamedTuple('DriverProfile', [('name', str), ('headless', bool), ('block_images', bool),
+                                                 ('block_stylesheets', bool), ('window_size', tuple),
+                                                 ('page_load_strategy', str), ('temp_profile', bool),
+                                                 ('memory', int)])):
+    """Chrome launch options of a crawl worker.
+
+    The crawler only reads the DOM, so nothing is lost by not painting a window, not downloading images and not
+    applying stylesheets. A small fixed window keeps the page layout stable and cheap, an eager page load returns as
+    soon as the DOM is ready (the crawler waits for the elements it needs anyway), and a throwaway user data directory
+    per worker keeps workers from sharing, and growing, a single Chrome profile.
+
+    Attributes:
+        name (str): name of the profile in PROFILES.
+        headless (bool): runs Chrome without a window.
+        block_images (bool): images are not downloaded.
+        block_stylesheets (bool): stylesheets are not downloaded.
+        window_size (tuple of int): width and height of the window, None for Chrome's default.
+        page_load_strategy (str): "normal" waits for every resource, "eager" only for the DOM.
+        temp_profile (bool): starts Chrome with a new temporary user data directory.
+        memory (int): approximate resident bytes of one Chrome + chromedriver pair, used to size the worker pool.
+    """
+    __slots__ = ()
+
+    def options(self, profile_dir: str = None) -> 'webdriver.ChromeOptions':
+        # selenium is imported on first use, the command line lists PROFILES without it
+        from selenium import webdriver
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument('--headless')
+            options.add_argument('--disable-gpu')
+        if self.window_size:
+            options.add_argument('--window-size={},{}'.format(*self.window_size))
+        prefs = {}
+        if self.block_images:
+            prefs['profile.managed_default_content_settings.images'] = BLOCK
+            options.add_argument('--blink-settings=imagesEnabled=false')
+        if self.block_stylesheets:
+            prefs['profile.managed_default_content_settings.stylesheets'] = BLOCK
+        if prefs:
+            options.add_experimental_option('prefs', prefs)
+        if profile_dir:
+            options.add_argument('--user-data-dir={}'.format(profile_dir))
+        options.add_argument('--disable-extensions')
+        return options
+
+    def capabilities(self) -> dict:
+        from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
+        capabilities = DesiredCapabilities.CHROME.copy()
+        capabilities['pageLoadStrategy'] = self.page_load_strategy
+        return capabilities
+
+    def launch(self, chrome_path: str):
+        """Starts a Chrome WebDriver with this profile.
+
+        Returns:
+            tuple of the driver and its temporary user data directory (None without temp_profile), the directory is
+            removed by quit_driver.
+        """
+        from selenium import webdriver
+        profile_dir = tempfile.mkdtemp(prefix='alumnifinder-chrome-') if self.temp_profile else None
+        try:
+            driver = webdriver.Chrome(chrome_path, chrome_options=self.options(profile_dir),
+                                      desired_capabilities=self.capabilities())
+        except Exception:
+            remove_profile_dir(profile_dir)
+            raise
+        return driver, profile_dir
+
+
+def remove_profile_dir(profile_dir: str) -> None:
+    if profile_dir:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def quit_driver(driver, profile_dir: str = None) -> None:
+    """Quits Chrome and chromedriver, and removes the temporary user data directory of the driver."""
+    try:
+        driver.quit()
+    finally:
+        remove_profile_dir(profile_dir)
+
+
+DEFAULT = DriverProfile(name='default', headless=False, block_images=False, block_stylesheets=False, window_size=None,
+                        page_load_strategy='normal', temp_profile=False, memory=512 * 2 ** 20)
+VISIBLE = DriverProfile(name='visible', headless=False, block_images=True, block_stylesheets=True,
+                        window_size=(1024, 768), page_load_strategy='eager', temp_profile=True, memory=320 * 2 ** 20)
+LIGHTWEIGHT = DriverProfile(name='lightweight', headless=True, block_images=True, block_stylesheets=True,
+                            window_size=(1024, 768), page_load_strategy='eager', temp_profile=True,
+                            memory=224 * 2 ** 20)
+
+PROFILES = {profile.name: profile for profile in (DEFAULT, VISIBLE, LIGHTWEIGHT)}
+
+
+def get_profile(profile) -> DriverProfile:
+    """Returns profile itself, or the profile of PROFILES it names.
+
+    Raises:
+        KeyError: unknown profile name.
+    """
+    if isinstance(profile, DriverProfile):
+        return profile
+    return PROFILES[profile]
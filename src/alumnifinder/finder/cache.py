@@ -0,0 +1,182 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from time import time
+from urllib.parse import urlsplit, urlunsplit
+
+from src.alumnifinder import config
+from src.alumnifinder.finder.profile import Candidate, Profile, dump_profile, load_profile
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_url(link: str) -> str:
+    """Normalizes a profile link so that every variant of it maps to the same cache key.
+
+    Query strings and fragments (tracking parameters) are dropped, the host is lower-cased, the scheme is forced to
+    https and trailing slashes are removed, e.g. "http://WWW.linkedin.com/in/jane/?trk=x" becomes
+    "https://www.linkedin.com/in/jane".
+    """
+    parts = urlsplit(link.strip())
+    return urlunsplit(('https', parts.netloc.lower(), parts.path.rstrip('/'), '', ''))
+
+
+class SqliteCache:
+    """Persistent key/value cache on a local SQLite file, with TTL expiry and size-bounded LRU eviction.
+
+    Subclasses define what is stored by overriding encode, decode and key.
+
+    Args:
+        path (str): path of the SQLite file, ":memory:" for a cache that only lives as long as the instance.
+        ttl (int): seconds an entry stays valid after it was stored, 0 to never expire.
+        max_entries (int): maximum number of entries, least recently used entries are evicted past it, 0 for no bound.
+
+    Attributes:
+        hits (int): number of get calls that found a valid entry.
+        misses (int): number of get calls that found nothing or an expired entry.
+        entries (int): number of entries, counted on open and kept up to date by this instance.
+    """
+    table = 'entries'
+
+    def __init__(self, path: str, ttl: int = 0, max_entries: int = 0):
+        if path != ':memory:' and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()  # one connection is shared by every thread
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS {} (key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                                'stored REAL NOT NULL, accessed REAL NOT NULL)'.format(self.table))
+        self.connection.execute('CREATE INDEX IF NOT EXISTS {0}_accessed ON {0} (accessed)'.format(self.table))
+        self.connection.commit()
+        self.entries = self.connection.execute('SELECT COUNT(*) FROM {}'.format(self.table)).fetchone()[0]
+
+    def key(self, key) -> str:
+        return key
+
+    def encode(self, value) -> str:
+        return value
+
+    def decode(self, text: str):
+        return text
+
+    def get(self, key):
+        """Returns the cached value of key, or None if there is no valid entry."""
+        key = self.key(key)
+        now = time()
+        with self.lock:
+            entry = self.connection.execute('SELECT value, stored FROM {} WHERE key = ?'.format(self.table),
+                                            (key,)).fetchone()
+            if entry is None:
+                self.misses += 1
+                return None
+            if self.ttl and now - entry[1] > self.ttl:
+                self.connection.execute('DELETE FROM {} WHERE key = ?'.format(self.table), (key,))
+                self.connection.commit()
+                self.entries -= 1
+                self.misses += 1
+                return None
+            self.connection.execute('UPDATE {} SET accessed = ? WHERE key = ?'.format(self.table), (now, key))
+            self.connection.commit()
+            self.hits += 1
+        return self.decode(entry[0])
+
+    def put(self, key, value) -> None:
+        """Stores value under key, evicting the least recently used entries if the cache is full.
+
+        Only a new key can take the cache over max_entries, eviction does not run otherwise.
+        """
+        key = self.key(key)
+        value = self.encode(value)
+        now = time()
+        with self.lock:
+            inserted = self.connection.execute('INSERT OR IGNORE INTO {} (key, value, stored, accessed) '
+                                               'VALUES (?, ?, ?, ?)'.format(self.table),
+                                               (key, value, now, now)).rowcount
+            if inserted:
+                self.entries += 1
+            else:
+                self.connection.execute('UPDATE {} SET value = ?, stored = ?, accessed = ? WHERE key = ?'
+                                        .format(self.table), (value, now, now, key))
+            if self.max_entries and self.entries > self.max_entries:
+                self.entries -= self.connection.execute(
+                    'DELETE FROM {0} WHERE key IN (SELECT key FROM {0} ORDER BY accessed DESC LIMIT -1 OFFSET ?)'
+                    .format(self.table), (self.max_entries,)).rowcount
+            self.connection.commit()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute('SELECT COUNT(*) FROM {}'.format(self.table)).fetchone()[0]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.connection.execute('DELETE FROM {}'.format(self.table))
+            self.connection.commit()
+            self.entries = 0
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters and the hit rate of this instance."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / lookups if lookups else 0.0}
+
+    def close(self) -> None:
+        logger.debug('{}: {}'.format(type(self).__name__, self.stats()))
+        with self.lock:
+            self.connection.close()
+
+
+class ProfileCache(SqliteCache):
+    """Extracted Profile records keyed by normalized profile link.
+
+    Re-runs over overlapping spreadsheet ranges find most candidate profiles here and skip their page loads.
+
+    Args:
+        path (str): path of the SQLite file.
+        ttl (int): seconds a profile stays valid after it was fetched.
+        max_entries (int): maximum number of profiles kept.
+    """
+    table = 'profiles'
+
+    def __init__(self, path: str = config.profile_cache_path, ttl: int = config.profile_cache_ttl,
+                 max_entries: int = config.profile_cache_size):
+        super().__init__(path, ttl, max_entries)
+
+    def key(self, link: str) -> str:
+        return normalize_url(link)
+
+    def encode(self, profile: Profile) -> str:
+        return dump_profile(profile)
+
+    def decode(self, text: str) -> Profile:
+        return load_profile(text)
+
+
+class SearchCache(SqliteCache):
+    """Coarse-filtered search results keyed by normalized (first name, last name, region) query.
+
+    Common names appear many times in an export, only the first occurrence is searched on the web. By default the cache
+    lives in memory for a single run, pass a path (e.g. config.search_cache_path) to keep it across runs.
+
+    Args:
+        path (str): path of the SQLite file, ":memory:" to not persist anything.
+        ttl (int): seconds a search result stays valid.
+        max_entries (int): maximum number of queries kept, 0 for no bound.
+    """
+    table = 'searches'
+
+    def __init__(self, path: str = ':memory:', ttl: int = config.search_cache_ttl, max_entries: int = 0):
+        super().__init__(path, ttl, max_entries)
+
+    def key(self, query: tuple) -> str:
+        return '|'.join(' '.join(str(term).lower().split()) for term in query)
+
+    def encode(self, candidates: list) -> str:
+        return json.dumps([list(candidate) for candidate in candidates])
+
+    def decode(self, text: str) -> list:
+        return [Candidate(*candidate) for candidate in json.loads(text)]
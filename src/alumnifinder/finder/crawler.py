@@ -1,30 +1,28 @@
 import logging
 import random
-import re
 from sys import platform
 from time import sleep
+from urllib.parse import urljoin
 
 from pandas import Series, DataFrame
-from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions
-from selenium.webdriver.support.ui import WebDriverWait
 
-from src.alumnifinder.finder import drivers
+from src.alumnifinder import config
+from src.alumnifinder.excel.writer import ResultSink
+from src.alumnifinder.finder import browser, drivers, scoring
+from src.alumnifinder.finder.fetcher import BACKGROUND, TabFetcher
+from src.alumnifinder.finder.metrics import RunMetrics, WAIT
+from src.alumnifinder.finder.planner import group_rows
+from src.alumnifinder.finder.profile import Profile, parse_profile, parse_search_results
+from src.alumnifinder.finder.pruning import PRUNED, Pruner, SKIPPED
+from src.alumnifinder.finder.waits import AdaptiveWait
 from src.alumnifinder.utils import jsonreader as json
 
-# logger
+# logger, handlers are set up by the entry points, see utils.logs.configure_logging
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s:%(levelname)s:%(message)s')
-console_handler.setFormatter(formatter)
-
-logger.addHandler(console_handler)
 
 
 class Crawler:
@@ -32,31 +30,70 @@ class Crawler:
 
     Args:
         input_data (panda's DataFrame): DataFrame object from Handler.
-        output_data(panda's DataFrame): output DataFrame object
+        output_data(ResultSink): collects the output rows
         kwargs (dict): dictionary of arguments that are passed in from the gui.
         - geolocation (str): target region
         - job_position (str): current alumni job position.
+        - profile_cache (ProfileCache): cache of extracted profiles, profiles found in it are not fetched again.
+        - search_cache (SearchCache): cache of search results, names found in it are not searched again.
+        - journal (Journal): checkpoint of completed rows, rows completed in it are skipped and their output restored.
+        - rate_limiter (RateLimiter): page load cap, shared by every Crawler of a run.
+        - base_url (str): site to crawl, a local stand-in site for tests and benchmarks.
+        - pause (tuple of int): minimum and maximum seconds of random_pause.
+        - metrics (RunMetrics): timing spans of the run, shared by every Crawler of a run.
+        - sessions (SessionManager): warm logged in browsers, borrowed for the run instead of starting a new one.
+        - waits (AdaptiveWait): element waits with learned timeouts, shared by every Crawler of a run.
+        - tabs (int): candidate profiles loaded at once in browser tabs, 1 loads them one after the other.
+        - driver_profile (DriverProfile or str): Chrome launch options, or the name of one of browser.PROFILES.
+        - cancel (threading.Event): stops crawl_linkedin before the next row once set, the rows done are kept.
+        - prune_top_k (int): best ranked candidates always opened, 0 opens every candidate, see pruning.Pruner.
+        - prune_threshold (int): candidates with a card score of at least this are opened too.
+        - confident_score (int): accuracy score that stops opening the other candidates of a name, 0 never stops.
+        - audit (AuditLog): log of the pruning decisions, shared by every Crawler of a run.
 
     Attributes:
         driver (Selenium WebDriver): used for web scraping.
         start_region (str): initial region for the start of the web search.
         row_first_name (str): first name of an alumni found in a particulate row
         row_last_name (str): last name of an alumni found in a particulate row
-        row_index(int): row index that indicates which row is currently being modified
+        groups (dict): 0-based positions of the rows of every row's name, keyed by position, see planner.group_rows.
+        shared (dict): (candidates, profiles) of a name while rows of it remain, keyed by the position of its first row.
+        pruner (Pruner): decides which candidates are opened.
     """
 
-    def __init__(self, input_data: DataFrame, output_data: DataFrame, **kwargs: dict):
+    def __init__(self, input_data: DataFrame, output_data: ResultSink, **kwargs: dict):
         """Initializes Crawler class with optional arguments."""
         self.input_data = input_data
         self.output_data = output_data
         self.geolocation = kwargs['geolocation'] if 'geolocation' in kwargs else ""
         self.job_position = kwargs['job_position'] if 'job_position' in kwargs else ""
-        self.row_index = 0
         self.row_counter = int(kwargs["start_row"]) if "start_row" in kwargs else 2
         self.driver = None
         self.start_region = 'Buffalo'
         self.row_first_name = ""
         self.row_last_name = ""
+        self.profile_cache = kwargs['profile_cache'] if 'profile_cache' in kwargs else None
+        self.search_cache = kwargs['search_cache'] if 'search_cache' in kwargs else None
+        self.journal = kwargs['journal'] if 'journal' in kwargs else None
+        self.rate_limiter = kwargs['rate_limiter'] if 'rate_limiter' in kwargs else None
+        self.base_url = kwargs['base_url'] if 'base_url' in kwargs else 'https://www.linkedin.com'
+        self.pause = kwargs['pause'] if 'pause' in kwargs else (2, 4)
+        self.metrics = kwargs['metrics'] if 'metrics' in kwargs else RunMetrics()
+        self.waits = kwargs['waits'] if 'waits' in kwargs else AdaptiveWait(self.metrics)
+        self.tabs = int(kwargs['tabs']) if 'tabs' in kwargs else config.profile_tabs
+        self.sessions = kwargs['sessions'] if 'sessions' in kwargs else None
+        self.session = None
+        self.driver_profile = browser.get_profile(
+            kwargs['driver_profile'] if 'driver_profile' in kwargs else config.driver_profile)
+        self.profile_dir = None
+        self.groups = None
+        self.shared = {}
+        self.cancel = kwargs['cancel'] if 'cancel' in kwargs else None
+        self.pruner = Pruner(kwargs['prune_top_k'] if 'prune_top_k' in kwargs else config.prune_top_k,
+                             kwargs['prune_threshold'] if 'prune_threshold' in kwargs else config.prune_threshold,
+                             kwargs['confident_score'] if 'confident_score' in kwargs else config.confident_score,
+                             self.job_position, self.geolocation)
+        self.audit = kwargs['audit'] if 'audit' in kwargs else None
 
     def setup_driver(self) -> None:
         """Locates path of WebDriver Chrome executable and sets it to the driver.
@@ -81,8 +118,20 @@ class Crawler:
             msg = '{}: Unsupported operating system found.'.format(log_phase)
             logger.exception(msg)
             raise OSError(msg)
-        self.driver = webdriver.Chrome(chrome_path)  # sets member variable.
-        logger.debug('{}: SUCCESS.'.format(log_phase))
+        self.driver, self.profile_dir = self.driver_profile.launch(chrome_path)  # sets member variables.
+        logger.debug('{}: SUCCESS ({} profile).'.format(log_phase, self.driver_profile.name))
+
+    def load(self, url: str) -> None:
+        """Loads a page, waiting first for the rate limiter if there is one."""
+        if self.rate_limiter is not None:
+            with self.metrics.span('Rate-Limit', WAIT):
+                self.rate_limiter.acquire()
+        with self.metrics.span('Page-Load', WAIT):
+            self.driver.get(url)
+
+    def wait_until(self, name: str, condition):
+        """Waits for the current page to load, then for condition, see AdaptiveWait."""
+        return self.waits.until(self.driver, name, condition)
 
     def random_pause(self) -> None:
         """Randomly pauses WebDriver.
@@ -90,9 +139,10 @@ class Crawler:
         The purpose is to lower the chances of web scraping detection.
         """
         log_phase = 'Pause'
-        to_pause = random.randint(2, 4)
+        to_pause = random.randint(*self.pause)
         logger.debug('{}: Paused for '.format(log_phase) + str(to_pause) + 's')
-        sleep(to_pause)
+        with self.metrics.span(log_phase, WAIT):
+            sleep(to_pause)
 
     def login(self) -> None:
         """WebDriver finds web elements for login and performs login actions.
@@ -112,8 +162,8 @@ class Crawler:
         for account in json.get_credentials():
             logger.debug('{}: Finding web element(s)...'.format(log_phase))
             try:
-                login_email = WebDriverWait(self.driver, 10).until(
-                    expected_conditions.presence_of_element_located((By.CLASS_NAME, 'login-email'))
+                login_email = self.wait_until(
+                    'Login-Form', expected_conditions.presence_of_element_located((By.CLASS_NAME, 'login-email'))
                 )
                 login_password = self.driver.find_element_by_class_name('login-password')
                 sign_in_btn = self.driver.find_element_by_id('login-submit')
@@ -133,7 +183,7 @@ class Crawler:
                 return
             else:
                 logger.warning('{}: FAILED.'.format(log_phase))
-                self.driver.get('https://www.linkedin.com')  # try-again with a different account
+                self.load(self.base_url)  # try-again with a different account
                 self.driver.delete_all_cookies()
 
         msg = '{}: Could not login with any credentials.'.format(log_phase)  # All credentials failed
@@ -150,10 +200,11 @@ class Crawler:
         logger.debug('{}: Finding search bar web element(s)...'.format(log_phase))
 
         # reload the LinkedIn home page to start search, this is meant to avoid reuse of previous search result
-        self.driver.get("https://www.linkedin.com")
+        self.load(self.base_url)
         self.random_pause()
         try:
-            search_bar = WebDriverWait(self.driver, 10).until(
+            search_bar = self.wait_until(
+                'Search-Bar',
                 expected_conditions.presence_of_element_located((By.XPATH, '//*[@class="ember-text-field ember-view"]'))
             )
         except NoSuchElementException:
@@ -167,344 +218,329 @@ class Crawler:
         search_bar.send_keys(Keys.RETURN)
 
     def get_search_results(self) -> list:
-        """WebDriver waits for search results and grabs web elements.
+        """WebDriver waits for search results, then takes a single snapshot of the page and parses every card.
 
-        Returns:
-            list of "div"'s from search results.
+        Every find_element/.text call is a round trip to the driver, several per card, so the cards are parsed
+        in-process from the page source instead, the way profiles are.
 
-        Raises:
-            NoSuchElementException: Web element could not be found, (most likely changed).
+        Returns:
+            list of Candidate's (full name, profile link, card headline and location) of every search result card.
         """
         log_phase = 'Search-Results'
         logger.debug('{}: Waiting for search results of '.format(log_phase) +
                      "[" + self.row_first_name + " " + self.row_last_name + "]")
         try:
-            potential_divs = WebDriverWait(self.driver, 10).until(
-                expected_conditions.presence_of_all_elements_located((
-                    By.XPATH, '//div[@class="search-result__info pt3 pb4 ph0"]')))
-            return potential_divs
-        except NoSuchElementException:
-            msg = '{}: Web element could not be found.'.format(log_phase)
-            logger.exception(msg)
-            return []
+            self.wait_until('Search-Results', expected_conditions.presence_of_element_located((
+                By.XPATH, '//div[@class="search-result__info pt3 pb4 ph0"]')))
         except TimeoutException:
             logger.debug('{}: No match found.'.format(log_phase))
             return []
+        cards = parse_search_results(self.driver.page_source)
+        if not cards:
+            logger.error('{}: Search result cards could not be parsed, (the markup most likely changed).'.format(
+                log_phase))
+        return [card._replace(link=urljoin(self.base_url, card.link)) for card in cards]
 
-    def coarse_filter(self, potential_divs: list, result_list: list) -> None:
+    def coarse_filter(self, cards: list, result_list: list) -> None:
         """Populate the result set with coarse-grain filtered result for further evaluation.
 
         Linkedin occasionally returns irrelevant search results for unknown reason
 
         Args:
-            potential_divs (list):
-            result_list (list):
+            cards (list): Candidate's of every search result card.
+            result_list (list): Candidate's (full name, profile link, card headline and location) that survive are
+                appended to it.
         """
         log_phase = 'Coarse-Filter'
         logger.debug('{}: Starting filter...'.format(log_phase))
-        local_row_index = self.row_index
-        for div in potential_divs:  # web-element
-            logger.debug('{}: Finding web element(s)...'.format(log_phase))
-            try:
-                inner_anchor = div.find_element(By.TAG_NAME, "a")
-                profile_link = inner_anchor.get_attribute("href")
-
-                inner_h3 = inner_anchor.find_element(By.TAG_NAME, "h3")
-                inner_h3_id = inner_h3.get_attribute("id")
-
-                inner_span = inner_anchor.find_element(By.XPATH, "//h3[@id=\"" + inner_h3_id + "\"]/span[1]/span")
-                inner_span_text = inner_span.text.lower().replace(" ", "")
-                # logger.debug('{}: \nrow_first_name: {}\nrow_last_name: {}\ninner_span_text: {}'.format(
-                #     log_phase, self.row_first_name, self.row_last_name, inner_span_text))
-                if self.row_first_name in inner_span_text and self.row_last_name in inner_span_text:
-                    # TODO 1, mark full name on this profile link to output's FULL_NAME_ON_LINKEDIN column
-                    self.output_data.at[local_row_index, "FULL_NAME_ON_LINKEDIN"] = inner_span.text
-
-                    # TODO 2, mark this profile link to output's PROFILE_LINK column
-                    self.output_data.at[local_row_index,"PROFILE_LINK"] = profile_link
-                    # TODO 3, increment the row index(local)
-                    local_row_index+=1
-                    result_list.append(profile_link)
-            except NoSuchElementException:
-                msg = '{}: Web element could not be found.'.format(log_phase)
-                logger.exception(msg)
-                raise NoSuchElementException(msg)
-            except StaleElementReferenceException:
-                msg = '{}: Web element lost.'.format(log_phase)
-                logger.exception(msg)
-                raise StaleElementReferenceException(msg)
+        for card in cards:
+            name_text = card.name.lower().replace(" ", "")
+            if self.row_first_name in name_text and self.row_last_name in name_text:
+                result_list.append(card)
         log_result = str(len(result_list))
         logger.debug('{}: \"{}\" candidates survived from coarse-grain filter.'.format(log_phase, log_result))
 
-    def fine_filter(self, potential_links: list, row) -> None:
-        """fine-grain filter that evaluates accuracy score of all candidate profile links"""
+    def fine_filter(self, candidates: list, row: Series, profiles: list = None, position: int = None) -> tuple:
+        """fine-grain filter that evaluates accuracy score of the candidates worth opening
+
+        Args:
+            profiles (list): Profile of every candidate if they were opened for an earlier row of the same name.
+            position (int): 0-based position of row in input_data, the candidates are opened for every row of its name.
+
+        Returns:
+            (Candidate's opened, their Profile's).
+        """
+        log_phase = 'Fine-Filter'
+        log_set_num = str(len(candidates))
+        if profiles is None:
+            logger.debug('{}: Ranking \"{}\" candidates...'.format(log_phase, log_set_num))
+            rows, row_numbers = self.name_rows(row, position)
+            candidates, profiles, scores = self.open_candidates(candidates, rows, row_numbers)
+            self.score_candidates(candidates, profiles, row, [row_scores[0] for row_scores in scores])
+        else:
+            logger.debug('{}: Scoring \"{}\" candidates of an earlier row of the same name'.format(log_phase,
+                                                                                                   log_set_num))
+            self.score_candidates(candidates, profiles, row)
+        return candidates, profiles
+
+    def name_rows(self, row: Series, position: int = None) -> tuple:
+        """Returns the rows and row numbers of row's name left to crawl, row first, during crawl_linkedin."""
+        if self.groups is None or position is None:
+            return [row], [self.row_counter]
+        first_row_number = self.row_counter - position
+        rows, row_numbers = [], []
+        for later in self.groups[position]:
+            row_number = first_row_number + later
+            if later < position or (self.journal is not None and self.journal.completed(row_number)):
+                continue
+            rows.append(self.input_data.iloc[later])
+            row_numbers.append(row_number)
+        return rows, row_numbers
+
+    def open_candidates(self, candidates: list, rows: list, row_numbers: list) -> tuple:
+        """Opens the candidates worth opening for the rows of a name, and records the pruning decisions.
+
+        Args:
+            candidates (list): Candidate's that survived the coarse-grain filter.
+            rows (list): input rows of the name.
+            row_numbers (list): spreadsheet row number of every row.
+
+        Returns:
+            (Candidate's opened, their Profile's, their Score's against every row), in search result order.
+        """
+        log_phase = 'Fine-Filter'
+        opened, profiles, decisions, scores = self.pruner.open(candidates, rows, self.fetch_profiles, self.tabs)
+        logger.debug('{}: Opened {} of {} candidates'.format(log_phase, len(opened), len(candidates)))
+        self.metrics.sample('Opened', len(opened))
+        self.metrics.sample('Pruned', len([decision for decision in decisions if decision.action == PRUNED]))
+        self.metrics.sample('Skipped', len([decision for decision in decisions if decision.action == SKIPPED]))
+        if self.audit is not None:
+            self.audit.record(row_numbers, decisions)
+        return opened, profiles, scores
+
+    def score_candidates(self, candidates: list, profiles: list, row: Series, scores: list = None) -> None:
+        """Writes one output row per candidate with its latest job and accuracy score, then a separator row.
+
+        Args:
+            candidates (list): Candidate's that survived the coarse-grain filter.
+            profiles (list): Profile of every candidate, in the same order.
+            row (pandas Series): input row the candidates were searched for.
+            scores (list): Score of every profile against row if it was scored already, e.g. by the pruner.
+        """
         log_phase = 'Fine-Filter'
-        log_set_num = str(len(potential_links))
-        logger.debug('{}: Checking \"{}\" candidates profile links...'.format(log_phase, log_set_num))
         logger.debug('=' * 100)
-        for link in potential_links:
-            logger.debug('{}: Clicked: {}'.format(log_phase, link))
-            self.driver.get(link)
-            score = 0
-            score += self.verify_jobs(row)  # verify job history
-            score += self.verify_degrees(row)  # verify education
+        if scores is None:
+            scores = [scoring.score_profile(row, profile, self.job_position, self.geolocation) for profile in profiles]
+        for candidate, profile, score in zip(candidates, profiles, scores):
+            # TODO 1, mark full name on this profile link to output's FULL_NAME_ON_LINKEDIN column
+            self.output_data.set("FULL_NAME_ON_LINKEDIN", candidate.name)
+            # TODO 2, mark this profile link to output's PROFILE_LINK column
+            self.output_data.set("PROFILE_LINK", candidate.link)
+            self.mark_latest_job(profile)
             # TODO 8, for each iteration mark accuracy score to output's ACCURACY_SCORE column
-            self.output_data.at[self.row_index,'ACCURACY_SCORE'] = score
-            logger.debug('{}: Accuracy score: {}'.format(log_phase, score))
+            self.output_data.set('ACCURACY_SCORE', score.total)
+            logger.debug('{}: Score breakdown: {}'.format(log_phase, score))
+            logger.debug('{}: Accuracy score: {}'.format(log_phase, score.total))
             logger.debug('=' * 100 + "\n")
-            # TODO 9, increment row index(global)
-            self.row_index+=1
+            # TODO 9, commit this candidate's row
+            self.output_data.end_row()
         # add this line to seperate search results
-        self.output_data.at[self.row_index, 'ROW_NUMBER'] = ""
-        self.row_index += 1
+        self.output_data.set('ROW_NUMBER', "")
+        self.output_data.end_row()
 
-    def verify_jobs(self, row: Series) -> int:
-        """verify job history, check if input job title matches the latest job tile in this profile link"""
-        logger.debug('Verifying jobs...')
-        local_score = 0
+    def fetch_profiles(self, links: list) -> list:
+        """Returns the Profile of every candidate link, in order, loading up to self.tabs of them at once."""
+        if self.tabs > 1 and len(links) > 1:
+            return TabFetcher(self, self.tabs).fetch(links)
+        return [self.fetch_profile(link) for link in links]
 
-        # try catch block for error checking, because some profile link have no job data
+    def fetch_profile(self, link: str) -> Profile:
+        """Returns the Profile of a candidate link, from the profile cache if possible, otherwise from the web."""
+        log_phase = 'Fine-Filter'
+        if self.profile_cache is not None:
+            profile = self.profile_cache.get(link)
+            if profile is not None:
+                logger.debug('{}: Cached: {}'.format(log_phase, link))
+                return profile
+        logger.debug('{}: Clicked: {}'.format(log_phase, link))
+        self.load(link)
+        profile = self.get_profile()
+        # an empty profile may just be a page that did not render in time, so it is not cached
+        if self.profile_cache is not None and (profile.jobs or profile.educations):
+            self.profile_cache.put(link, profile)
+        return profile
+
+    def get_profile(self) -> Profile:
+        """Takes a single snapshot of the current profile page and parses it.
+
+        Every find_element/.text call is a round trip to the driver, so instead of querying the page element by element
+        the WebDriver only waits for the background section to render, then the page source is parsed in-process.
+
+        Returns:
+            Profile record of the current page, empty if the profile has no job and no education data.
+        """
+        log_phase = 'Fine-Filter'
         try:
-            job_list = WebDriverWait(self.driver, 10).until(
-                expected_conditions.presence_of_all_elements_located((
-                    By.XPATH, '//a[@data-control-name="background_details_company"]')))
-        except:
+            self.wait_until('Background', BACKGROUND)
+        except TimeoutException:
+            logger.debug('{}: No background data found.'.format(log_phase))
+            return Profile([], [])
+        return parse_profile(self.driver.page_source)
+
+    def mark_latest_job(self, profile: Profile) -> None:
+        """Marks the latest job of the profile to the output's JOB_TITLE, COMPANY_NAME and COMPANY_LOCATION columns"""
+        if not profile.jobs:
             logger.debug('No job data found.')
-            return local_score
-
-        logger.debug(str(len(job_list)) + ' job data found')
-        # the top job information in this profile link
-        latest_job_title = ""
-        latest_job_company = ""
-        latest_job_info = ""
-        # current job information from input spreadsheet
-        if type(row['WORK_TITLE']) is str and row['WORK_TITLE']:
-            job_title_from_excel = self.convert_str(row['WORK_TITLE'])
-        else:
-            job_title_from_excel = ""
+            return
+        latest_job = profile.jobs[0]
+        # TODO 5, mark latest job title to output's JOB_TITLE column
+        self.output_data.set('JOB_TITLE', latest_job.title)
+        # TODO 6, mark latest company to output's COMPANY_NAME column
+        if latest_job.company:
+            self.output_data.set('COMPANY_NAME', latest_job.company)
+        # TODO 7, mark work location to output's COMPANY_LOCATION column
+        if latest_job.location:
+            self.output_data.set('COMPANY_LOCATION', latest_job.location)
+        logger.debug('latest job: ' + latest_job.title)
+        logger.debug('latest job info: ' + latest_job.description)
+
+    def search_candidates(self) -> list:
+        """Searches the current row's name and returns the candidates that survive the coarse-grain filter.
+
+        Search results are memoized by (first name, last name, region) in the search cache, so duplicate names in the
+        input cost no page loads.
 
-        if type(row['WORK_COMPANY_NAME1']) is str and row['WORK_COMPANY_NAME1']:
-            job_company_from_excel = self.convert_str(row['WORK_COMPANY_NAME1'])
+        Returns:
+            list of Candidate's (full name, profile link, card headline and location).
+        """
+        log_phase = 'Crawl-Util'
+        query = (self.row_first_name, self.row_last_name, self.start_region)
+        if self.search_cache is not None:
+            candidates = self.search_cache.get(query)
+            if candidates is not None:
+                logger.debug("{}: Cached search for [".format(log_phase) + " ".join(query) + "]")
+                return candidates
+        candidates = []
+        with self.metrics.span('Start-Search'):
+            self.start_search()
+        with self.metrics.span('Search-Results'):
+            cards = self.get_search_results()
+        log_cards = str(len(cards))
+        if len(cards) == 0:
+            logger.debug("{}: No match for [".format(log_phase) + self.row_first_name + " " + self.row_last_name + "]")
         else:
-            job_company_from_excel = ""
+            logger.debug("{}: \"{}\" card(s) entering coarse-grain filter".format(log_phase, log_cards))
+            with self.metrics.span('Coarse-Filter'):
+                self.coarse_filter(cards, candidates)  # coarse grain filter
+        if self.search_cache is not None:
+            self.search_cache.put(query, candidates)
+        return candidates
+
+    def set_search(self, row: Series) -> None:
+        """Sets the name searched for a row."""
+        self.row_first_name = row["FIRST_NAME"].lower()
+        self.row_last_name = row["LAST_NAME"].lower()
 
-        # iterate on all job history in this profile link
-        for job in job_list:
+    def mark_row(self, row: Series) -> None:
+        """Marks the current row's number, ID and search key words to the output."""
+        # TODO 4, mark current search key words to the output's FIRST_NAME, LAST_NAME column
+        self.output_data.set("ROW_NUMBER", self.row_counter)
+        self.output_data.set("ID_NUMBER", row['ID_NUMBER'])
+        self.output_data.set("KEYWORD", row['FIRST_NAME'] + " " + row['LAST_NAME'])
 
-            try:
-                job_title = job.find_element(By.TAG_NAME, "h3").text  # get job title
-                h4_tags = job.find_elements(By.TAG_NAME, "h4")  # get all other job info
-            except NoSuchElementException:
-                msg = 'Web element could not be found.'
-                logger.exception(msg)
-                raise NoSuchElementException(msg)
+    def crawl_util(self, row, position: int = None):
+        """crawl utility function for loop
 
-            # record the top job title as the latest job title
-            if not latest_job_title:
-                latest_job_title += job_title
-                # TODO 5, mark latest job title to output's JOB_TITLE column
-                self.output_data.at[self.row_index, 'JOB_TITLE'] = latest_job_title
-
-            # temp job info is used to compose job description
-            temp_job_info = ""
-            company_name_sub = ""
-
-            # iterate on all h4 tags in this job item, these h4 tags contain all info about this job title
-            for h4 in h4_tags:
-                h4_text = h4.text
-                h4_text_sub = self.convert_str(h4_text)
-                # the actual company name is after this phrase, so we slice the string to get it
-                if "companyname" in h4_text_sub:
-                    company_name_sub = h4_text_sub[len("companyname"):]
-                    if not latest_job_company:
-                        latest_job_company = h4_text[len("Company Name") + 1:]
-                        # TODO 6, mark latest company to output's COMPANY_NAME column
-                        self.output_data.at[self.row_index, 'COMPANY_NAME'] = latest_job_company
-                temp_job_info += h4_text + "\n"
-
-            # record job description for the latest job
-            if not latest_job_info:
-                latest_job_info = temp_job_info
-                location_index = latest_job_info.find('Location')
-                if location_index != -1:
-                    off_set = location_index + len('Location') + 1
-                    # TODO 7, mark work location to output's COMPANY_LOCATION column
-                    self.output_data.at[self.row_index, 'COMPANY_LOCATION'] = latest_job_info[off_set:].replace("\n", "")
-
-            # check if current job is empty in the spreadsheet, if yes, just replace it with latest job from LinkedIn
-            # and break the loop
-            if not job_title_from_excel:
-                job_title_from_excel = latest_job_title
-                job_company_from_excel = latest_job_company
-                logger.debug('Empty job is currently on record, break loop since new job is found')
-                logger.debug('Current job: ' + job_title_from_excel)
-                logger.debug('Current company: ' + job_company_from_excel)
-                break
-
-            # check if job title matches
-            job_title_sub = self.convert_str(job_title)
-            if job_title_sub in job_title_from_excel or job_title_from_excel in job_title_sub:
-                logger.debug('Job title match.')
-                local_score += 1
-
-            # check if company matches
-            if job_company_from_excel in company_name_sub or company_name_sub in job_company_from_excel:
-                logger.debug('Company name match.')
-                local_score += 1
-
-        logger.debug('latest job: ' + latest_job_title)
-        logger.debug('latest job info: ' + latest_job_info)
-        logger.debug('*' * 100)
-        local_score += self.verify_jobs_helper(self.convert_str(latest_job_title), self.convert_str(latest_job_info))
-        return local_score
-
-    def verify_jobs_helper(self, job_title: str, job_info: str) -> int:
-        """match search keywords with the latest job"""
-        local_score = 0
-        if self.job_position:
-            target_job = self.convert_str(self.job_position)
-            if job_title in target_job:
-                local_score += 1
-        if self.geolocation:
-            target_location = self.convert_str(self.geolocation)
-            if target_location in job_info:
-                local_score += 1
-        return local_score
-
-    def verify_degrees(self, row: Series) -> int:
-        """verify education data of this link, i.e., school name, major, grad year"""
-        logger.debug('Verifying degrees...')
-        local_score = 0
-        # error checking, for some profile link don't even have education info
-        try:
-            education_list = WebDriverWait(self.driver, 5).until(
-                #  The reason why choose this xpath is <a> tags with this data-control-name wraps all the data we want
-                expected_conditions.presence_of_all_elements_located((
-                    By.XPATH, '//a[@data-control-name="background_details_school"]')))
-        except TimeoutException:
-            logger.debug('No education data found.')
-            return local_score
-
-        logger.debug(str(len(education_list)) + " education data found\n")
-        schools = [row['SCHOOL1'], row['SCHOOL2'], row['SCHOOL3']]
-        majors = [row['MAJOR1'], row['MAJOR2'], row['MAJOR3']]
-        degrees = [row['DEGREE_CODE1'], row['DEGREE_CODE2'], row['DEGREE_CODE3']]
-        grad_yrs = [row['DEGREE_YEAR1'], row['DEGREE_YEAR2'], row['DEGREE_YEAR3']]
-        #  There are 3 school columns in the input spreadsheet
-        #   need to match each of them with current profile link
-        for school_col, major_col, degree_col, gradyrs_col in zip(schools, majors, degrees, grad_yrs):
-            # check current school_col value is a non-empty string, not other type
-            if type(school_col) is str and school_col:
-                # iterate on all education data in this profile link
-                for education in education_list:
-                    # find school name
-                    school = education.find_element(By.TAG_NAME, "h3")
-                    school_name = school.text
-                    # logger.debug(school_name)
-                    # check school
-                    if self.check_school(self.convert_str(school_name)):
-                        logger.debug("school match.")
-                        local_score += 1
-
-                    # find major info
-                    major_infos = education.find_elements(By.CLASS_NAME, "pv-entity__comma-item")
-                    major_text = ""
-                    for major_info in major_infos:
-                        # logger.debug(major_info.text)
-                        major_text += major_info.text
-                    # logger.debug(major_text)
-                    # check major and degree
-                    if self.check_degree(self.convert_str(major_text), self.convert_str(degree_col)):
-                        logger.debug("degree match.")
-                        local_score += 1
-
-                    if self.check_major(self.convert_str(major_text), self.convert_str(major_col)):
-                        logger.debug("major match.")
-                        local_score += 1
-
-                    # find graduation year
-                    grad_years = education.find_elements(By.TAG_NAME, "time")
-                    grad_year = ""
-                    if len(grad_years) == 2:
-                        grad_year = grad_years[1].text
-                    elif len(grad_years) == 1:
-                        grad_year = grad_years[0].text
-
-                    logger.debug("graduation year: " + grad_year)
-                    if self.check_gradyear(grad_year, str(int(gradyrs_col))):
-                        logger.debug("graduation year match.")
-                        local_score += 1
-        return local_score
-
-    def check_school(self, str_input: str) -> bool:
-        """Check school name with all possible synonyms"""
-        if "universityatbuffalo" in str_input or "stateuniversityofnewyorkatbuffalo" in str_input:
-            return True
+        Args:
+            position (int): 0-based position of row in input_data, rows of a name searched before reuse its candidates
+                and profiles.
+        """
+        group = self.groups[position] if self.groups is not None and position is not None else None
+        shared = self.shared.get(group[0]) if group is not None else None
+        if shared is None:
+            self.set_search(row)
+            candidates, profiles = self.search_candidates(), None
         else:
-            return False
-
-    def check_degree(self, text_from_web: str, text_from_sheet: str) -> bool:
-        """check if degree matches"""
-        if ("bachelor" in text_from_web or "master" in text_from_web) and "science" in text_from_web:
-            if "bs" in text_from_sheet:
-                return True
-            elif "ms" in text_from_sheet:
-                return True
-            else:
-                return False
-        elif ("bachelor" in text_from_web or "master" in text_from_web) and "art" in text_from_web:
-            if "ba" in text_from_sheet:
-                return True
-            elif "ma" in text_from_sheet:
-                return True
-            else:
-                return False
+            candidates, profiles = shared
+        if len(candidates) > 0:
+            self.mark_row(row)
+            with self.metrics.span('Fine-Filter'):
+                candidates, profiles = self.fine_filter(candidates, row, profiles, position)  # fine grain filter
+        if group is not None and position != group[-1]:
+            self.shared[group[0]] = (candidates, profiles)  # kept for the later rows of the name
+
+    def row_done(self, position: int) -> None:
+        """Drops the candidates and profiles of a name after its last row."""
+        group = self.groups[position]
+        if position == group[-1]:
+            self.shared.pop(group[0], None)
+
+    def restore_output(self, output: list) -> None:
+        """Writes output rows recorded in the journal back to the output"""
+        for output_row in output:
+            self.output_data.append(output_row)
+
+    def open_session(self) -> None:
+        """Sets up a new driver and logs in."""
+        with self.metrics.span('Setup'):
+            self.setup_driver()
+        if self.driver:
+            self.load(self.base_url)
+            with self.metrics.span('Login'):
+                self.login()
+
+    def start_session(self) -> None:
+        """Borrows a warm logged in driver from the session manager if there is one, otherwise opens a new one."""
+        if self.sessions is not None:
+            self.session = self.sessions.acquire(self)
         else:
-            return text_from_sheet in text_from_web
+            self.open_session()
 
-    def check_major(self, text_from_web: str, text_from_sheet: str) -> bool:
-        """check major"""
-        return text_from_sheet in text_from_web
-
-    def check_gradyear(self, text_from_web: str, text_from_sheet: str) -> bool:
-        """check graduation year"""
-        return text_from_web == text_from_sheet
+    def close_session(self) -> None:
+        """Gives a borrowed session back to the session manager, or closes the driver."""
+        if self.session is not None:
+            self.sessions.release(self.session)
+            self.session = None
+        else:
+            browser.quit_driver(self.driver, self.profile_dir)
+        self.driver = None
+        self.profile_dir = None
 
-    def convert_str(self, str_input: str) -> str:
-        """helper function to remove all non-alphabet characters in given string, and convert it to lower case"""
-        return re.sub("\W", "", str_input).lower()
+    def crawl_linkedin(self):
+        """Crawls every row one after the other with a single browser.
 
-    def crawl_util(self, row):
-        """crawl utility function for loop"""
-        log_phase = 'Crawl-Util'
-        self.row_first_name = row["FIRST_NAME"].lower()
-        self.row_last_name = row["LAST_NAME"].lower()
-        self.start_search()
-        potential_divs = self.get_search_results()
-        log_div = str(len(potential_divs))
-        if len(potential_divs) == 0:
-            logger.debug("{}: No match for [".format(log_phase) + self.row_first_name + " " + self.row_last_name + "]")
-            return
-        potential_links = []
-        logger.debug("{}: \"{}\" potential div(s) entering coarse-grain filter".format(log_phase, log_div))
-        self.coarse_filter(potential_divs, potential_links)  # coarse grain filter
-        if len(potential_links) == 0:
+        Runs go through pipeline.CrawlPipeline, which runs these same steps with several browsers, this is the
+        sequential reference its output is tested against.
+        """
+        self.start_session()
+        if not self.driver:
             return
-        # TODO 4, mark current search key words to the output's FIRST_NAME, LAST_NAME column
-        self.output_data.at[self.row_index, "ROW_NUMBER"] = self.row_counter
-        self.output_data.at[self.row_index, "ID_NUMBER"] = row['ID_NUMBER']
-        self.output_data.at[self.row_index,"KEYWORD"] = row['FIRST_NAME'] + " " + row['LAST_NAME']
-        self.fine_filter(potential_links, row)  # fine grain filter
-
-    def crawl_linkedin(self):
-        """main routine for UI invocation"""
-        self.setup_driver()
-        if self.driver:
-            self.driver.get("https://www.linkedin.com")
-            self.login()
-            for index, row in self.input_data.iterrows():
-                self.crawl_util(row)
+        groups = group_rows(self.input_data)
+        self.groups = {position: group for group in groups for position in group}
+        self.shared = {}
+        logger.debug("Planned {} search(es) for {} row(s)".format(len(groups), len(self.input_data)))
+        try:
+            for position, (index, row) in enumerate(self.input_data.iterrows()):
+                if self.cancel is not None and self.cancel.is_set():
+                    logger.debug("Crawling cancelled before row {}".format(self.row_counter))
+                    break
+                if self.journal is not None and self.journal.completed(self.row_counter):
+                    self.restore_output(self.journal.output(self.row_counter))  # already crawled by a previous run
+                    self.row_done(position)
+                    self.row_counter += 1
+                    continue
+                start_index = len(self.output_data)
+                shared = self.groups[position][0] in self.shared
+                self.crawl_util(row, position)
+                self.row_done(position)
+                if self.journal is not None:
+                    self.journal.record(self.row_counter, self.output_data.records[start_index:])
                 self.row_counter+=1
-                self.random_pause()
-            self.driver.close()
-            logger.debug("Crawling complete")
+                self.metrics.row_done()
+                if not shared:
+                    self.random_pause()  # rows of a name searched before load no page
+        finally:
+            self.close_session()
+        self.metrics.finish()
+        logger.debug("Crawling complete")
+
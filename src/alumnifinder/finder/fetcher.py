@@ -0,0 +1,134 @@
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions
+
+from src.alumnifinder.finder.metrics import WAIT
+from src.alumnifinder.finder.profile import Profile, parse_profile
+
+logger = logging.getLogger(__name__)
+
+OPEN_TAB_SCRIPT = 'window.open(arguments[0], "_blank");'
+
+BACKGROUND = expected_conditions.presence_of_element_located((
+    By.XPATH, '//a[@data-control-name="background_details_company" or @data-control-name="background_details_school"]'))
+
+
+def new_tab(handles: set):
+    """Expected condition of a window opened since handles were listed, its value is the new window handle."""
+    def condition(driver):
+        opened = set(driver.window_handles) - handles
+        return opened.pop() if opened else False
+    return condition
+
+
+class TabFetcher:
+    """Loads up to tabs candidate profiles at once, in browser tabs of the crawler's driver.
+
+    A driver runs one command at a time but its browser loads every open tab concurrently, so instead of loading
+    profiles one after the other, the fetcher keeps tabs profile pages loading in background tabs. It then visits the
+    tabs in candidate order, snapshots each page as soon as its background section is there, closes the tab and opens
+    the next candidate in its place. Parsing the snapshots is handed to a separate thread, so that it overlaps the next
+    page loads, and scoring is left to the caller once every profile is parsed. Opening a tab goes through the
+    crawler's rate limiter, so the global page load cap still holds. If the browser does not open tabs, e.g. window.open
+    is blocked, profiles are loaded one at a time in the current tab instead, for the rest of the run.
+
+    Args:
+        crawler (Crawler): crawler whose driver, rate limiter, waits, metrics and profile cache are used.
+        tabs (int): maximum number of profiles loading at once.
+    """
+
+    def __init__(self, crawler, tabs: int):
+        self.crawler = crawler
+        self.tabs = max(1, tabs)
+        self.blocked = False  # no tab opened, profiles are loaded in the current tab
+
+    def open_tab(self, link: str) -> str:
+        """Starts loading link in a new tab, without waiting for it.
+
+        If no new tab shows up in time, link is loaded in the current tab instead, and the crawler stops using tabs.
+
+        Returns:
+            window handle of the new tab, None if link was loaded in the current tab.
+        """
+        driver = self.crawler.driver
+        if self.crawler.rate_limiter is not None:
+            with self.crawler.metrics.span('Rate-Limit', WAIT):
+                self.crawler.rate_limiter.acquire()
+        if not self.blocked:
+            handles = set(driver.window_handles)
+            driver.execute_script(OPEN_TAB_SCRIPT, link)
+            try:
+                return self.crawler.wait_until('New-Tab', new_tab(handles))
+            except TimeoutException:
+                logger.warning('Fetcher: No new tab opened, profiles are loaded one at a time in the current tab')
+                self.blocked = True
+                self.crawler.tabs = 1
+        with self.crawler.metrics.span('Page-Load', WAIT):
+            driver.get(link)
+        return None
+
+    def snapshot(self, handle: str) -> str:
+        """Waits for the background section of a tab, returns its page source and closes it.
+
+        Args:
+            handle (str): window handle of the tab, None for the current tab, which is left open.
+
+        Returns:
+            page source of the tab, None if its background section did not show up.
+        """
+        driver = self.crawler.driver
+        if handle is not None:
+            driver.switch_to.window(handle)
+        try:
+            self.crawler.wait_until('Background', BACKGROUND)
+            source = driver.page_source
+        except TimeoutException:
+            source = None
+        if handle is not None:
+            driver.close()
+        return source
+
+    def fetch(self, links: list) -> list:
+        """Returns the Profile of every link, in order, from the profile cache if possible, otherwise from the web."""
+        log_phase = 'Fine-Filter'
+        cache = self.crawler.profile_cache
+        profiles = [cache.get(link) if cache is not None else None for link in links]
+        pending = deque(i for i, profile in enumerate(profiles) if profile is None)
+        if not pending:
+            return profiles
+        driver = self.crawler.driver
+        main_window = driver.current_window_handle
+        loading = deque()  # (index, window handle) of the open tabs, in candidate order, None for the current tab
+        parsed = []  # (index, future Profile)
+        with ThreadPoolExecutor(max_workers=1) as parser:
+            try:
+                while pending or loading:
+                    # the current tab holds a single page, nothing more is opened until it is snapshotted
+                    while pending and len(loading) < self.tabs and not (loading and loading[-1][1] is None):
+                        index = pending.popleft()
+                        logger.debug('{}: Opened: {}'.format(log_phase, links[index]))
+                        loading.append((index, self.open_tab(links[index])))
+                    index, handle = loading.popleft()
+                    source = self.snapshot(handle)
+                    driver.switch_to.window(main_window)
+                    if source is None:
+                        logger.debug('{}: No background data found.'.format(log_phase))
+                        profiles[index] = Profile([], [])
+                    else:
+                        parsed.append((index, parser.submit(parse_profile, source)))
+            finally:
+                for index, handle in loading:  # left open by an error
+                    if handle is not None:
+                        driver.switch_to.window(handle)
+                        driver.close()
+                driver.switch_to.window(main_window)
+            for index, future in parsed:
+                profiles[index] = future.result()
+                # an empty profile may just be a page that did not render in time, so it is not cached
+                if cache is not None and (profiles[index].jobs or profiles[index].educations):
+                    cache.put(links[index], profiles[index])
+        return profiles
@@ -0,0 +1,182 @@
+import logging
+import os
+import threading
+from typing import NamedTuple
+
+from src.alumnifinder import config
+from src.alumnifinder.finder.metrics import RunMetrics
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+CANCELLED = 'cancelled'
+FAILED = 'failed'
+
+
+class Job(NamedTuple('Job', [('input_path', str), ('save_path', str), ('start_row', int), ('end_row', int),
+                             ('workers', int), ('resume', bool), ('options', dict), ('output_format', str),
+                             ('cache_dir', str)])):
+    """A crawl of a range of an input file, everything the GUI or the command line reads before running it.
+
+    Attributes:
+        input_path (str): path of the input .xlsx, .xls or .csv file.
+        save_path (str): path of the output file, the journal, metrics and pruning audit log are written next to it.
+        start_row (int): first spreadsheet row, None for the whole file.
+        end_row (int): last spreadsheet row, None for the whole file.
+        workers (int): number of browsers, 0 for automatic.
+        resume (bool): resume the previous run of the same file and range from its journal.
+        options (dict): arguments passed to the CrawlPipeline, e.g. geolocation, job_position.
+        output_format (str): one of excel.writer.OUTPUT_FORMATS.
+        cache_dir (str): directory of the profile and workbook caches, None for config.cache_dir.
+    """
+    __slots__ = ()
+
+    def profile_cache(self):
+        """ProfileCache in cache_dir."""
+        from src.alumnifinder.finder.cache import ProfileCache
+        if self.cache_dir is None:
+            return ProfileCache()
+        return ProfileCache(os.path.join(self.cache_dir, os.path.basename(config.profile_cache_path)))
+
+    def workbook_cache(self):
+        """WorkbookCache in cache_dir."""
+        from src.alumnifinder.excel.cache import WorkbookCache
+        if self.cache_dir is None:
+            return WorkbookCache()
+        return WorkbookCache(os.path.join(self.cache_dir, os.path.basename(config.workbook_cache_dir)))
+
+
+class Progress(NamedTuple('Progress', [('job', Job), ('state', str), ('rows', int), ('total', int),
+                                       ('rows_per_minute', float), ('eta', float), ('cache_hit_rate', float),
+                                       ('elapsed', float), ('error', str), ('pruned', int), ('skipped', int)])):
+    """Snapshot of a job, sent from the runner thread to the GUI, or the summary of a command line run.
+
+    Attributes:
+        job (Job): job reported on.
+        state (str): QUEUED, RUNNING, DONE, CANCELLED or FAILED.
+        rows (int): rows crawled so far, rows restored from the journal excluded.
+        total (int): rows to crawl.
+        rows_per_minute (float): throughput so far.
+        eta (float): estimated seconds left, None until the first row is done.
+        cache_hit_rate (float): share of profile and search lookups answered by the caches.
+        elapsed (float): seconds since the job started.
+        error (str): error message of a FAILED job.
+        pruned (int): candidates not opened for their search result card, they are only listed in the pruning audit
+            log, not in the output.
+        skipped (int): candidates not opened because a candidate opened before them was a confident match, listed in
+            the audit log too.
+    """
+    __slots__ = ()
+
+    def summary(self) -> dict:
+        """JSON serializable run summary."""
+        summary = self._asdict()
+        job = summary.pop('job')
+        summary.update(input=job.input_path, output=job.save_path, start_row=job.start_row, end_row=job.end_row)
+        return summary
+
+    def describe(self) -> str:
+        """One line status for the GUI."""
+        name = self.job.save_path.split('/')[-1]
+        if self.state != RUNNING:
+            return '{}: {}{}'.format(name, self.state, ' ({})'.format(self.error) if self.error else '')
+        eta = 'ETA {}:{:02d}:{:02d}'.format(*hours_minutes_seconds(self.eta)) if self.eta is not None else 'ETA -'
+        return '{}: {}/{} rows, {:.1f} rows/min, {}, cache hits {:.0%}'.format(
+            name, self.rows, self.total, self.rows_per_minute, eta, self.cache_hit_rate)
+
+
+Progress.__new__.__defaults__ = (0, 0)
+
+
+def status(job: Job, state: str, error: str = None) -> Progress:
+    """Progress of a job that is not running, e.g. queued or failed."""
+    return Progress(job, state, 0, 0, 0.0, None, 0.0, 0.0, error)
+
+
+def hours_minutes_seconds(seconds: float) -> tuple:
+    seconds = int(seconds)
+    return seconds // 3600, seconds // 60 % 60, seconds % 60
+
+
+def cache_hit_rate(caches: list) -> float:
+    hits = sum(cache.hits for cache in caches)
+    lookups = hits + sum(cache.misses for cache in caches)
+    return hits / lookups if lookups else 0.0
+
+
+def progress(job: Job, state: str, metrics: RunMetrics, total: int, caches: list, error: str = None) -> Progress:
+    rows = metrics.rows
+    elapsed = metrics.elapsed()
+    rows_per_minute = rows / elapsed * 60 if elapsed > 0 else 0.0
+    eta = (total - rows) / rows_per_minute * 60 if rows_per_minute > 0 else None
+    return Progress(job, state, rows, total, rows_per_minute, eta, cache_hit_rate(caches), elapsed, error,
+                    int(metrics.gauge_total('Pruned')), int(metrics.gauge_total('Skipped')))
+
+
+def run_job(job: Job, sessions, cancel: threading.Event, report) -> Progress:
+    """Crawls a job and saves its output, the partial output of a cancelled or failed job included.
+
+    The journal is removed once a complete run is saved, a cancelled run keeps it so that it can be resumed. If saving
+    the partial output of a failed job fails too, that is logged and the crawl error is raised.
+
+    Args:
+        sessions (SessionManager): warm logged in browsers, None to open new ones.
+        cancel (threading.Event): set to stop the crawl before its next row.
+        report (callable): called with a Progress after every row.
+
+    Returns:
+        final Progress, DONE or CANCELLED.
+    """
+    # imported on the first run, the GUI and the command line start without pandas, numpy and selenium
+    from src.alumnifinder.excel.handler import Handler
+    from src.alumnifinder.excel.writer import OUTPUT_COLUMNS, ResultSink, save_output
+    from src.alumnifinder.finder import browser
+    from src.alumnifinder.finder.cache import SearchCache
+    from src.alumnifinder.finder.journal import Journal
+    from src.alumnifinder.finder.pipeline import CrawlPipeline
+    from src.alumnifinder.finder.pool import pool_size
+    from src.alumnifinder.finder.pruning import AuditLog
+
+    excel = Handler(excel_file=job.input_path, start=job.start_row, end=job.end_row, cache=job.workbook_cache())
+    output = ResultSink(OUTPUT_COLUMNS)
+    profile_cache = job.profile_cache()
+    search_cache = SearchCache()
+    caches = [profile_cache, search_cache]
+    # checkpoint next to the output file, a crashed run is resumed from it
+    journal = Journal(job.save_path + '.journal', resume=job.resume)
+    audit = AuditLog(job.save_path + '.pruning.jsonl', resume=job.resume)  # candidates opened and pruned, per name
+    total = max(0, excel.divided_data_size - len(journal.completed_rows))
+    metrics = RunMetrics(on_row=lambda rows: report(progress(job, RUNNING, metrics, total, caches)))
+    report(progress(job, RUNNING, metrics, total, caches))
+    crawled = False
+    try:
+        options = dict(job.options)
+        memory_per_worker = browser.get_profile(options.get('driver_profile', config.driver_profile)).memory
+        workers = pool_size(job.workers, excel.divided_data_size, memory_per_worker)
+        if job.start_row:
+            options['start_row'] = job.start_row
+        c = CrawlPipeline(excel.divided_data, output, browsers=workers, profile_cache=profile_cache,
+                          search_cache=search_cache, journal=journal, metrics=metrics, sessions=sessions,
+                          cancel=cancel, audit=audit, **options)
+        c.crawl_linkedin()
+        crawled = True
+    finally:
+        profile_cache.close()
+        search_cache.close()
+        journal.close()
+        audit.close()
+        metrics.finish()
+        metrics.to_json(job.save_path + '.metrics.json')  # per-phase latency report, also written for failed runs
+        # partial results of cancelled or failed runs
+        try:
+            save_output(output.to_frame(), job.save_path, job.output_format, OUTPUT_COLUMNS)
+        except Exception:
+            if crawled:
+                raise
+            logger.exception('Job: Partial output of a failed run could not be saved: {}'.format(job.save_path))
+    if cancel.is_set():
+        return progress(job, CANCELLED, metrics, total, caches)
+    journal.remove()  # the run is saved, nothing left to resume
+    return progress(job, DONE, metrics, total, caches)
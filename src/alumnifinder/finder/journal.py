@@ -0,0 +1,90 @@
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def to_json(value):
+    """json.dumps fallback for numpy scalars found in DataFrame rows."""
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+class Journal:
+    """Append-only checkpoint of a crawl, one JSON line per completed input row.
+
+    Each line holds the spreadsheet row number and the output rows the crawler produced for it, so that a crashed run
+    can be resumed by skipping every completed row and replaying its output. Lines are buffered and flushed to disk
+    every flush_every rows, a line cut short by a crash is ignored when the journal is loaded.
+
+    Args:
+        path (str): path of the journal file.
+        resume (bool): load the completed rows of an existing journal, otherwise the journal starts empty.
+        flush_every (int): number of completed rows between two flushes.
+
+    Attributes:
+        completed_rows (dict): output rows (list of dict) keyed by completed spreadsheet row number.
+    """
+
+    def __init__(self, path: str, resume: bool = False, flush_every: int = 10):
+        self.path = path
+        self.flush_every = flush_every
+        self.pending = 0
+        self.lock = threading.Lock()  # shared by every worker of a run
+        self.completed_rows = self.load() if resume else {}
+        self.file = open(path, 'a' if resume else 'w')
+        if self.file.tell() and not self.ends_with_newline():
+            self.file.write('\n')  # terminate the entry cut short by a crash, so the next one is not lost with it
+
+    def load(self) -> dict:
+        completed_rows = {}
+        if not os.path.exists(self.path):
+            return completed_rows
+        with open(self.path) as journal_file:
+            for line in journal_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning('Journal: Skipped incomplete entry in {}'.format(self.path))
+                    continue
+                completed_rows[entry['row']] = entry['output']
+        logger.debug('Journal: Resuming with {} completed row(s).'.format(len(completed_rows)))
+        return completed_rows
+
+    def ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as journal_file:
+            journal_file.seek(-1, os.SEEK_END)
+            return journal_file.read(1) == b'\n'
+
+    def completed(self, row_number: int) -> bool:
+        return row_number in self.completed_rows
+
+    def output(self, row_number: int) -> list:
+        """Returns the output rows recorded for a completed spreadsheet row."""
+        return self.completed_rows[row_number]
+
+    def record(self, row_number: int, output: list) -> None:
+        """Marks a spreadsheet row as completed along with the output rows produced for it."""
+        line = json.dumps({'row': row_number, 'output': output}, default=to_json) + '\n'
+        with self.lock:
+            self.completed_rows[row_number] = output
+            self.file.write(line)
+            self.pending += 1
+            if self.pending >= self.flush_every:
+                self.flush()
+
+    def flush(self) -> None:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.pending = 0
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def remove(self) -> None:
+        """Closes and deletes the journal, once its run has been saved."""
+        self.close()
+        os.remove(self.path)
@@ -0,0 +1,109 @@
+"""Synonym matchers compiled from config/patterns.json.
+
+Every category of patterns.json (school names, degrees, majors) is compiled into a single regular expression, one
+alternation with a named group per class of synonyms, so classifying a text takes one scan whatever the number of
+synonyms. A category's data lists either synonyms, all of one class named after the category, or classes:
+
+    {"class": "science", "synonyms": ["bachelor of science", "bs", "m.s."]}
+
+Synonyms match whole words, case-insensitively, with any punctuation or spacing between their words: "comp sci" matches
+"Comp. Sci." and "CompSci". The letters of a dotted abbreviation may be written with or without their dots, "m.s."
+matches "MS", "M.S" and "M.S.", but not "M. S." (e.g. initials) nor the "ms" of "programs". Adding another institution's
+names or another degree only takes an edit of patterns.json.
+"""
+import re
+from functools import lru_cache
+
+from src.alumnifinder.utils import jsonreader
+
+NON_WORD = re.compile(r'\W')
+NOT_IN_WORD = re.compile(r'[^\w.]')  # separates the words of a synonym, dots belong to abbreviations
+
+SCHOOLS = 'schoolnames'
+DEGREES = 'degrees'
+MAJORS = 'majors'
+
+
+def letters(synonym: str) -> str:
+    """Synonym without its non-word characters, lower case."""
+    return NON_WORD.sub('', synonym).lower()
+
+
+def word_pattern(word: str) -> str:
+    """Regular expression of a word of a synonym, a dotted abbreviation has an optional dot after every letter."""
+    if '.' in word:
+        return r'\.?'.join(re.escape(char) for char in letters(word))
+    return re.escape(letters(word))
+
+
+def synonym_pattern(synonym: str) -> str:
+    """Regular expression of a synonym, its words separated by any run of non-word characters."""
+    return r'\W*'.join(word_pattern(word) for word in NOT_IN_WORD.sub(' ', synonym).split() if letters(word))
+
+
+class Matcher:
+    """Classifies text by the synonym classes of a patterns.json category.
+
+    Args:
+        classes (list of tuple): (class name, list of synonyms), in patterns.json order.
+        cache_size (int): number of classified texts memoized, profiles and exports repeat the same few texts.
+
+    Attributes:
+        names (list of str): class names, class i is bit i of a mask.
+    """
+
+    def __init__(self, classes: list, cache_size: int = 65536):
+        self.names = [name for name, _ in classes]
+        groups = []
+        for i, (_, synonyms) in enumerate(classes):
+            patterns = sorted({synonym_pattern(synonym) for synonym in synonyms if letters(synonym)},
+                              key=len, reverse=True)
+            if patterns:
+                groups.append('(?P<c{}>{})'.format(i, '|'.join(patterns)))
+        self.regex = re.compile(r'(?<!\w)(?:{})(?!\w)'.format('|'.join(groups)), re.IGNORECASE) if groups else None
+        self.mask = lru_cache(maxsize=cache_size)(self.scan)
+
+    def scan(self, text) -> int:
+        """Bit mask of the classes found in text, in a single pass, 0 for anything but a non-empty string."""
+        if self.regex is None or type(text) is not str or not text:
+            return 0
+        mask = 0
+        for match in self.regex.finditer(text):
+            mask |= 1 << int(match.lastgroup[1:])
+        return mask
+
+    def classes(self, text) -> set:
+        """Names of the classes found in text."""
+        mask = self.mask(text)
+        return {name for i, name in enumerate(self.names) if mask >> i & 1}
+
+    def matches(self, text) -> bool:
+        """True if text contains any synonym of the category."""
+        return self.mask(text) != 0
+
+
+def compile_patterns(patterns: list) -> dict:
+    """Compiles the categories of a patterns.json document.
+
+    Returns:
+        dict of Matcher's keyed by category.
+    """
+    matchers = {}
+    for category in patterns:
+        synonyms = [entry for entry in category['data'] if not isinstance(entry, dict)]
+        classes = [(category['category'], synonyms)] if synonyms else []
+        classes += [(entry['class'], entry['synonyms']) for entry in category['data'] if isinstance(entry, dict)]
+        matchers[category['category']] = Matcher(classes)
+    return matchers
+
+
+@lru_cache(maxsize=None)
+def get_matchers() -> dict:
+    """Matcher's of config/patterns.json, compiled on first use."""
+    return compile_patterns(jsonreader.get_patterns())
+
+
+def get_matcher(category: str) -> Matcher:
+    """Matcher of a patterns.json category, a category missing from the file matches nothing."""
+    matchers = get_matchers()
+    return matchers[category] if category in matchers else Matcher([])
@@ -0,0 +1,165 @@
+import csv
+import json
+import math
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+WAIT = 'wait'
+WORK = 'work'
+
+REPORT_FIELDS = ['phase', 'kind', 'count', 'total', 'mean', 'p50', 'p95', 'p99', 'max']
+
+
+def percentile(durations: list, percent: float) -> float:
+    """Nearest-rank percentile of sorted durations."""
+    if not durations:
+        return 0.0
+    rank = max(1, int(math.ceil(percent / 100 * len(durations))))
+    return durations[rank - 1]
+
+
+def union_length(intervals: list) -> float:
+    """Seconds covered by at least one of the (start, end) intervals, overlaps counted once."""
+    covered = 0.0
+    last_end = None
+    for start, end in sorted(intervals):
+        if last_end is None or start > last_end:
+            covered += end - start
+            last_end = end
+        elif end > last_end:
+            covered += end - last_end
+            last_end = end
+    return covered
+
+
+class RunMetrics:
+    """Timing spans of a crawl, aggregated into a per-phase latency report.
+
+    Spans are named after the crawler's log phases (Setup, Login, Start-Search, Search-Results, Coarse-Filter,
+    Fine-Filter) and after what the crawler blocks on: page loads, WebDriverWait's, random pauses and the rate limiter.
+    Every span is either working or waiting, phases contain the waits that happen during them. A single instance can be
+    shared by every Crawler of a run, the waits of concurrent workers then overlap in wall-clock time.
+
+    Attributes:
+        spans (dict): durations in seconds keyed by phase.
+        kinds (dict): WAIT or WORK keyed by phase.
+        waits (list of tuple): (start, end) perf_counter times of every wait span.
+        gauges (dict): sampled values, e.g. queue depths, keyed by name.
+        rows (int): number of input rows completed.
+        on_row (callable): called with the number of completed rows after every completed row, e.g. to report progress.
+    """
+
+    def __init__(self, on_row=None):
+        self.spans = {}
+        self.kinds = {}
+        self.waits = []
+        self.gauges = {}
+        self.rows = 0
+        self.started = perf_counter()
+        self.finished = None
+        self.lock = threading.Lock()
+        self.on_row = on_row
+
+    @contextmanager
+    def span(self, phase: str, kind: str = WORK):
+        """Times the body of a with statement, even if it raises."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, perf_counter() - start, kind)
+
+    def record(self, phase: str, seconds: float, kind: str = WORK, end: float = None) -> None:
+        """Records a span of seconds, ending at the perf_counter time end, now by default."""
+        end = perf_counter() if end is None else end
+        with self.lock:
+            self.spans.setdefault(phase, []).append(seconds)
+            self.kinds[phase] = kind
+            if kind == WAIT:
+                self.waits.append((end - seconds, end))
+
+    def sample(self, name: str, value: float) -> None:
+        """Records one observation of a gauge, e.g. the depth of a queue."""
+        with self.lock:
+            self.gauges.setdefault(name, []).append(value)
+
+    def gauge_total(self, name: str) -> float:
+        """Sum of the samples of a gauge, 0 if it has none."""
+        with self.lock:
+            return sum(self.gauges.get(name, []))
+
+    def row_done(self) -> None:
+        with self.lock:
+            self.rows += 1
+            rows = self.rows
+        if self.on_row is not None:
+            self.on_row(rows)
+
+    def elapsed(self) -> float:
+        """Seconds since the run started, until it finished."""
+        return (self.finished or perf_counter()) - self.started
+
+    def finish(self) -> None:
+        self.finished = perf_counter()
+
+    def report(self) -> dict:
+        """Aggregates the spans recorded so far.
+
+        Returns:
+            dict with:
+            - phases: one dict per phase with the count, total, mean, p50, p95, p99 and max durations.
+            - elapsed, waiting, working: wall-clock seconds of the whole run, of the time at least one worker was
+              waiting, and of the rest of it.
+            - wait_seconds: sum of every wait span, in worker-seconds, more than waiting when workers wait at once.
+            - rows, rows_per_hour: completed input rows and throughput.
+            - gauges: one dict per gauge with the count, mean and max of its samples.
+        """
+        with self.lock:
+            spans = {phase: sorted(durations) for phase, durations in self.spans.items()}
+            gauges = {name: list(values) for name, values in self.gauges.items()}
+            kinds = dict(self.kinds)
+            waits = list(self.waits)
+            rows = self.rows
+        elapsed = self.elapsed()
+        phases = []
+        for phase in sorted(spans):
+            durations = spans[phase]
+            total = sum(durations)
+            phases.append({'phase': phase, 'kind': kinds[phase], 'count': len(durations), 'total': total,
+                           'mean': total / len(durations), 'p50': percentile(durations, 50),
+                           'p95': percentile(durations, 95), 'p99': percentile(durations, 99),
+                           'max': durations[-1]})
+        waiting = union_length(waits)
+        wait_seconds = sum(entry['total'] for entry in phases if entry['kind'] == WAIT)
+        return {'phases': phases, 'elapsed': elapsed, 'waiting': waiting, 'working': max(0.0, elapsed - waiting),
+                'wait_seconds': wait_seconds, 'rows': rows, 'rows_per_hour': rows / elapsed * 3600 if elapsed else 0.0,
+                'gauges': [{'name': name, 'count': len(gauges[name]), 'mean': sum(gauges[name]) / len(gauges[name]),
+                            'max': max(gauges[name])} for name in sorted(gauges)]}
+
+    def to_json(self, path: str) -> None:
+        with open(path, 'w') as json_file:
+            json.dump(self.report(), json_file, indent=2)
+
+    def to_csv(self, path: str) -> None:
+        """Writes one line per phase, followed by the run totals."""
+        report = self.report()
+        with open(path, 'w', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(report['phases'])
+            for name in ('elapsed', 'waiting', 'working', 'wait_seconds', 'rows', 'rows_per_hour'):
+                writer.writerow({'phase': name, 'total': report[name]})
+
+    def summary(self) -> str:
+        """One line per phase, for the log."""
+        report = self.report()
+        lines = ['{:<16} {:<4} n={:<6} p50={:.3f}s p95={:.3f}s p99={:.3f}s total={:.1f}s'.format(
+            entry['phase'], entry['kind'], entry['count'], entry['p50'], entry['p95'], entry['p99'], entry['total'])
+            for entry in report['phases']]
+        lines.extend('{:<16} n={:<6} mean={:.1f} max={}'.format(
+            entry['name'], entry['count'], entry['mean'], entry['max']) for entry in report['gauges'])
+        lines.append('elapsed={:.1f}s waiting={:.1f}s working={:.1f}s wait_seconds={:.1f}s rows={} rows/hour={:.1f}'
+                     .format(report['elapsed'], report['waiting'], report['working'], report['wait_seconds'],
+                             report['rows'], report['rows_per_hour']))
+        return '\n'.join(lines)
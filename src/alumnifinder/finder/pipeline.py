@@ -0,0 +1,279 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from pandas import DataFrame, Series
+
+from src.alumnifinder import config
+from src.alumnifinder.excel.writer import ResultSink
+from src.alumnifinder.finder.crawler import Crawler
+from src.alumnifinder.finder.metrics import RunMetrics
+from src.alumnifinder.finder.planner import group_rows
+from src.alumnifinder.finder.throttle import RateLimiter
+from src.alumnifinder.finder.waits import AdaptiveWait
+
+logger = logging.getLogger(__name__)
+
+DONE = None  # end of stream marker, one per worker of the receiving stage
+
+
+class Work(NamedTuple('Work', [('index', int), ('row_number', int), ('row', Series), ('candidates', list),
+                               ('profiles', list), ('scores', list), ('output', list), ('crawled', bool),
+                               ('members', list)])):
+    """An input row on its way through the pipeline.
+
+    Attributes:
+        index (int): position of the row in the input, rows are written in this order.
+        row_number (int): spreadsheet row number.
+        row (pandas Series): input row.
+        candidates (list): Candidate's that survived the coarse-grain filter, only the ones opened once fetched.
+        profiles (list): Profile of every candidate.
+        scores (list): Score's of every candidate, a list with one Score per row of the Work once fetched, the Score
+            of the row once split up by the score stage.
+        output (list): output rows (dict) of the input row.
+        crawled (bool): False for rows restored from the journal.
+        members (list of Work): later rows of the same name, searched and fetched with this row, scored on their own.
+    """
+    __slots__ = ()
+
+
+class CrawlPipeline:
+    """Crawls input rows through stages connected by bounded queues: search, fetch, score and write.
+
+    read -> search (+ coarse filter) -> fetch (+ extract, pruning and scoring) -> score (output rows) -> write
+
+    Every stage runs a fixed number of workers on an asyncio event loop, blocking browser and scoring calls are run in a
+    thread executor. The search and fetch stages share a pool of browsers, so that a browser never idles while any row
+    needs one, and every queue holds at most queue_size rows, so that a slow stage holds back the stages upstream of it
+    instead of piling up rows in memory. Rows leave the pipeline in input order, through the journal if there is one.
+    Rows are planned by name first: the rows of a name travel as one Work, searched and fetched once, and are split up
+    again by the score stage. The fetch stage's pruner already scored every opened profile against every row of the
+    name, the score stage writes the output rows from those scores instead of scoring the profiles again.
+    Queue depths are sampled into the run metrics as "Queue:<stage>".
+
+    The stages run the Crawler's own methods, a Crawler with a driver per browser for search and fetch, and Crawler's
+    without a driver for scoring.
+
+    Args:
+        input_data (pandas DataFrame): rows to crawl.
+        output_data (ResultSink): collects the output rows.
+        kwargs (dict): arguments passed to every Crawler, e.g. geolocation, job_position, caches.
+        - browsers (int): number of browsers, also the number of search and of fetch workers.
+        - score_workers (int): number of score workers.
+        - queue_size (int): capacity of every queue, twice the number of browsers by default.
+        - start_row (int): spreadsheet row number of the first input row.
+        - rate (float): page loads per second of the whole pipeline.
+        - crawler_class (type): Crawler implementation run by the workers.
+        - cancel (threading.Event): once set, no more rows enter the pipeline, the rows in it are finished and written.
+
+    Attributes:
+        crawlers (list of Crawler): one Crawler per browser.
+        scorers (list of Crawler): one Crawler per score worker.
+        metrics (RunMetrics): timing spans and queue depths of the run.
+    """
+
+    def __init__(self, input_data: DataFrame, output_data: ResultSink, **kwargs):
+        self.input_data = input_data
+        self.output_data = output_data
+        crawler_class = kwargs.pop('crawler_class', Crawler)
+        browsers = max(1, int(kwargs.pop('browsers', 1)))
+        score_workers = max(1, int(kwargs.pop('score_workers', 1)))
+        self.queue_size = int(kwargs.pop('queue_size', 2 * browsers))
+        self.start_row = int(kwargs.pop('start_row', 2))
+        rate = kwargs.pop('rate', config.request_rate)
+        kwargs.setdefault('rate_limiter', RateLimiter(rate, burst=browsers))
+        kwargs.setdefault('metrics', RunMetrics())
+        kwargs.setdefault('waits', AdaptiveWait(kwargs['metrics']))
+        self.metrics = kwargs['metrics']
+        self.journal = kwargs['journal'] if 'journal' in kwargs else None
+        self.cancel = kwargs['cancel'] if 'cancel' in kwargs else None
+        self.crawlers = [crawler_class(input_data=input_data, output_data=ResultSink(output_data.columns), **kwargs)
+                         for _ in range(browsers)]
+        self.scorers = [crawler_class(input_data=input_data, output_data=ResultSink(output_data.columns), **kwargs)
+                        for _ in range(score_workers)]
+        self.loop = None
+        self.executor = None
+        self.browsers = None  # idle crawlers with a driver
+        self.idle_scorers = None
+        self.writing = None  # queue of the write stage, also fed directly by the read and search stages
+
+    def crawl_linkedin(self) -> None:
+        """Crawls every input row and writes the results in input row order."""
+        logger.debug('Pipeline: Crawling {} row(s) with {} browser(s)...'.format(len(self.input_data),
+                                                                                   len(self.crawlers)))
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)  # queues find their loop through get_event_loop on every Python version
+        self.executor = ThreadPoolExecutor(max_workers=len(self.crawlers) + len(self.scorers))
+        try:
+            self.loop.run_until_complete(self.run())
+        finally:
+            self.executor.shutdown()
+            self.loop.close()
+            asyncio.set_event_loop(None)
+        self.metrics.finish()
+        logger.debug('Pipeline: Crawling complete\n{}'.format(self.metrics.summary()))
+
+    def call(self, function, *args):
+        """Runs a blocking call in the executor."""
+        return self.loop.run_in_executor(self.executor, function, *args)
+
+    async def run(self) -> None:
+        browsers, scorers = len(self.crawlers), len(self.scorers)
+        self.browsers = asyncio.Queue()
+        self.idle_scorers = asyncio.Queue()
+        for scorer in self.scorers:
+            self.idle_scorers.put_nowait(scorer)
+        searching = asyncio.Queue(self.queue_size)
+        fetching = asyncio.Queue(self.queue_size)
+        scoring = asyncio.Queue(self.queue_size)
+        self.writing = asyncio.Queue(self.queue_size)
+        tasks = []
+        try:
+            await asyncio.gather(*[self.call(crawler.start_session) for crawler in self.crawlers])
+            for crawler in self.crawlers:
+                self.browsers.put_nowait(crawler)
+            tasks = [asyncio.ensure_future(stage) for stage in (
+                self.read(searching, browsers),
+                self.stage('Search', searching, fetching, self.search, browsers, browsers),
+                self.stage('Fetch', fetching, scoring, self.fetch, browsers, scorers),
+                self.stage('Score', scoring, self.writing, self.score, scorers, 1),
+                self.write())]
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()  # a failed stage would otherwise leave the others blocked on its queues
+            raise
+        finally:
+            await asyncio.gather(*[self.call(crawler.close_session) for crawler in self.crawlers if crawler.driver])
+
+    async def read(self, outbox: asyncio.Queue, downstream: int) -> None:
+        """Feeds the input rows to the search stage, one Work per name in order of first occurrence.
+
+        Rows completed in the journal go straight to the write stage.
+        """
+        groups = group_rows(self.input_data)
+        logger.debug('Pipeline: Planned {} search(es) for {} row(s)'.format(len(groups), len(self.input_data)))
+        for group in groups:
+            if self.cancel is not None and self.cancel.is_set():
+                logger.debug('Pipeline: Cancelled, no more rows are read')
+                break
+            rows = []
+            for index in group:
+                row_number = self.start_row + index
+                row = self.input_data.iloc[index]
+                if self.journal is not None and self.journal.completed(row_number):
+                    await self.writing.put(Work(index, row_number, row, [], [], [], self.journal.output(row_number),
+                                                False, []))
+                else:
+                    rows.append(Work(index, row_number, row, [], [], [], [], True, []))
+            if rows:
+                await outbox.put(rows[0]._replace(members=rows[1:]))
+        for _ in range(downstream):
+            await outbox.put(DONE)
+
+    async def stage(self, name: str, inbox: asyncio.Queue, outbox: asyncio.Queue, handle, workers: int,
+                    downstream: int) -> None:
+        """Runs workers handling the rows of inbox until each got a DONE, then sends DONE downstream.
+
+        Args:
+            handle (coroutine function): returns the row to pass on to outbox, or None if it was passed on already.
+        """
+        async def worker():
+            while True:
+                work = await inbox.get()
+                if work is DONE:
+                    return
+                self.metrics.sample('Queue:{}'.format(name), inbox.qsize())
+                work = await handle(work)
+                if work is not None:
+                    await outbox.put(work)
+
+        await asyncio.gather(*[worker() for _ in range(workers)])
+        for _ in range(downstream):
+            await outbox.put(DONE)
+
+    async def on_browser(self, function, *args):
+        """Runs function(crawler, *args) in the executor on the first idle browser."""
+        crawler = await self.browsers.get()
+        try:
+            return await self.call(function, crawler, *args)
+        finally:
+            self.browsers.put_nowait(crawler)
+
+    async def search(self, work: Work):
+        candidates = await self.on_browser(search_row, work.row)
+        if not candidates:
+            for row in [work] + work.members:
+                await self.writing.put(row._replace(members=[]))  # nothing to fetch or score, no output
+            return None
+        return work._replace(candidates=candidates)
+
+    async def fetch(self, work: Work) -> Work:
+        """Opens the candidates worth opening for every row of the Work, the others are dropped."""
+        candidates, profiles, scores = await self.on_browser(open_candidates, work)
+        return work._replace(candidates=candidates, profiles=profiles, scores=scores)
+
+    async def score(self, work: Work) -> Work:
+        """Outputs every row of the Work from the fetch stage's scores, later rows of the name are written directly."""
+        scored = []
+        for i, row in enumerate([work] + work.members):
+            scorer = await self.idle_scorers.get()
+            try:
+                output = await self.call(score_row, scorer, row._replace(
+                    candidates=work.candidates, profiles=work.profiles,
+                    scores=[row_scores[i] for row_scores in work.scores]))
+            finally:
+                self.idle_scorers.put_nowait(scorer)
+            scored.append(row._replace(output=output, members=[]))
+        for row in scored[1:]:
+            await self.writing.put(row)
+        return scored[0]
+
+    async def write(self) -> None:
+        """Writes the rows to the output and journal in input order, as soon as every row before them is written.
+
+        Runs until the score stage is done, rows left behind a gap by a cancelled run are written last, in order.
+        """
+        done = {}
+        next_index = 0
+        while True:
+            work = await self.writing.get()
+            if work is DONE:
+                break
+            self.metrics.sample('Queue:Write', self.writing.qsize())
+            done[work.index] = work
+            while next_index in done:
+                self.write_row(done.pop(next_index))
+                next_index += 1
+        for index in sorted(done):
+            self.write_row(done[index])
+
+    def write_row(self, work: Work) -> None:
+        for record in work.output:
+            self.output_data.append(record)
+        if work.crawled:
+            if self.journal is not None:
+                self.journal.record(work.row_number, work.output)
+            self.metrics.row_done()
+
+
+def search_row(crawler: Crawler, row: Series) -> list:
+    crawler.set_search(row)
+    return crawler.search_candidates()
+
+
+def open_candidates(crawler: Crawler, work: Work) -> tuple:
+    rows = [work] + work.members
+    with crawler.metrics.span('Fetch'):
+        return crawler.open_candidates(work.candidates, [row.row for row in rows], [row.row_number for row in rows])
+
+
+def score_row(scorer: Crawler, work: Work) -> list:
+    """Scores the candidates of a row with a Crawler without a driver, returns the output rows."""
+    scorer.output_data = ResultSink(scorer.output_data.columns)
+    scorer.row_counter = work.row_number
+    scorer.mark_row(work.row)
+    with scorer.metrics.span('Score'):
+        scorer.score_candidates(work.candidates, work.profiles, work.row, work.scores)
+    return scorer.output_data.records
@@ -0,0 +1,29 @@
+from collections import OrderedDict
+
+from pandas import DataFrame
+
+
+def name_key(first_name, last_name) -> tuple:
+    """Normalized (first, last) name, the rows of a key share a single search."""
+    return tuple(' '.join(str(name).lower().split()) for name in (first_name, last_name))
+
+
+def name_keys(rows: DataFrame) -> list:
+    """name_key of every row, in row order."""
+    return [name_key(first, last) for first, last in zip(rows['FIRST_NAME'].values, rows['LAST_NAME'].values)]
+
+
+def group_rows(rows: DataFrame) -> list:
+    """Groups rows by normalized name.
+
+    Exports list the same person several times, and distinct alumni often share a name, but the search results and
+    candidate profiles only depend on the name. The rows of a group are thus searched and their candidates fetched once,
+    then every row is scored against the same profiles.
+
+    Returns:
+        list of groups in order of first occurrence, each a list of the 0-based positions of its rows in rows.
+    """
+    groups = OrderedDict()
+    for position, key in enumerate(name_keys(rows)):
+        groups.setdefault(key, []).append(position)
+    return list(groups.values())
@@ -0,0 +1,8 @@
+from src.alumnifinder.utils import resources
+
+
+def pool_size(workers: int, rows: int, memory_per_worker: int = resources.DRIVER_MEMORY) -> int:
+    """Number of workers to run, auto-sized from CPU count and available memory when workers is 0."""
+    if not workers:
+        workers = resources.max_workers(memory_per_worker)
+    return max(1, min(workers, rows))
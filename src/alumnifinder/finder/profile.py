@@ -0,0 +1,324 @@
+import json
+from html.parser import HTMLParser
+from typing import List, NamedTuple
+
+
+class Candidate(NamedTuple('Candidate', [('name', str), ('link', str), ('headline', str), ('location', str)])):
+    """A search result that survived the coarse-grain filter.
+
+    Attributes:
+        name (str): full name on LinkedIn.
+        link (str): profile link.
+        headline (str): headline of the search result card, usually the current title and company, empty if unknown.
+        location (str): location of the search result card, empty if unknown.
+    """
+    __slots__ = ()
+
+    @property
+    def has_card(self) -> bool:
+        """False for search results cached before cards were read, their card is unknown rather than a poor match."""
+        return bool(self.headline or self.location)
+
+
+Candidate.__new__.__defaults__ = ('', '')  # search results cached before cards were read only have a name and link
+
+
+class Job(NamedTuple('Job', [('title', str), ('info', List[str])])):
+    """A single entry of the experience section of a profile.
+
+    Attributes:
+        title (str): job title, the text of the entry's "h3".
+        info (list of str): text of every "h4" of the entry, e.g. "Company Name\\nIBM", "Location\\nBuffalo, NY".
+    """
+    __slots__ = ()
+
+    @property
+    def company(self) -> str:
+        """Company name, with the "Company Name" label removed."""
+        return self.field('Company Name')
+
+    @property
+    def location(self) -> str:
+        """Work location, with the "Location" label removed."""
+        return self.field('Location')
+
+    @property
+    def description(self) -> str:
+        """All job info, newline separated, the way it is displayed on the page."""
+        return ''.join(text + '\n' for text in self.info)
+
+    def field(self, label: str) -> str:
+        """Finds the "h4" starting with label and returns the text after it."""
+        for text in self.info:
+            if text.startswith(label):
+                return text[len(label) + 1:].replace('\n', '')
+        return ''
+
+
+class Education(NamedTuple('Education', [('school', str), ('items', List[str]), ('years', List[str])])):
+    """A single entry of the education section of a profile.
+
+    Attributes:
+        school (str): school name, the text of the entry's "h3".
+        items (list of str): degree, major and other "pv-entity__comma-item" texts.
+        years (list of str): text of the "time" tags, i.e. attendance start and end years.
+    """
+    __slots__ = ()
+
+    @property
+    def degree(self) -> str:
+        """Degree text, (the first comma item)."""
+        return self.items[0] if self.items else ''
+
+    @property
+    def major(self) -> str:
+        """Major text, (every comma item after the degree)."""
+        return ', '.join(self.items[1:])
+
+    @property
+    def details(self) -> str:
+        """Degree and major text concatenated, the way the crawler has always matched them."""
+        return ''.join(self.items)
+
+    @property
+    def grad_year(self) -> str:
+        """Graduation year, the last "time" tag of the entry."""
+        return self.years[-1] if self.years else ''
+
+
+class Profile(NamedTuple('Profile', [('jobs', List[Job]), ('educations', List[Education])])):
+    """Typed record of everything the crawler needs from a single profile page.
+
+    Attributes:
+        jobs (list of Job): experience section, latest job first.
+        educations (list of Education): education section, in page order.
+    """
+    __slots__ = ()
+
+    @property
+    def titles(self) -> list:
+        return [job.title for job in self.jobs]
+
+    @property
+    def companies(self) -> list:
+        return [job.company for job in self.jobs]
+
+    @property
+    def locations(self) -> list:
+        return [job.location for job in self.jobs]
+
+    @property
+    def schools(self) -> list:
+        return [education.school for education in self.educations]
+
+    @property
+    def degrees(self) -> list:
+        return [education.degree for education in self.educations]
+
+    @property
+    def majors(self) -> list:
+        return [education.major for education in self.educations]
+
+    @property
+    def years(self) -> list:
+        return [education.grad_year for education in self.educations]
+
+
+class ProfileParser(HTMLParser):
+    """Parses a profile page source into a Profile in a single pass.
+
+    Only the markup that the crawler targets is collected, everything else is skipped:
+    - <a data-control-name="background_details_company">: a job, "h3" is the title, every "h4" is job info.
+    - <a data-control-name="background_details_school">: an education, "h3" is the school name, elements of class
+      "pv-entity__comma-item" hold the degree/major and "time" tags hold the years.
+
+    Text of nested tags is joined with newlines, which is how Selenium's WebElement.text renders them.
+    """
+    JOB = 'background_details_company'
+    SCHOOL = 'background_details_school'
+    VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source',
+                 'track', 'wbr'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.jobs = []
+        self.educations = []
+        self.section = None  # JOB, SCHOOL or None
+        self.section_depth = 0
+        self.depth = 0
+        self.field = None  # name of the field currently collecting text
+        self.field_depth = 0
+        self.chunks = []
+        self.entry = {}
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            return
+        self.depth += 1
+        attributes = dict(attrs)
+        if self.section is None:
+            if tag == 'a' and attributes.get('data-control-name') in (self.JOB, self.SCHOOL):
+                self.section = attributes['data-control-name']
+                self.section_depth = self.depth
+                self.entry = {'h3': [], 'h4': [], 'item': [], 'time': []}
+            return
+        if self.field is None:
+            classes = (attributes.get('class') or '').split()
+            if tag in ('h3', 'h4', 'time'):
+                self.field = tag
+            elif 'pv-entity__comma-item' in classes:
+                self.field = 'item'
+            if self.field is not None:
+                self.field_depth = self.depth
+                self.chunks = []
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS:
+            return
+        if self.field is not None and self.depth == self.field_depth:
+            self.entry[self.field].append('\n'.join(self.chunks))
+            self.field = None
+        if self.section is not None and self.depth == self.section_depth:
+            self.end_section()
+        self.depth -= 1
+
+    def handle_data(self, data):
+        if self.field is not None:
+            text = ' '.join(data.split())
+            if text:
+                self.chunks.append(text)
+
+    def end_section(self):
+        title = self.entry['h3'][0] if self.entry['h3'] else ''
+        if self.section == self.JOB:
+            self.jobs.append(Job(title, self.entry['h4']))
+        else:
+            self.educations.append(Education(title, self.entry['item'], self.entry['time']))
+        self.section = None
+
+    def profile(self) -> Profile:
+        return Profile(self.jobs, self.educations)
+
+
+def parse_profile(page_source: str) -> Profile:
+    """Parses the page source of a profile into a Profile record.
+
+    Args:
+        page_source (str): HTML of a profile page, (WebDriver.page_source).
+
+    Returns:
+        Profile holding all jobs and educations found on the page, both may be empty.
+    """
+    parser = ProfileParser()
+    parser.feed(page_source)
+    parser.close()
+    return parser.profile()
+
+
+class SearchResultParser(HTMLParser):
+    """Parses a search results page source into a Candidate per search result card, in a single pass.
+
+    A card is a "div" of class "search-result__info": its first "a" holds the profile link, the "span" of the first
+    "span" of its "h3" holds the full name, (the crawler's former "//h3[@id=...]/span[1]/span" XPath), and the elements
+    of class "subline-level-1" and "subline-level-2" hold the headline and the location. Text is joined the way
+    ProfileParser joins it.
+    """
+    CARD = 'search-result__info'
+    FIELDS = {'subline-level-1': 'headline', 'subline-level-2': 'location'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cards = []
+        self.card = None
+        self.card_depth = 0
+        self.depth = 0
+        self.h3_depth = 0  # depth of the card's "h3", 0 outside of it
+        self.name_span = None  # depth of the first "span" of the "h3" while inside it, 0 once it is closed
+        self.field = None
+        self.field_depth = 0
+        self.chunks = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ProfileParser.VOID_TAGS:
+            return
+        self.depth += 1
+        attributes = dict(attrs)
+        classes = (attributes.get('class') or '').split()
+        if self.card is None:
+            if tag == 'div' and self.CARD in classes:
+                self.card = {'name': None, 'link': None, 'headline': '', 'location': ''}
+                self.card_depth = self.depth
+            return
+        if tag == 'a' and self.card['link'] is None:
+            self.card['link'] = attributes.get('href') or ''
+        elif tag == 'h3' and not self.h3_depth and self.card['name'] is None:
+            self.h3_depth = self.depth
+        elif tag == 'span' and self.h3_depth and self.field is None:
+            if self.name_span is None and self.depth == self.h3_depth + 1:
+                self.name_span = self.depth
+            elif self.name_span and self.depth == self.name_span + 1 and self.card['name'] is None:
+                self.start_field('name')
+        if self.field is None:
+            for class_name in classes:
+                if class_name in self.FIELDS:
+                    self.start_field(self.FIELDS[class_name])
+                    break
+
+    def handle_endtag(self, tag):
+        if tag in ProfileParser.VOID_TAGS:
+            return
+        if self.field is not None and self.depth == self.field_depth:
+            self.card[self.field] = '\n'.join(self.chunks)
+            self.field = None
+        if self.name_span and self.depth == self.name_span:
+            self.name_span = 0
+        if self.h3_depth and self.depth == self.h3_depth:
+            self.h3_depth = 0
+            self.name_span = None
+        if self.card is not None and self.depth == self.card_depth:
+            self.cards.append(self.card)
+            self.card = None
+        self.depth -= 1
+
+    def handle_data(self, data):
+        if self.field is not None:
+            text = ' '.join(data.split())
+            if text:
+                self.chunks.append(text)
+
+    def start_field(self, field: str) -> None:
+        self.field = field
+        self.field_depth = self.depth
+        self.chunks = []
+
+    def candidates(self) -> list:
+        return [Candidate(card['name'], card['link'], card['headline'], card['location']) for card in self.cards
+                if card['name'] is not None and card['link']]
+
+
+def parse_search_results(page_source: str) -> list:
+    """Parses the page source of search results into Candidate's.
+
+    Args:
+        page_source (str): HTML of a search results page, (WebDriver.page_source).
+
+    Returns:
+        Candidate of every search result card with a name and a profile link, in page order, links as written in the
+        page, (usually relative to the site).
+    """
+    parser = SearchResultParser()
+    parser.feed(page_source)
+    parser.close()
+    return parser.candidates()
+
+
+def dump_profile(profile: Profile) -> str:
+    """Serializes a Profile record to a JSON string."""
+    return json.dumps({'jobs': [list(job) for job in profile.jobs],
+                       'educations': [list(education) for education in profile.educations]})
+
+
+def load_profile(text: str) -> Profile:
+    """Deserializes a Profile record from a JSON string made by dump_profile."""
+    data = json.loads(text)
+    return Profile([Job(*job) for job in data['jobs']], [Education(*education) for education in data['educations']])
@@ -0,0 +1,151 @@
+"""Candidate pruning, search result cards are ranked before any candidate profile is opened.
+
+A search returns every person whose name contains the searched name, and opening their profiles is most of the page
+loads of a row. The search result cards already show each candidate's headline (current title and company) and
+location, so candidates are pre-scored on their card with scoring.score_card, then only the best ranked ones are opened:
+
+- the top_k best cards are opened, and any card scoring at least threshold,
+- candidates without a card, e.g. search results cached before cards were read, are always opened,
+- the best card is opened first, on its own, and no more profiles are opened once every row searched has a profile
+  with an accuracy score of at least confident.
+
+Every decision is kept, see Decision and AuditLog, so that pruned candidates can be reviewed, and the run summary counts
+the candidates pruned and skipped. The accuracy scores of the opened profiles are returned too, they are not scored
+again.
+"""
+import json
+import threading
+from typing import NamedTuple
+
+from src.alumnifinder import config
+from src.alumnifinder.finder import scoring
+from src.alumnifinder.finder.profile import Candidate
+
+OPENED = 'opened'
+PRUNED = 'pruned'  # card scored too low
+SKIPPED = 'skipped'  # not opened, a candidate opened before it was a confident match
+
+
+class Decision(NamedTuple('Decision', [('rank', int), ('candidate', Candidate), ('card', scoring.CardScore),
+                                       ('action', str), ('score', int)])):
+    """Pruning decision of a single candidate.
+
+    Attributes:
+        rank (int): 0-based rank of the candidate's card, best first.
+        candidate (Candidate): search result.
+        card (CardScore): card pre-score, of the row it scored best against.
+        action (str): OPENED, PRUNED or SKIPPED.
+        score (int): best accuracy score of an opened candidate, None if it was not opened.
+    """
+    __slots__ = ()
+
+    def record(self) -> dict:
+        """JSON serializable decision, for the audit log."""
+        return {'rank': self.rank, 'name': self.candidate.name, 'link': self.candidate.link,
+                'headline': self.candidate.headline, 'location': self.candidate.location,
+                'card': dict(self.card._asdict()), 'card_score': self.card.total, 'action': self.action,
+                'score': self.score}
+
+
+class Pruner:
+    """Decides which candidates of a search are opened, from their cards and from the profiles opened so far.
+
+    Args:
+        top_k (int): best ranked candidates always opened, 0 opens every candidate.
+        threshold (int): candidates with a card score of at least threshold are opened too.
+        confident (int): accuracy score that stops opening candidates, 0 never stops early.
+        job_position (str): searched job position, empty to skip.
+        geolocation (str): searched region, empty to skip.
+    """
+
+    def __init__(self, top_k: int = config.prune_top_k, threshold: int = config.prune_threshold,
+                 confident: int = config.confident_score, job_position: str = "", geolocation: str = ""):
+        self.top_k = top_k
+        self.threshold = threshold
+        self.confident = confident
+        self.job_position = job_position
+        self.geolocation = geolocation
+
+    def rank(self, candidates: list, rows: list) -> list:
+        """Ranks candidates by card score, best first, ties in search result order.
+
+        Args:
+            rows (list): alumni rows searched, a card is ranked by the row it scores best against.
+
+        Returns:
+            list of (search result position, Candidate, CardScore).
+        """
+        ranked = []
+        for position, candidate in enumerate(candidates):
+            cards = [scoring.score_card(row, candidate, self.job_position, self.geolocation) for row in rows]
+            ranked.append((position, candidate, max(cards, key=lambda card: card.total)))
+        return sorted(ranked, key=lambda entry: (-entry[2].total, entry[0]))
+
+    def selected(self, rank: int, candidate: Candidate, card: scoring.CardScore) -> bool:
+        """True if a candidate of this rank and card score is worth opening, a candidate without a card always is."""
+        return self.top_k <= 0 or rank < self.top_k or card.total >= self.threshold or not candidate.has_card
+
+    def open(self, candidates: list, rows: list, fetch, batch_size: int = 1) -> tuple:
+        """Opens the selected candidates, best ranked first, until every row has a confident match.
+
+        Args:
+            candidates (list): Candidate's that survived the coarse-grain filter.
+            rows (list): alumni rows searched, every row of the name.
+            fetch (callable): returns the Profile of every link of a list, e.g. Crawler.fetch_profiles.
+            batch_size (int): candidates fetched at once after the best ranked one, e.g. the number of browser tabs.
+
+        Returns:
+            (Candidate's opened, their Profile's, Decision of every candidate, Score's of every opened candidate), the
+            Score's of a candidate are a list with one Score per row, candidates in search result order.
+        """
+        ranked = self.rank(candidates, rows)
+        selected = [entry for rank, entry in enumerate(ranked) if self.selected(rank, entry[1], entry[2])]
+        profiles = {}
+        scores = {}
+        matched = set()  # rows with a confident match
+        size = max(1, batch_size)
+        batches = [selected[:1]] + [selected[i:i + size] for i in range(1, len(selected), size)]
+        for batch in batches:
+            if not batch or (self.confident > 0 and len(matched) == len(rows)):
+                break
+            for (position, candidate, _), profile in zip(batch, fetch([entry[1].link for entry in batch])):
+                profiles[position] = profile
+                scores[position] = [scoring.score_profile(row, profile, self.job_position, self.geolocation)
+                                    for row in rows]
+                matched.update(i for i, score in enumerate(scores[position]) if score.total >= self.confident)
+        decisions = []
+        for rank, (position, candidate, card) in enumerate(ranked):
+            if position in profiles:
+                action = OPENED
+            else:
+                action = SKIPPED if self.selected(rank, candidate, card) else PRUNED
+            best = max(score.total for score in scores[position]) if position in scores else None
+            decisions.append(Decision(rank, candidate, card, action, best))
+        opened = sorted(profiles)
+        return ([candidates[position] for position in opened], [profiles[position] for position in opened], decisions,
+                [scores[position] for position in opened])
+
+
+class AuditLog:
+    """JSON Lines log of the pruning decisions of a run, one line per name searched.
+
+    Each line holds the spreadsheet row numbers of the name and the Decision of every candidate found for it.
+
+    Args:
+        path (str): path of the log file.
+        resume (bool): append to an existing log, otherwise the log starts empty.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.lock = threading.Lock()  # shared by every worker of a run
+        self.file = open(path, 'a' if resume else 'w')
+
+    def record(self, row_numbers: list, decisions: list) -> None:
+        line = json.dumps({'rows': row_numbers, 'decisions': [decision.record() for decision in decisions]}) + '\n'
+        with self.lock:
+            self.file.write(line)
+
+    def close(self) -> None:
+        with self.lock:
+            self.file.close()
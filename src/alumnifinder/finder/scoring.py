@@ -0,0 +1,254 @@
+import re
+from typing import NamedTuple
+
+from src.alumnifinder.finder.matcher import DEGREES, MAJORS, SCHOOLS, get_matcher
+from src.alumnifinder.finder.profile import Candidate, Profile
+
+NON_WORD = re.compile(r'\W')
+
+# suffix of the columns batch.prepare_rows adds to the input rows, the normalized text or integer year of a column
+NORMALIZED = '_NORMALIZED'
+TEXT_COLUMNS = ['WORK_TITLE', 'WORK_COMPANY_NAME1'] + ['{}{}'.format(column, i) for i in range(1, 4)
+                                                       for column in ('DEGREE_CODE', 'MAJOR')]
+YEAR_COLUMNS = ['DEGREE_YEAR{}'.format(i) for i in range(1, 4)]
+
+
+class Score(NamedTuple('Score', [('job_title', int), ('company', int), ('position', int), ('location', int),
+                                 ('school', int), ('degree', int), ('major', int), ('grad_year', int)])):
+    """Accuracy score breakdown of a single (alumni row, profile) pair.
+
+    Attributes:
+        job_title (int): job titles matching the spreadsheet's WORK_TITLE.
+        company (int): companies matching the spreadsheet's WORK_COMPANY_NAME1.
+        position (int): 1 if the latest job title matches the searched job position.
+        location (int): 1 if the latest job info contains the searched geolocation.
+        school (int): school name matches.
+        degree (int): degree matches.
+        major (int): major matches.
+        grad_year (int): graduation year matches.
+    """
+    __slots__ = ()
+
+    @property
+    def jobs(self) -> int:
+        return self.job_title + self.company + self.position + self.location
+
+    @property
+    def degrees(self) -> int:
+        return self.school + self.degree + self.major + self.grad_year
+
+    @property
+    def total(self) -> int:
+        return self.jobs + self.degrees
+
+
+class CardScore(NamedTuple('CardScore', [('job_title', int), ('company', int), ('position', int), ('location', int),
+                                         ('school', int)])):
+    """Pre-score breakdown of a search result card, from its headline and location only.
+
+    Attributes:
+        job_title (int): 1 if the headline contains the spreadsheet's WORK_TITLE.
+        company (int): 1 if the headline contains the spreadsheet's WORK_COMPANY_NAME1.
+        position (int): 1 if the headline contains the searched job position.
+        location (int): 1 if the card location contains the searched geolocation.
+        school (int): 1 if the headline names the school, e.g. "Student at University at Buffalo".
+    """
+    __slots__ = ()
+
+    @property
+    def total(self) -> int:
+        return self.job_title + self.company + self.position + self.location + self.school
+
+
+def convert_str(str_input: str) -> str:
+    """helper function to remove all non-alphabet characters in given string, and convert it to lower case"""
+    return NON_WORD.sub('', str_input).lower()
+
+
+def check_school(str_input: str) -> bool:
+    """Check school name with all possible synonyms, the "schoolnames" of patterns.json"""
+    return get_matcher(SCHOOLS).matches(str_input)
+
+
+def match_degree(web_mask: int, sheet_mask: int, web_text: str, sheet_text: str) -> bool:
+    """check degree by class masks, then by normalized text
+
+    A web degree of a class of patterns.json (e.g. science) only matches sheet degrees of the same class, any other web
+    degree must contain the sheet degree.
+    """
+    if web_mask:
+        return bool(web_mask & sheet_mask)
+    return sheet_text in web_text
+
+
+def match_major(web_mask: int, sheet_mask: int, web_text: str, sheet_text: str) -> bool:
+    """check major by normalized text, or by a class of patterns.json both share"""
+    return bool(web_mask & sheet_mask) or sheet_text in web_text
+
+
+def check_degree(text_from_web: str, text_from_sheet: str) -> bool:
+    """check if degree matches, with the "degrees" classes of patterns.json"""
+    degrees = get_matcher(DEGREES)
+    return match_degree(degrees.mask(text_from_web), degrees.mask(text_from_sheet), convert_str(text_from_web),
+                        convert_str(text_from_sheet))
+
+
+def check_major(text_from_web: str, text_from_sheet: str) -> bool:
+    """check major, with the "majors" classes of patterns.json"""
+    majors = get_matcher(MAJORS)
+    return match_major(majors.mask(text_from_web), majors.mask(text_from_sheet), convert_str(text_from_web),
+                       convert_str(text_from_sheet))
+
+
+def check_gradyear(year_from_web: int, year_from_sheet: int) -> bool:
+    """check graduation year, a missing year (0) never matches"""
+    return bool(year_from_sheet) and year_from_web == year_from_sheet
+
+
+def sheet_str(value) -> str:
+    """Normalized spreadsheet cell, empty cells (NaN, None, '') become an empty string."""
+    return convert_str(value) if type(value) is str and value else ""
+
+
+def sheet_year(value) -> int:
+    """Year cell (e.g. 2003, 2003.0 or "2003") as an int, 0 if it is empty or not a number."""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def row_str(row, column: str) -> str:
+    """Normalized text cell of an alumni row, precomputed by batch.prepare_rows when the row has it."""
+    normalized = column + NORMALIZED
+    return row[normalized] if normalized in row else sheet_str(row[column])
+
+
+def row_year(row, column: str) -> int:
+    """Year cell of an alumni row as an int, precomputed by batch.prepare_rows when the row has it."""
+    normalized = column + NORMALIZED
+    return row[normalized] if normalized in row else sheet_year(row[column])
+
+
+def contains(text: str, term: str) -> int:
+    """1 if the normalized text contains the normalized, non-empty term."""
+    return int(bool(term) and term in text)
+
+
+def score_card(row, candidate: Candidate, job_position: str = "", geolocation: str = "") -> CardScore:
+    """Pre-scores a search result card against an alumni row, before its profile is opened.
+
+    Args:
+        row (pandas Series or dict): alumni row, indexed by spreadsheet column name.
+        candidate (Candidate): search result, with the headline and location of its card.
+        job_position (str): searched job position, empty to skip.
+        geolocation (str): searched region, empty to skip.
+
+    Returns:
+        CardScore breakdown, a card without a headline or location scores 0.
+    """
+    headline = convert_str(candidate.headline)
+    return CardScore(contains(headline, row_str(row, 'WORK_TITLE')),
+                     contains(headline, row_str(row, 'WORK_COMPANY_NAME1')),
+                     contains(headline, convert_str(job_position)),
+                     contains(convert_str(candidate.location), convert_str(geolocation)),
+                     int(check_school(candidate.headline)))
+
+
+def score_jobs(row, profile: Profile, job_position: str = "", geolocation: str = "") -> dict:
+    """Scores the experience section of a profile against an alumni row.
+
+    Args:
+        row (pandas Series or dict): alumni row, indexed by spreadsheet column name.
+        profile (Profile): extracted profile record.
+        job_position (str): searched job position, empty to skip.
+        geolocation (str): searched region, empty to skip.
+
+    Returns:
+        dict of the job related Score fields.
+    """
+    scores = {'job_title': 0, 'company': 0, 'position': 0, 'location': 0}
+    if not profile.jobs:
+        return scores
+
+    job_title_from_excel = row_str(row, 'WORK_TITLE')
+    job_company_from_excel = row_str(row, 'WORK_COMPANY_NAME1')
+    # an empty job on record is simply replaced with the latest job, nothing to match against
+    if job_title_from_excel:
+        for job in profile.jobs:
+            job_title_sub = convert_str(job.title)
+            if job_title_sub in job_title_from_excel or job_title_from_excel in job_title_sub:
+                scores['job_title'] += 1
+            company_name_sub = convert_str(job.company)
+            if job_company_from_excel in company_name_sub or company_name_sub in job_company_from_excel:
+                scores['company'] += 1
+
+    # match search keywords with the latest job
+    latest_job = profile.jobs[0]
+    if job_position and convert_str(latest_job.title) in convert_str(job_position):
+        scores['position'] = 1
+    if geolocation and convert_str(geolocation) in convert_str(latest_job.description):
+        scores['location'] = 1
+    return scores
+
+
+def score_degrees(row, profile: Profile) -> dict:
+    """Scores the education section of a profile against an alumni row.
+
+    Each of the 3 school columns in the input spreadsheet is matched with every education of the profile. Education
+    texts are classified by the patterns.json matchers once, before the loop.
+
+    Args:
+        row (pandas Series or dict): alumni row, indexed by spreadsheet column name.
+        profile (Profile): extracted profile record.
+
+    Returns:
+        dict of the education related Score fields.
+    """
+    scores = {'school': 0, 'degree': 0, 'major': 0, 'grad_year': 0}
+    if not profile.educations:
+        return scores
+
+    schools, degrees, majors = get_matcher(SCHOOLS), get_matcher(DEGREES), get_matcher(MAJORS)
+    educations = []
+    for education in profile.educations:
+        text = ', '.join(education.items)  # details glue the items together, words must stay apart for the matchers
+        educations.append((schools.mask(education.school) != 0, convert_str(education.details), degrees.mask(text),
+                           majors.mask(text), sheet_year(education.grad_year)))
+    for i in range(1, 4):
+        school_col = row['SCHOOL{}'.format(i)]
+        # check current school_col value is a non-empty string, not other type
+        if not (type(school_col) is str and school_col):
+            continue
+        degree_col = row_str(row, 'DEGREE_CODE{}'.format(i))
+        major_col = row_str(row, 'MAJOR{}'.format(i))
+        degree_mask = degrees.mask(row['DEGREE_CODE{}'.format(i)])
+        major_mask = majors.mask(row['MAJOR{}'.format(i)])
+        gradyrs_col = row_year(row, 'DEGREE_YEAR{}'.format(i))
+        for is_school, major_text, web_degree_mask, web_major_mask, grad_year in educations:
+            if is_school:
+                scores['school'] += 1
+            if match_degree(web_degree_mask, degree_mask, major_text, degree_col):
+                scores['degree'] += 1
+            if match_major(web_major_mask, major_mask, major_text, major_col):
+                scores['major'] += 1
+            if check_gradyear(grad_year, gradyrs_col):
+                scores['grad_year'] += 1
+    return scores
+
+
+def score_profile(row, profile: Profile, job_position: str = "", geolocation: str = "") -> Score:
+    """Scores an extracted profile against an alumni row, no browser involved.
+
+    Args:
+        row (pandas Series or dict): alumni row, indexed by spreadsheet column name.
+        profile (Profile): extracted profile record.
+        job_position (str): searched job position, empty to skip.
+        geolocation (str): searched region, empty to skip.
+
+    Returns:
+        Score breakdown, Score.total is the accuracy score.
+    """
+    scores = score_jobs(row, profile, job_position, geolocation)
+    scores.update(score_degrees(row, profile))
+    return Score(**scores)
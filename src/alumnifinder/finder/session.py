@@ -0,0 +1,107 @@
+import logging
+import threading
+from time import monotonic
+
+from src.alumnifinder import config
+
+logger = logging.getLogger(__name__)
+
+SESSION_COOKIE = 'li_at'  # LinkedIn's authentication cookie
+
+
+class Session:
+    """A browser logged in to LinkedIn.
+
+    Args:
+        driver (Selenium WebDriver): logged in driver.
+        profile_dir (str): temporary user data directory of the driver, removed when the session is quit.
+
+    Attributes:
+        runs (int): number of runs the session has been used by.
+        started (float): monotonic time of the login.
+    """
+
+    def __init__(self, driver, profile_dir: str = None):
+        self.driver = driver
+        self.profile_dir = profile_dir
+        self.runs = 0
+        self.started = monotonic()
+
+    def age(self) -> float:
+        return monotonic() - self.started
+
+    def healthy(self) -> bool:
+        """Checks that the browser is still running and still holds the authentication cookie, without a page load."""
+        # selenium is imported on first use, the GUI holds a SessionManager from startup on
+        from selenium.common.exceptions import WebDriverException
+        try:
+            self.driver.current_url  # raises once the browser or chromedriver is gone
+            return self.driver.get_cookie(SESSION_COOKIE) is not None
+        except WebDriverException:
+            return False
+
+    def quit(self) -> None:
+        from selenium.common.exceptions import WebDriverException
+        from src.alumnifinder.finder import browser
+        try:
+            browser.quit_driver(self.driver, self.profile_dir)
+        except WebDriverException:
+            pass  # already gone
+
+
+class SessionManager:
+    """Keeps logged in browsers warm between runs, so that only the first run pays for Chrome's startup and login.
+
+    Crawlers borrow a session for the length of a run and give it back when done. A returned session is health
+    checked the next time it is borrowed, a dead browser, an expired login or a session older than max_age is quit and
+    replaced by a fresh one. Sessions are handed to one Crawler at a time, so a pool of workers ends up with as many
+    warm sessions as workers.
+
+    Args:
+        max_age (float): seconds after which a session is replaced, even if healthy.
+
+    Attributes:
+        idle (list of Session): sessions not borrowed by a Crawler.
+    """
+
+    def __init__(self, max_age: float = config.session_max_age):
+        self.max_age = max_age
+        self.idle = []
+        self.lock = threading.Lock()
+
+    def acquire(self, crawler) -> Session:
+        """Lends crawler a warm session, or has it set up and log in a new one.
+
+        Args:
+            crawler (Crawler): its driver is set to the driver of the session.
+        """
+        log_phase = 'Session'
+        while True:
+            with self.lock:
+                session = self.idle.pop() if self.idle else None
+            if session is None:
+                break
+            if session.age() < self.max_age and session.healthy():
+                logger.debug('{}: Reusing a warm session.'.format(log_phase))
+                crawler.driver = session.driver
+                crawler.profile_dir = session.profile_dir
+                session.runs += 1
+                return session
+            logger.debug('{}: Replacing an expired or dead session.'.format(log_phase))
+            session.quit()
+        crawler.open_session()
+        session = Session(crawler.driver, crawler.profile_dir)
+        session.runs += 1
+        return session
+
+    def release(self, session: Session) -> None:
+        """Takes back a session once its run is over."""
+        with self.lock:
+            self.idle.append(session)
+
+    def close(self) -> None:
+        """Quits every idle session."""
+        with self.lock:
+            sessions, self.idle = self.idle, []
+        for session in sessions:
+            session.quit()
@@ -0,0 +1,39 @@
+import threading
+from time import monotonic, sleep
+
+
+class RateLimiter:
+    """Thread-safe token bucket capping the number of page loads per second.
+
+    A single instance is shared by every Crawler of a run, so the total load stays the same however many workers
+    there are.
+
+    Args:
+        rate (float): page loads per second allowed on average, 0 for no cap.
+        burst (int): page loads allowed back to back before the cap applies.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Blocks until a page load is allowed.
+
+        Returns:
+            seconds spent waiting.
+        """
+        if not self.rate:
+            return 0.0
+        with self.lock:
+            now = monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1  # reserve a token, waiting outside the lock for it to be refilled
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            sleep(wait)
+        return wait
@@ -0,0 +1,98 @@
+import threading
+from collections import deque
+from time import perf_counter
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from src.alumnifinder.finder.metrics import WAIT, percentile
+
+READY_SCRIPT = 'return document.readyState'
+
+
+def page_ready(driver) -> bool:
+    """Expected condition of a parsed document, "interactive" is enough since images and stylesheets may be blocked."""
+    return driver.execute_script(READY_SCRIPT) in ('interactive', 'complete')
+
+
+def check(driver, condition):
+    """Evaluates an expected condition once, False when its element is absent."""
+    try:
+        return condition(driver)
+    except NoSuchElementException:
+        return False
+
+
+class AdaptiveWait:
+    """Waits for page elements with timeouts learned from the run instead of a fixed worst case.
+
+    A wait first blocks until the document is parsed, then checks the condition once, which is enough for most pages.
+    Only when the element is missing does it poll, for as long as the element usually takes to show up on a parsed
+    page: factor times the p99 of the last window successful waits of the same name, bounded by floor and ceiling. Until
+    min_samples waits of a name have succeeded, the ceiling is used. A missing section, e.g. a profile without jobs or
+    schools, thus costs a fraction of a second once the run has warmed up, instead of the whole ceiling.
+
+    Every wait is recorded in metrics as a "Wait:<name>" span, or "Wait:<name>:Timeout" when it gave up.
+
+    Args:
+        metrics (RunMetrics): run metrics waits are recorded in, optional.
+        ceiling (float): longest timeout in seconds, also the timeout of the page load itself.
+        floor (float): shortest timeout in seconds.
+        factor (float): safety margin over the observed p99.
+        min_samples (int): successful waits of a name required before its timeout adapts.
+        window (int): latest successful waits of a name the timeout is computed from, older ones are dropped.
+
+    Attributes:
+        samples (dict): seconds between a parsed document and the element showing up, of the latest window waits,
+            keyed by wait name.
+    """
+
+    def __init__(self, metrics=None, ceiling: float = 10, floor: float = 0.5, factor: float = 3,
+                 min_samples: int = 10, window: int = 200):
+        self.metrics = metrics
+        self.ceiling = ceiling
+        self.floor = floor
+        self.factor = factor
+        self.min_samples = min_samples
+        self.window = window
+        self.samples = {}
+        self.lock = threading.Lock()  # shared by every worker of a run
+
+    def timeout(self, name: str) -> float:
+        """Current timeout of the waits of name, in seconds."""
+        with self.lock:
+            samples = sorted(self.samples.get(name, []))
+        if len(samples) < self.min_samples:
+            return self.ceiling
+        return min(self.ceiling, max(self.floor, percentile(samples, 99) * self.factor))
+
+    def until(self, driver, name: str, condition):
+        """Waits for a parsed document, then for condition.
+
+        Args:
+            driver (Selenium WebDriver): driver of the page.
+            name (str): name of the wait, waits of the same name share their timeout.
+            condition (callable): Selenium expected condition.
+
+        Returns:
+            the value of condition.
+
+        Raises:
+            TimeoutException: the page did not load or condition was not met in time.
+        """
+        start = perf_counter()
+        timed_out = True
+        try:
+            WebDriverWait(driver, self.ceiling).until(page_ready)
+            ready = perf_counter()
+            value = check(driver, condition)  # fast path, a single round trip
+            if not value:
+                value = WebDriverWait(driver, self.timeout(name), poll_frequency=0.1).until(condition)
+            with self.lock:
+                self.samples.setdefault(name, deque(maxlen=self.window)).append(perf_counter() - ready)
+            timed_out = False
+            return value
+        finally:
+            if self.metrics is not None:
+                phase = 'Wait:{}:Timeout'.format(name) if timed_out else 'Wait:{}'.format(name)
+                self.metrics.record(phase, perf_counter() - start, WAIT)
@@ -1,13 +1,14 @@
 import tkinter
 from tkinter import filedialog as fd
 
-from pandas import ExcelWriter, DataFrame
-
-from src.alumnifinder.excel.handler import Handler
-from src.alumnifinder.finder.crawler import Crawler
+from src.alumnifinder.finder.job import FAILED, Job
+from src.alumnifinder.finder.session import SessionManager
 from src.alumnifinder.gui import images
+from src.alumnifinder.gui.runner import JobRunner
 from src.alumnifinder.utils import jsonwriter as json_writer
 
+POLL_INTERVAL = 500  # milliseconds between two reads of the runner's progress queue
+
 
 class App:
     def __init__(self, master):
@@ -19,6 +20,10 @@ class App:
         frame.config(padx=5, pady=5)
         self.input_file_name = ''
         self.client_entry = {}
+        self.workers = 0  # automatic
+        self.sessions = SessionManager()  # logged in browsers kept warm between runs
+        self.runner = JobRunner(self.sessions)  # crawls off the Tk thread, queued jobs run one after another
+        master.protocol('WM_DELETE_WINDOW', self.xbutton_pressed)
 
         try:
             self.logo = tkinter.PhotoImage(file=images.logo_path)
@@ -58,8 +63,27 @@ class App:
         self.e3.grid(row=start_row + 2, column=1)
         self.e4.grid(row=start_row + 3, column=1)
 
+        self.workers_label = tkinter.Label(frame, text="Workers: ")
+        self.workers_label.grid(row=start_row + 4, sticky=tkinter.W)
+        self.workers_entry = tkinter.Entry(frame)  # number of browsers crawling in parallel, empty for automatic
+        self.workers_entry.grid(row=start_row + 4, column=1)
+
+        self.resume = tkinter.BooleanVar()  # resume the previous run of the same file and range
+        self.resume_check = tkinter.Checkbutton(frame, text="Resume previous run", variable=self.resume)
+        self.resume_check.grid(row=start_row + 5, column=1, sticky=tkinter.W)
+        self.pruning = tkinter.BooleanVar(value=True)  # unchecked opens every candidate, like --no-pruning
+        self.pruning_check = tkinter.Checkbutton(frame, text="Skip unlikely candidates", variable=self.pruning)
+        self.pruning_check.grid(row=start_row + 5, column=2, sticky=tkinter.W)
+
         ok_button = tkinter.Button(frame, text="   OK   ", command=self.ok_button)
-        ok_button.grid(row=start_row + 6, columnspan=5, pady=5)
+        ok_button.grid(row=start_row + 6, columnspan=2, pady=5)
+        self.cancel_button = tkinter.Button(frame, text=" Cancel ", command=self.cancel_button_pressed)
+        self.cancel_button.config(state=tkinter.DISABLED)
+        self.cancel_button.grid(row=start_row + 6, column=2, columnspan=2, pady=5)
+
+        self.status = tkinter.StringVar(value="Idle.")  # progress of the running job, updated by poll_progress
+        self.status_label = tkinter.Label(frame, textvariable=self.status, anchor=tkinter.W, justify=tkinter.LEFT)
+        self.status_label.grid(row=start_row + 7, columnspan=4, sticky=tkinter.W)
         # end manual option fields
 
         # right side, file explorer for excel file
@@ -82,6 +106,7 @@ class App:
     # end file input
 
         self.launch_username_password_input()
+        self.master.after(POLL_INTERVAL, self.poll_progress)
 
     def launch_username_password_input(self):
         self.up_top = tkinter.Toplevel()
@@ -129,8 +154,24 @@ class App:
         self.up_top.grab_set()
 
     def xbutton_pressed(self):
+        self.runner.stop(timeout=60)  # a cancelled job still saves its partial results
+        self.sessions.close()
         self.master.destroy()
 
+    def cancel_button_pressed(self):
+        self.runner.cancel()
+        self.status.set("Cancelling, saving partial results...")
+
+    def poll_progress(self):
+        """Shows the runner's latest progress, then polls again, Tk widgets are only touched from this thread."""
+        for snapshot in self.runner.poll():
+            queued = self.runner.pending()
+            self.status.set(snapshot.describe() + ("\n{} job(s) queued".format(queued) if queued else ""))
+            if snapshot.state == FAILED:
+                self.error_pop_up("Crawl failed: " + snapshot.error)
+        self.cancel_button.config(state=tkinter.NORMAL if self.runner.current is not None else tkinter.DISABLED)
+        self.master.after(POLL_INTERVAL, self.poll_progress)
+
     def username_password_ok(self):
         username = self.username_entry.get().strip()
         password = self.password_entry.get().strip()
@@ -165,15 +206,15 @@ class App:
             self.right_save_path_entry.config(state="readonly")
 
     def search_file(self):
-        valid_file_types = ("*.xlsx", "*.xls")
+        valid_file_types = ("*.xlsx", "*.xls", "*.csv")
         file = fd.askopenfile(initialdir="/", title="Select file",  # returns a file
-                              filetypes=[("Excel Files", valid_file_types), ("All Files", "*.*")])
+                              filetypes=[("Excel/CSV Files", valid_file_types), ("All Files", "*.*")])
         # xlsx
         if file is None:
             print("No File Selected")
         else:
             file_extension = file.name.split('.')
-            if file_extension[1] != "xlsx" and file_extension[1] != "xls":
+            if file_extension[1] not in ("xlsx", "xls", "csv"):
                 types = ""
                 for x in valid_file_types:
                     if x == valid_file_types[-1]:
@@ -206,36 +247,14 @@ class App:
         self.right_save_path_entry.insert(0, file_path[:end_of_dir])
         self.right_save_path_entry.config(state="readonly")
 
-    def get_output_frame(self, columns: list) -> DataFrame:
-        """generate a pandas DataFrame to write search result
-
-        Returns:
-            pandas DataFrame
-        """
-        output_frame = DataFrame(data='', index=[0], columns=columns)
-        return output_frame
-
-    def save_file(self, output_frame: DataFrame, columns: list, start=None, end=None) -> None:
-        """Format the DataFrame and save it as Excel file
-
-         Args:
-             output_frame(pandas DataFrame): the instance of DataFrame that used by the crawler
-        """
+    def get_save_path(self, start=None, end=None) -> str:
+        """Returns the path of the output Excel file of a search range"""
         save_file_name = ''
         if start and end:
             save_file_name += '/' + str(start) + '_to_' + str(end) + '_' + self.input_file_name + '.xlsx'
         else:
             save_file_name += '/all_range_' + self.input_file_name + '.xlsx'
-
-        writer = ExcelWriter(self.right_save_path_entry.get() + save_file_name, engine='xlsxwriter')
-        output_frame.to_excel(writer, index=False, sheet_name='Sheet1')
-        workbook = writer.book
-        workbook.set_size(2800, 1200)
-        worksheet = writer.sheets['Sheet1']
-        worksheet.set_zoom(100)
-        size = len(columns)
-        worksheet.set_column('A:'+chr(ord('A')+size-1), 25)
-        writer.save()
+        return self.right_save_path_entry.get() + save_file_name
 
     def error_pop_up(self, text):
         top = tkinter.Toplevel()
@@ -315,6 +334,18 @@ class App:
         else:
             return True  # start and end rows not being used
 
+    def check_workers(self, workers: str) -> bool:
+        """Checks the number of workers, empty means automatic"""
+        if not workers:
+            return True
+        try:
+            if int(workers) >= 1:
+                return True
+        except ValueError:
+            pass
+        self.error_pop_up("Workers must be a positive integer, or empty for automatic.")
+        return False
+
     def is_int(self, start_row: str, end_row: str) -> bool:
         """Checks correct types"""
         try:
@@ -328,7 +359,10 @@ class App:
         if self.check_path_save(file_path=self.right_file_path_entry.get(), save_path=self.right_save_path_entry.get()):
             start_row = self.e3.get().strip()
             end_row = self.e4.get().strip()
-            if self.check_start_end(start_row=start_row, end_row=end_row):  # XNOR check with start/end rows
+            workers = self.workers_entry.get().strip()
+            # XNOR check with start/end rows
+            if self.check_start_end(start_row=start_row, end_row=end_row) and self.check_workers(workers):
+                self.workers = int(workers) if workers else 0
                 self.client_entry["geolocation"] = self.e1.get().strip()
                 self.client_entry["job_position"] = self.e2.get().strip()
                 if self.is_int(start_row=start_row, end_row=end_row):  # start/end both specified
@@ -341,11 +375,10 @@ class App:
                     self.ok_button_helper()
 
     def ok_button_helper(self, start_row=None, end_row=None) -> None:
-        excel = Handler(excel_file=self.right_file_path_entry.get(), start=start_row, end=end_row)
-
-        columns = ['ROW_NUMBER', 'ID_NUMBER','KEYWORD', 'FULL_NAME_ON_LINKEDIN', 'JOB_TITLE', 'COMPANY_NAME',
-                   'COMPANY_LOCATION', 'PROFILE_LINK', 'ACCURACY_SCORE']
-        output_frame = self.get_output_frame(columns)
-        c = Crawler(input_data=excel.divided_data, output_data=output_frame, **self.client_entry)
-        c.crawl_linkedin()
-        self.save_file(output_frame, columns, start=start_row, end=end_row)
\ No newline at end of file
+        """Queues a crawl of the chosen file and range, it runs once the jobs queued before it are done."""
+        options = {key: value for key, value in self.client_entry.items() if key not in ('start_row', 'end_row')}
+        if not self.pruning.get():
+            options.update(prune_top_k=0, confident_score=0)
+        job = Job(self.right_file_path_entry.get(), self.get_save_path(start_row, end_row), start_row, end_row,
+                  self.workers, self.resume.get(), options, 'xlsx', None)
+        self.runner.submit(job)
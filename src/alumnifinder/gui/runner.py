@@ -0,0 +1,86 @@
+import logging
+import queue
+import threading
+
+from src.alumnifinder.finder.job import FAILED, QUEUED, Job, run_job, status
+
+logger = logging.getLogger(__name__)
+
+
+class JobRunner:
+    """Runs queued crawl jobs one after another on a background thread, off the Tk event loop.
+
+    Tk widgets may only be touched from the thread running mainloop, so the runner never calls back into the GUI, it
+    puts Progress snapshots on a thread-safe queue instead, which the GUI drains with poll from an after() callback.
+
+    Args:
+        sessions (SessionManager): warm logged in browsers shared by every job, None to open new ones.
+        execute (callable): runs a job and returns its final Progress, run_job(job, sessions, cancel, report) by
+            default.
+
+    Attributes:
+        progress (queue.Queue): Progress snapshots, oldest first.
+        current (Job): job running, None if idle.
+    """
+
+    def __init__(self, sessions=None, execute=run_job):
+        self.sessions = sessions
+        self.execute = execute
+        self.jobs = queue.Queue()
+        self.progress = queue.Queue()
+        self.cancelled = threading.Event()  # cancels the current job only
+        self.current = None
+        self.thread = None
+
+    def submit(self, job: Job) -> None:
+        """Queues a job, it starts once every job queued before it is finished."""
+        self.progress.put(status(job, QUEUED))
+        self.jobs.put(job)
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, name='JobRunner', daemon=True)
+            self.thread.start()
+
+    def pending(self) -> int:
+        """Number of queued jobs not started yet."""
+        return self.jobs.qsize()
+
+    def cancel(self) -> None:
+        """Stops the current job before its next row, its partial results are saved."""
+        if self.current is not None:
+            self.cancelled.set()
+
+    def run(self) -> None:
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            self.cancelled.clear()
+            self.current = job
+            try:
+                self.progress.put(self.execute(job, self.sessions, self.cancelled, self.progress.put))
+            except Exception as e:
+                logger.exception('Runner: Job failed: {}'.format(job.save_path))
+                self.progress.put(status(job, FAILED, str(e)))
+            finally:
+                self.current = None
+
+    def poll(self) -> list:
+        """Returns the Progress snapshots sent since the last poll, without blocking."""
+        snapshots = []
+        while True:
+            try:
+                snapshots.append(self.progress.get_nowait())
+            except queue.Empty:
+                return snapshots
+
+    def stop(self, timeout: float = None) -> None:
+        """Cancels the current job, drops the queued ones and waits for the runner thread to end."""
+        while True:
+            try:
+                self.jobs.get_nowait()
+            except queue.Empty:
+                break
+        self.cancel()
+        self.jobs.put(None)
+        if self.thread is not None:
+            self.thread.join(timeout)
@@ -1,4 +1,6 @@
+import copy
 import json
+from functools import lru_cache
 
 from selenium.webdriver.common.by import By
 
@@ -17,12 +19,18 @@ def get_web_elements() -> list:
         return json.load(json_file)
 
 
-def get_patterns() -> list:
-    """Opens patterns.json and returns list interpretation."""
+@lru_cache(maxsize=None)
+def load_patterns() -> list:
+    """Opens patterns.json once, the list is shared and must not be modified, see get_patterns."""
     with open(config.patterns_path) as json_file:
         return json.load(json_file)
 
 
+def get_patterns() -> list:
+    """Returns list interpretation of patterns.json, a copy of the list read on first use."""
+    return copy.deepcopy(load_patterns())
+
+
 def get_flag(elem: str):
     if elem == 'id':
         return By.ID
@@ -0,0 +1,26 @@
+import logging
+
+PACKAGE_LOGGER = 'src.alumnifinder'
+FORMAT = '%(asctime)s:%(levelname)s:%(message)s'
+
+
+def configure_logging(level: int = logging.DEBUG) -> logging.Handler:
+    """Logs every module of the package to the console, called once by an entry point, never on import.
+
+    Calling it again only changes the level.
+
+    Returns:
+        the console handler.
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    logger.setLevel(level)
+    for handler in logger.handlers:
+        if getattr(handler, 'alumnifinder', False):
+            handler.setLevel(level)
+            return handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(level)
+    console_handler.setFormatter(logging.Formatter(FORMAT))
+    console_handler.alumnifinder = True  # marks the handler as ours
+    logger.addHandler(console_handler)
+    return console_handler
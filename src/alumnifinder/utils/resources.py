@@ -0,0 +1,28 @@
+import os
+
+DRIVER_MEMORY = 512 * 2 ** 20  # bytes, approximate resident size of one Chrome + chromedriver pair
+MAX_DRIVERS = 20
+
+
+def available_memory() -> int:
+    """Returns the available physical memory in bytes, 0 if it cannot be determined."""
+    try:
+        with open('/proc/meminfo') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return 0
+
+
+def max_workers(memory_per_worker: int = DRIVER_MEMORY) -> int:
+    """Finds the maximum amount of drivers our machine can handle, bounded by CPU count and available memory."""
+    workers = min(os.cpu_count() or 1, MAX_DRIVERS)
+    memory = available_memory()
+    if memory:
+        workers = min(workers, memory // memory_per_worker)
+    return max(1, workers)
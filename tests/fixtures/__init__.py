@@ -0,0 +1,5 @@
+import os
+
+fixtures_dir = os.path.dirname(__file__)
+profile_path = os.path.join(fixtures_dir, "profile.html")
+empty_profile_path = os.path.join(fixtures_dir, "empty_profile.html")
@@ -0,0 +1,239 @@
+"""Local stand-in for LinkedIn, serving the markup the crawler targets with synthetic profiles.
+
+Pages:
+    /                       login page ("login-email", "login-password", "login-submit") until logged in, then the home
+                            page with the search bar ("ember-text-field ember-view").
+    /login                  accepts any credentials and sets the session cookie.
+    /search/results/people/ search results, one "search-result__info pt3 pb4 ph0" div per candidate.
+    /in/<slug>/             profile, "background_details_company" jobs and "background_details_school" educations.
+
+Usage:
+    site = Site(candidates=3, latency=0.05)
+    base_url = site.start()
+    ...
+    site.stop()
+"""
+import html
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from time import sleep
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+SESSION_COOKIE = 'li_at'
+
+TITLES = ['Software Engineer', 'Senior Software Engineer', 'Project Manager', 'Business Analyst', 'Web Developer',
+          'Systems Administrator', 'Financial Manager', 'Network Engineer']
+COMPANIES = ['IBM', 'Amazon.com', 'Microsoft', 'M&T Bank', 'Oracle', 'Intel', 'Salesforce.com', 'Apple Inc.']
+LOCATIONS = ['Buffalo, New York', 'Rochester, New York', 'Seattle, Washington', 'Austin, Texas', 'New York, New York']
+SCHOOLS = ['University at Buffalo', 'State University of New York at Buffalo', 'Rochester Institute of Technology',
+           'Cornell University']
+DEGREES = ['Bachelor of Science (BS)', 'Master of Science (MS)', 'Bachelor of Arts (BA)', 'Doctor of Philosophy (PhD)']
+MAJORS = ['Computer Science', 'Computer Engineering', 'Electrical Engineering', 'Economics', 'Civil Engineering']
+
+PAGE = ('<!DOCTYPE html>\n<html>\n<head><title>{title}</title><meta charset="utf-8"></head>\n'
+        '<body>\n{body}\n</body>\n</html>')
+
+LOGIN = '''<form class="login-form" action="/login" method="post">
+  <input class="login-email" name="session_key" type="text">
+  <input class="login-password" name="session_password" type="password">
+  <input id="login-submit" class="login submit-button" type="submit" value="Sign in">
+</form>'''
+
+HOME = '''<form id="extended-nav-search" action="/search/results/people/" method="get">
+  <input class="ember-text-field ember-view" name="keywords" type="text" placeholder="Search">
+</form>'''
+
+RESULT = '''<li class="search-result search-result__occluded-item ember-view">
+  <div class="search-result__info pt3 pb4 ph0">
+    <a data-control-name="search_srp_result" href="/in/{slug}/" class="search-result__result-link ember-view">
+      <h3 id="ember{id}" class="actor-name-with-distance search-result__title single-line-truncate ember-view">
+        <span><span class="name actor-name">{name}</span></span>
+        <span class="distance-badge separator ember-view"><span class="dist-value">2nd</span></span>
+      </h3>
+    </a>
+    <p class="subline-level-1 Sans-15px-black-85% search-result__truncate">{headline}</p>
+    <p class="subline-level-2 Sans-13px-black-55% search-result__truncate">{location}</p>
+  </div>
+</li>'''
+
+JOB = '''<li class="pv-profile-section__card-item pv-position-entity">
+  <a data-control-name="background_details_company" href="/company/{id}/">
+    <div class="pv-entity__summary-info">
+      <h3 class="Sans-17px-black-85%-semibold">{title}</h3>
+      <h4 class="Sans-17px-black-85%">
+        <span class="visually-hidden">Company Name</span>
+        <span class="pv-entity__secondary-title">{company}</span>
+      </h4>
+      <h4 class="pv-entity__date-range Sans-15px-black-55%">
+        <span class="visually-hidden">Dates Employed</span>
+        <span>{start} &ndash; {end}</span>
+      </h4>
+      <h4 class="pv-entity__location Sans-15px-black-55% block">
+        <span class="visually-hidden">Location</span>
+        <span>{location}</span>
+      </h4>
+    </div>
+  </a>
+</li>'''
+
+EDUCATION = '''<li class="pv-profile-section__sortable-card-item pv-education-entity">
+  <a data-control-name="background_details_school" href="/school/{id}/">
+    <div class="pv-entity__summary-info">
+      <div class="pv-entity__degree-info">
+        <h3 class="pv-entity__school-name Sans-17px-black-85%-semibold">{school}</h3>
+        <p class="pv-entity__secondary-title pv-entity__degree-name Sans-15px-black-85%">
+          <span class="visually-hidden">Degree Name</span>
+          <span class="pv-entity__comma-item">{degree}</span>
+        </p>
+        <p class="pv-entity__secondary-title pv-entity__fos Sans-15px-black-70%">
+          <span class="visually-hidden">Field Of Study</span>
+          <span class="pv-entity__comma-item">{major}</span>
+        </p>
+      </div>
+      <p class="pv-entity__dates Sans-15px-black-70%">
+        <span class="visually-hidden">Dates attended or expected graduation</span>
+        <span><time>{start}</time> &ndash; <time>{end}</time></span>
+      </p>
+    </div>
+  </a>
+</li>'''
+
+
+def slugify(name: str, index: int) -> str:
+    return quote('{}-{}'.format('-'.join(name.lower().split()), index))
+
+
+class Site:
+    """Generates synthetic people on demand and serves them with LinkedIn's markup.
+
+    Every search for "first last region" returns candidates people whose names contain first and last, plus one
+    unrelated person that the coarse-grain filter has to drop. Profiles are generated from their slug, so the same
+    link always serves the same profile.
+
+    Args:
+        candidates (int): matching search results per search.
+        latency (float): seconds every response is delayed by, to mimic network and rendering time.
+        seed (int): seed of the synthetic data.
+    """
+
+    def __init__(self, candidates: int = 3, latency: float = 0.0, seed: int = 0):
+        self.candidates = candidates
+        self.latency = latency
+        self.seed = seed
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.server = None
+
+    def random(self, key: str) -> random.Random:
+        return random.Random('{}:{}'.format(self.seed, key))
+
+    def search_page(self, keywords: str) -> str:
+        terms = keywords.split()
+        name = ' '.join(term.capitalize() for term in terms[:2]) or 'Nobody'
+        rand = self.random(keywords.lower())
+        people = [(name if i == 0 else '{} {}'.format(name, chr(ord('A') + i)), slugify(name, i))
+                  for i in range(self.candidates)]
+        people.append(('Someone Else', slugify('someone else ' + name, 0)))
+        results = [RESULT.format(slug=slug, id=rand.randint(100, 9999), name=html.escape(person),
+                                 headline=html.escape('{} at {}'.format(rand.choice(TITLES), rand.choice(COMPANIES))),
+                                 location=html.escape(rand.choice(LOCATIONS)))
+                   for person, slug in people]
+        body = '<ul class="results-list">\n{}\n</ul>'.format('\n'.join(results))
+        return PAGE.format(title='Search | LinkedIn', body=body)
+
+    def profile_page(self, slug: str) -> str:
+        rand = self.random(slug)
+        jobs = []
+        end = 'Present'
+        for i in range(rand.randint(0, 4)):
+            start = 2017 - 3 * i - rand.randint(1, 3)
+            jobs.append(JOB.format(id=rand.randint(1000, 99999), title=html.escape(rand.choice(TITLES)),
+                                   company=html.escape(rand.choice(COMPANIES)), start=start, end=end,
+                                   location=html.escape(rand.choice(LOCATIONS))))
+            end = start
+        educations = []
+        year = rand.randint(1990, 2016)
+        for i in range(rand.randint(0, 3)):
+            educations.append(EDUCATION.format(id=rand.randint(1000, 99999), school=html.escape(rand.choice(SCHOOLS)),
+                                               degree=html.escape(rand.choice(DEGREES)),
+                                               major=html.escape(rand.choice(MAJORS)), start=year - 4, end=year))
+            year -= 4
+        body = ('<section id="experience-section" class="pv-profile-section experience-section">\n'
+                '<ul class="pv-profile-section__section-info section-info">\n{}\n</ul>\n</section>\n'
+                '<section id="education-section" class="pv-profile-section education-section">\n'
+                '<ul class="pv-profile-section__section-info section-info">\n{}\n</ul>\n</section>'
+                ).format('\n'.join(jobs), '\n'.join(educations))
+        return PAGE.format(title='{} | LinkedIn'.format(html.escape(unquote(slug))), body=body)
+
+    def start(self, port: int = 0) -> str:
+        """Serves the site from a background thread.
+
+        Returns:
+            base url of the site, e.g. "http://127.0.0.1:53124"
+        """
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), handler_for(self))
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+
+    def stop(self) -> None:
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def handler_for(site: Site) -> type:
+    """Builds the request handler class serving site."""
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def log_message(self, *args):
+            pass  # keeps test and benchmark output clean
+
+        def respond(self, page: str, status: int = 200, headers: dict = None) -> None:
+            with site.lock:
+                site.requests += 1
+            if site.latency:
+                sleep(site.latency)
+            content = page.encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(content)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(content)
+
+        def logged_in(self) -> bool:
+            return SESSION_COOKIE + '=' in (self.headers.get('Cookie') or '')
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path in ('/', '/feed/'):
+                if self.logged_in():
+                    self.respond(PAGE.format(title='LinkedIn', body=HOME))
+                else:
+                    self.respond(PAGE.format(title='LinkedIn: Log In or Sign Up', body=LOGIN))
+            elif url.path.startswith('/search/results/people'):
+                keywords = parse_qs(url.query).get('keywords', [''])[0]
+                self.respond(site.search_page(keywords))
+            elif url.path.startswith('/in/'):
+                self.respond(site.profile_page(url.path[len('/in/'):].strip('/')))
+            else:
+                self.respond(PAGE.format(title='Page not found | LinkedIn', body=''), status=404)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            if urlsplit(self.path).path == '/login':
+                self.respond(PAGE.format(title='LinkedIn', body=HOME),
+                             headers={'Set-Cookie': '{}=local; Path=/'.format(SESSION_COOKIE)})
+            else:
+                self.respond(PAGE.format(title='Page not found | LinkedIn', body=''), status=404)
+
+    return Handler
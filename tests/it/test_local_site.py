@@ -0,0 +1,38 @@
+import os
+from sys import platform
+
+import pytest
+from pandas import DataFrame
+
+from src.alumnifinder.excel.writer import ResultSink
+from src.alumnifinder.finder import drivers
+from src.alumnifinder.finder.pipeline import CrawlPipeline
+from tests.conftest import get_test_data
+from tests.fixtures.site import Site
+
+if platform.startswith('linux'):
+    chrome_path = drivers.LINUX_DRIVER_PATH
+elif platform.startswith('darwin'):
+    chrome_path = drivers.MAC_DRIVER_PATH
+else:
+    chrome_path = drivers.WIN_DRIVER_PATH
+
+
+@pytest.mark.skipif(not os.path.exists(chrome_path), reason="chromedriver is required for this test.")
+class TestLocalSite:
+    """Contains end to end tests of the crawl pipeline against the local stand-in site."""
+
+    def test_crawl(self):
+        site = Site(candidates=2)
+        base_url = site.start()
+        try:
+            output = ResultSink()
+            data = DataFrame(get_test_data()).iloc[0:3]
+            c = CrawlPipeline(data, output, browsers=2, rate=0, base_url=base_url, pause=(0, 0))
+            c.crawl_linkedin()
+        finally:
+            site.stop()
+        frame = output.to_frame()
+        assert list(frame['ROW_NUMBER'][frame['ROW_NUMBER'] != '']) == [2, 3, 4]
+        assert len(frame) == 3 * (2 + 1)  # 2 candidates and a separator row per alumni
+        assert all(link.startswith(base_url + '/in/') for link in frame['PROFILE_LINK'] if link)
@@ -1,3 +1,5 @@
+import os
+import subprocess
 import sys
 
 import pytest
@@ -16,3 +18,15 @@ class TestApp:
     def test_init(self):
         root = Tk()
         app = App(root)
+
+
+class TestAppStartup:
+    """Contains unit-tests for the window's cold start."""
+
+    def test_lazy_imports(self):
+        """The crawler's dependencies are imported once a crawl starts, not before the window appears."""
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+        code = ('import sys; import src.alumnifinder.gui.app; '
+                'print(sorted(m for m in ("pandas", "numpy", "selenium", "xlsxwriter") if m in sys.modules))')
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=root)
+        assert output.strip() == b'[]'
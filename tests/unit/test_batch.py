@@ -0,0 +1,39 @@
+from pandas import DataFrame
+
+from src.alumnifinder.finder import batch, scoring
+from src.alumnifinder.finder.profile import Profile
+from tests.unit.test_scoring import get_profile, get_row
+
+
+class TestBatch:
+    """Contains unit tests for vectorized batch scoring."""
+
+    def test_normalize(self):
+        column = DataFrame({'a': ['Amazon.com, Inc.', float('nan'), 'IBM', 'Amazon.com, Inc.']})['a']
+        assert batch.normalize(column).tolist() == ['amazoncominc', '', 'ibm', 'amazoncominc']
+
+    def test_score_pairs(self):
+        rows = [get_row(), get_row(WORK_TITLE=float('nan')), get_row(SCHOOL1='', WORK_COMPANY_NAME1='Oracle')]
+        profiles = {'full': get_profile(), 'empty': Profile([], [])}
+        pairs = DataFrame({'row': [0, 0, 1, 2], 'profile': ['full', 'empty', 'full', 'full']})
+        scores = batch.score_pairs(DataFrame(rows), profiles, pairs, 'Senior Software Engineer', 'Buffalo')
+        assert len(scores) == len(pairs)
+        for index, pair in pairs.iterrows():
+            expected = scoring.score_profile(rows[pair['row']], profiles[pair['profile']],
+                                             'Senior Software Engineer', 'Buffalo')
+            assert scores.loc[index, list(scoring.Score._fields)].tolist() == list(expected)
+            assert scores.loc[index, 'total'] == expected.total
+
+    def test_prepare_rows(self):
+        rows = DataFrame([get_row(), get_row(SCHOOL2='School of Management', DEGREE_YEAR2='n/a')])
+        prepared = batch.prepare_rows(rows)
+        assert prepared['WORK_COMPANY_NAME1' + scoring.NORMALIZED].tolist() == ['ibm', 'ibm']
+        assert prepared['DEGREE_CODE1' + scoring.NORMALIZED].tolist() == ['ms', 'ms']
+        assert prepared['DEGREE_YEAR1' + scoring.NORMALIZED].tolist() == [2003, 2003]
+        assert prepared['DEGREE_YEAR2' + scoring.NORMALIZED].tolist() == [0, 0]
+        profile = get_profile()
+        for index, row in rows.iterrows():
+            assert scoring.score_profile(prepared.loc[index], profile) == scoring.score_profile(row, profile)
+        pairs = DataFrame({'row': [0, 1], 'profile': ['full', 'full']})
+        assert batch.score_pairs(prepared, {'full': profile}, pairs).equals(
+            batch.score_pairs(rows, {'full': profile}, pairs))
@@ -0,0 +1,35 @@
+import pytest
+
+from src.alumnifinder.finder import browser
+
+
+class TestBrowser:
+    """Contains unit tests for the crawl worker driver profiles."""
+
+    def test_lightweight_options(self):
+        options = browser.LIGHTWEIGHT.options('/tmp/alumnifinder-chrome-test')
+        assert '--headless' in options.arguments
+        assert '--window-size=1024,768' in options.arguments
+        assert '--user-data-dir=/tmp/alumnifinder-chrome-test' in options.arguments
+        prefs = options.experimental_options['prefs']
+        assert prefs['profile.managed_default_content_settings.images'] == browser.BLOCK
+        assert prefs['profile.managed_default_content_settings.stylesheets'] == browser.BLOCK
+        assert browser.LIGHTWEIGHT.capabilities()['pageLoadStrategy'] == 'eager'
+
+    def test_default_options(self):
+        options = browser.DEFAULT.options()
+        assert '--headless' not in options.arguments
+        assert 'prefs' not in options.experimental_options
+        assert browser.DEFAULT.capabilities()['pageLoadStrategy'] == 'normal'
+
+    def test_get_profile(self):
+        assert browser.get_profile('lightweight') is browser.LIGHTWEIGHT
+        assert browser.get_profile(browser.VISIBLE) is browser.VISIBLE
+        with pytest.raises(KeyError):
+            browser.get_profile('fancy')
+
+    def test_remove_profile_dir(self, tmpdir):
+        profile_dir = tmpdir.mkdir('alumnifinder-chrome-test')
+        profile_dir.join('Local State').write('{}')
+        browser.remove_profile_dir(str(profile_dir))
+        assert not profile_dir.exists()
@@ -0,0 +1,103 @@
+from src.alumnifinder.finder import cache
+from src.alumnifinder.finder.profile import Candidate, Education, Job, Profile
+
+
+def get_profile(title: str = 'Software Engineer') -> Profile:
+    return Profile([Job(title, ['Company Name\nIBM', 'Location\nBuffalo, New York'])],
+                   [Education('University at Buffalo', ['Master of Science (MS)', 'Computer Science'],
+                              ['2001', '2003'])])
+
+
+class TestProfileCache:
+    """Contains unit tests for the on-disk profile cache."""
+
+    def test_normalize_url(self):
+        link = 'https://www.linkedin.com/in/jane-jones'
+        assert cache.normalize_url('http://WWW.linkedin.com/in/jane-jones/?trk=srp#top') == link
+        assert cache.normalize_url(link + '/') == link
+
+    def test_get_put(self, tmpdir):
+        profile_cache = cache.ProfileCache(str(tmpdir.join('profiles.sqlite3')))
+        link = 'https://www.linkedin.com/in/jane-jones/'
+        assert profile_cache.get(link) is None
+        profile_cache.put(link, get_profile())
+        assert profile_cache.get(link + '?trk=srp') == get_profile()
+        assert profile_cache.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+        profile_cache.close()
+        profile_cache = cache.ProfileCache(str(tmpdir.join('profiles.sqlite3')))  # persisted across instances
+        assert profile_cache.get(link) == get_profile()
+        profile_cache.close()
+
+    def test_ttl(self, tmpdir):
+        profile_cache = cache.ProfileCache(str(tmpdir.join('profiles.sqlite3')), ttl=-1)  # everything is expired
+        profile_cache.put('https://www.linkedin.com/in/jane-jones', get_profile())
+        assert profile_cache.get('https://www.linkedin.com/in/jane-jones') is None
+        assert len(profile_cache) == 0
+        profile_cache.close()
+
+    def test_lru_eviction(self):
+        profile_cache = cache.ProfileCache(':memory:', max_entries=2)
+        profile_cache.put('https://www.linkedin.com/in/a', get_profile('a'))
+        profile_cache.put('https://www.linkedin.com/in/b', get_profile('b'))
+        profile_cache.get('https://www.linkedin.com/in/a')  # b is now the least recently used
+        profile_cache.put('https://www.linkedin.com/in/c', get_profile('c'))
+        assert len(profile_cache) == 2
+        assert profile_cache.get('https://www.linkedin.com/in/b') is None
+        assert profile_cache.get('https://www.linkedin.com/in/a') == get_profile('a')
+        profile_cache.close()
+
+    def test_evict_only_past_capacity(self, tmpdir):
+        path = str(tmpdir.join('profiles.sqlite3'))
+        profile_cache = cache.ProfileCache(path, max_entries=2)
+        profile_cache.put('https://www.linkedin.com/in/a', get_profile('a'))
+        profile_cache.put('https://www.linkedin.com/in/b', get_profile('b'))
+        statements = []
+        profile_cache.connection.set_trace_callback(statements.append)
+        profile_cache.put('https://www.linkedin.com/in/a/', get_profile('a2'))  # replaces an entry, nothing to evict
+        assert not any(statement.startswith('DELETE') for statement in statements)
+        assert profile_cache.entries == 2
+        profile_cache.put('https://www.linkedin.com/in/c', get_profile('c'))
+        assert any(statement.startswith('DELETE') for statement in statements)
+        assert profile_cache.entries == len(profile_cache) == 2
+        assert profile_cache.get('https://www.linkedin.com/in/a') == get_profile('a2')
+        profile_cache.close()
+        profile_cache = cache.ProfileCache(path, max_entries=2)
+        assert profile_cache.entries == 2  # counted on open
+        profile_cache.close()
+
+
+class TestSearchCache:
+    """Contains unit tests for the search-result cache."""
+
+    def test_get_put(self):
+        search_cache = cache.SearchCache()
+        candidates = [Candidate('Jane Jones', 'https://www.linkedin.com/in/jane-jones/'),
+                      Candidate('Jane M. Jones', 'https://www.linkedin.com/in/janemjones/')]
+        assert search_cache.get(('jane', 'jones', 'Buffalo')) is None
+        search_cache.put(('jane', 'jones', 'Buffalo'), candidates)
+        assert search_cache.get(('Jane', ' jones', 'buffalo ')) == candidates
+        search_cache.put(('john', 'james', 'Buffalo'), [])  # no match is a result too
+        assert search_cache.get(('john', 'james', 'Buffalo')) == []
+        assert search_cache.get(('jane', 'jones', 'Rochester')) is None
+        search_cache.close()
+
+    def test_cards(self):
+        search_cache = cache.SearchCache()
+        candidates = [Candidate('Jane Jones', '/in/jane-jones/', 'Software Engineer at IBM', 'Buffalo, New York')]
+        search_cache.put(('jane', 'jones', 'Buffalo'), candidates)
+        assert search_cache.get(('jane', 'jones', 'Buffalo'))[0].headline == 'Software Engineer at IBM'
+        # results cached before cards were read
+        old = search_cache.decode('[["Jane Jones", "/in/jane-jones/"]]')
+        assert old == [Candidate('Jane Jones', '/in/jane-jones/')]
+        assert old[0].headline == ''
+        search_cache.close()
+
+    def test_persistent(self, tmpdir):
+        path = str(tmpdir.join('searches.sqlite3'))
+        candidates = [Candidate('Jane Jones', 'https://www.linkedin.com/in/jane-jones/')]
+        search_cache = cache.SearchCache(path)
+        search_cache.put(('jane', 'jones', 'Buffalo'), candidates)
+        search_cache.close()
+        search_cache = cache.SearchCache(path)
+        assert search_cache.get(('jane', 'jones', 'Buffalo')) == candidates
+        search_cache.close()
@@ -0,0 +1,88 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.alumnifinder import cli
+from src.alumnifinder.finder import job as jobs
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def run(capsys, *argv) -> (int, dict):
+    exit_code = cli.main(list(argv) + ['--quiet'])
+    return exit_code, json.loads(capsys.readouterr().out)
+
+
+class TestCli:
+    """Contains unit tests for the command line entry point."""
+
+    def test_default_output(self):
+        assert cli.default_output('/data/alumni.xlsx', 2, 10, 'csv') == os.path.join('/data', '2_to_10_alumni.csv')
+        assert cli.default_output('/data/alumni.xlsx', None, None, 'xlsx') == os.path.join('/data',
+                                                                                            'all_range_alumni.xlsx')
+
+    def test_usage_errors(self):
+        for argv in (['crawl', 'in.xlsx', '--start-row', '2'],
+                     ['crawl', 'in.xlsx', '--start-row', '1', '--end-row', '9'],
+                     ['crawl', 'in.xlsx', '--workers', '-1'], ['crawl', 'in.xlsx', '--driver-profile', 'fancy'],
+                     ['crawl'], []):
+            with pytest.raises(SystemExit) as exit_info:
+                cli.main(argv)
+            assert exit_info.value.code == cli.EXIT_USAGE
+
+    def test_input_errors(self, tmpdir, capsys):
+        exit_code, summary = run(capsys, 'crawl', str(tmpdir.join('missing.xlsx')))
+        assert exit_code == summary['exit_code'] == cli.EXIT_INPUT
+        tmpdir.join('alumni.txt').write('')
+        exit_code, summary = run(capsys, 'crawl', str(tmpdir.join('alumni.txt')))
+        assert exit_code == cli.EXIT_INPUT
+        assert summary['error'] == 'Invalid file type.'
+
+    def test_unreadable_input(self, tmpdir, capsys):
+        tmpdir.join('alumni.xlsx').write('not a workbook')
+        exit_code, summary = run(capsys, 'crawl', str(tmpdir.join('alumni.xlsx')), '--cache-dir', str(tmpdir))
+        assert exit_code == summary['exit_code'] == cli.EXIT_INPUT
+        assert summary['error'].startswith('Input file could not be read')
+        assert not tmpdir.join('all_range_alumni.xlsx.journal').check()  # nothing was started
+
+    def test_exit_codes(self, tmpdir, capsys, monkeypatch):
+        tmpdir.join('alumni.csv').write('ID_NUMBER,FIRST_NAME,LAST_NAME\n')
+        states = {}
+
+        def run_job(job, sessions, cancel, report):
+            if states['state'] == 'error':
+                raise RuntimeError('no driver')
+            return jobs.Progress(job, states['state'], 5, 5, 10.0, 0.0, 0.5, 30.0, None)
+
+        monkeypatch.setattr(jobs, 'run_job', run_job)
+        for state, expected in ((jobs.DONE, cli.EXIT_OK), (jobs.CANCELLED, cli.EXIT_CANCELLED),
+                                ('error', cli.EXIT_FAILED)):
+            states['state'] = state
+            exit_code, summary = run(capsys, 'crawl', str(tmpdir.join('alumni.csv')), '--format', 'csv')
+            assert exit_code == summary['exit_code'] == expected
+            assert summary['output'].endswith('all_range_alumni.csv')
+        assert summary['state'] == jobs.FAILED
+        assert summary['error'] == 'RuntimeError: no driver'
+
+    def test_summary_file(self, tmpdir, monkeypatch):
+        tmpdir.join('alumni.csv').write('ID_NUMBER,FIRST_NAME,LAST_NAME\n')
+        monkeypatch.setattr(jobs, 'run_job', lambda job, sessions, cancel, report: jobs.status(job, jobs.DONE))
+        summary_path = str(tmpdir.join('summary.json'))
+        assert cli.main(['crawl', str(tmpdir.join('alumni.csv')), '--summary', summary_path]) == cli.EXIT_OK
+        with open(summary_path) as summary_file:
+            assert json.load(summary_file)['state'] == jobs.DONE
+
+    def test_no_tkinter(self):
+        code = 'import sys; from src.alumnifinder import cli; cli.build_parser(); print("tkinter" in sys.modules)'
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)
+        assert output.strip() == b'False'
+
+    def test_lazy_imports(self):
+        """--help must not wait for the crawler's dependencies, they are imported once a crawl starts."""
+        code = ('import sys; from src.alumnifinder import cli; cli.build_parser(); '
+                'print(sorted(m for m in ("pandas", "numpy", "selenium") if m in sys.modules))')
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)
+        assert output.strip() == b'[]'
@@ -0,0 +1,100 @@
+from src.alumnifinder.finder.cache import ProfileCache
+from src.alumnifinder.finder.fetcher import TabFetcher
+from src.alumnifinder.finder.metrics import RunMetrics
+from src.alumnifinder.finder.profile import parse_profile
+from src.alumnifinder.finder.waits import AdaptiveWait
+from tests.fixtures.site import Site, slugify
+
+
+class TabDriver:
+    """Stands in for a WebDriver with tabs, serving the pages of the local stand-in site without a browser."""
+
+    def __init__(self, site: Site, blocked: bool = False):
+        self.site = site
+        self.blocked = blocked  # window.open opens nothing, like behind a popup blocker
+        self.pages = {'main': ''}
+        self.current_window_handle = 'main'
+        self.opened = 0
+        self.most_open = 1
+        self.switch_to = self
+
+    @property
+    def window_handles(self) -> list:
+        return list(self.pages)
+
+    @property
+    def page_source(self) -> str:
+        return self.pages[self.current_window_handle]
+
+    def execute_script(self, script: str, *args):
+        if script.startswith('window.open'):
+            if self.blocked:
+                return None
+            self.opened += 1
+            slug = args[0].rstrip('/').rsplit('/', 1)[1]
+            self.pages['tab{}'.format(self.opened)] = self.site.profile_page(slug)
+            self.most_open = max(self.most_open, len(self.pages))
+            return None
+        return 'complete'
+
+    def get(self, url: str):
+        self.pages[self.current_window_handle] = self.site.profile_page(url.rstrip('/').rsplit('/', 1)[1])
+
+    def find_element(self, by, value):
+        return 'background' if 'background_details' in self.page_source else None
+
+    def window(self, handle: str):
+        self.current_window_handle = handle
+
+    def close(self):
+        del self.pages[self.current_window_handle]
+
+
+class TabCrawler:
+    """Stands in for Crawler, with the attributes TabFetcher uses."""
+
+    def __init__(self, driver: TabDriver, profile_cache: ProfileCache = None):
+        self.driver = driver
+        self.profile_cache = profile_cache
+        self.rate_limiter = None
+        self.tabs = 3
+        self.metrics = RunMetrics()
+        self.waits = AdaptiveWait(self.metrics, ceiling=0.2, floor=0.1)
+
+    def wait_until(self, name: str, condition):
+        return self.waits.until(self.driver, name, condition)
+
+
+class TestFetcher:
+    """Contains unit tests for concurrent profile fetching in browser tabs."""
+
+    def test_fetch_in_order(self):
+        site = Site(seed=1)
+        slugs = [slugify('jane jones', i) for i in range(7)]
+        driver = TabDriver(site)
+        profiles = TabFetcher(TabCrawler(driver), tabs=3).fetch(['http://127.0.0.1/in/{}/'.format(s) for s in slugs])
+        assert profiles == [parse_profile(site.profile_page(slug)) for slug in slugs]
+        assert driver.opened == 7
+        assert driver.most_open == 4  # main window + 3 tabs
+        assert driver.window_handles == ['main']
+        assert driver.current_window_handle == 'main'
+
+    def test_cached_profiles_are_not_loaded(self):
+        site = Site(seed=1)
+        links = ['http://127.0.0.1/in/{}/'.format(slugify('jane jones', i)) for i in range(4)]
+        cache = ProfileCache(':memory:')
+        first = TabFetcher(TabCrawler(TabDriver(site), cache), tabs=2).fetch(links)
+        driver = TabDriver(site)
+        assert TabFetcher(TabCrawler(driver, cache), tabs=2).fetch(links) == first
+        assert driver.opened == len([profile for profile in first if not (profile.jobs or profile.educations)])
+
+    def test_blocked_tabs_fall_back_to_current_tab(self):
+        site = Site(seed=1)
+        slugs = [slugify('jane jones', i) for i in range(4)]
+        driver = TabDriver(site, blocked=True)
+        crawler = TabCrawler(driver)
+        profiles = TabFetcher(crawler, tabs=3).fetch(['http://127.0.0.1/in/{}/'.format(s) for s in slugs])
+        assert profiles == [parse_profile(site.profile_page(slug)) for slug in slugs]
+        assert driver.window_handles == ['main']
+        assert crawler.tabs == 1  # later fetches do not wait for tabs again
+        assert len(crawler.metrics.spans['Wait:New-Tab:Timeout']) == 1
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from src.alumnifinder.excel.handler import Handler
+from src.alumnifinder.finder.planner import group_rows
 
 
 class TestHandler:
@@ -9,15 +10,12 @@ class TestHandler:
         assert type(headers) is list
         assert len(headers) > 0
 
-    def test_split_data(self, xls_file):
+    def test_divided_data(self, xls_file):
         h = Handler(xls_file)
-        num = h.find_divisor()
-        assert num > 0
-        sections = h.split_data(num)
-        assert type(sections) is list
-        for data_frame in sections:
-            assert type(data_frame) is not None
-            assert type(data_frame) is pd.DataFrame
+        assert type(h.divided_data) is pd.DataFrame
+        assert h.divided_data_size == len(h.divided_data) > 0
+        groups = group_rows(h.divided_data)  # the pipeline's units of work, one per name
+        assert sorted(position for group in groups for position in group) == list(range(h.divided_data_size))
 
     def test_iter(self, xls_file):
         h = Handler(xls_file)
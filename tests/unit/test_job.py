@@ -0,0 +1,76 @@
+import json
+import threading
+
+import pytest
+from pandas import DataFrame, read_csv
+
+from src.alumnifinder.excel import writer
+from src.alumnifinder.finder import job as jobs
+from tests.conftest import get_test_data
+from tests.unit.test_pipeline import SiteCrawler
+
+
+class FailingCrawler(SiteCrawler):
+    """SiteCrawler whose searches fail."""
+
+    def search_candidates(self) -> list:
+        raise RuntimeError('search failed')
+
+
+def write_input(tmpdir) -> str:
+    path = str(tmpdir.join('input.csv'))
+    DataFrame(get_test_data()).to_csv(path, index=False)
+    return path
+
+
+def get_job(tmpdir, output_format: str = 'csv') -> jobs.Job:
+    options = {'crawler_class': SiteCrawler, 'rate': 0, 'pause': (0, 0), 'queue_size': 1}
+    return jobs.Job(write_input(tmpdir), str(tmpdir.join('output.' + output_format)), None, None, 1, False, options,
+                    output_format, str(tmpdir.join('cache')))
+
+
+class TestJob:
+    """Contains unit tests for crawl jobs."""
+
+    def test_run_job(self, tmpdir):
+        reports = []
+        final = jobs.run_job(get_job(tmpdir), None, threading.Event(), reports.append)
+        assert final.state == jobs.DONE
+        assert final.rows == final.total == len(get_test_data()['ID_NUMBER'])
+        assert [report.rows for report in reports] == list(range(final.total + 1))
+        assert len(read_csv(str(tmpdir.join('output.csv'))))
+        assert tmpdir.join('cache', 'profiles.sqlite3').check()
+        assert not tmpdir.join('output.csv.journal').check()  # removed once the run is saved
+        assert tmpdir.join('output.csv.pruning.jsonl').check()
+        summary = final.summary()
+        assert summary['output'] == str(tmpdir.join('output.csv'))
+        with open(str(tmpdir.join('output.csv.pruning.jsonl'))) as audit_file:
+            actions = [decision['action'] for line in audit_file for decision in json.loads(line)['decisions']]
+        assert (summary['pruned'], summary['skipped']) == (actions.count('pruned'), actions.count('skipped'))
+        json.dumps(summary)
+
+    def test_cancel_saves_partial_results(self, tmpdir):
+        cancel = threading.Event()
+
+        def report(snapshot):
+            if snapshot.rows == 3:
+                cancel.set()
+
+        final = jobs.run_job(get_job(tmpdir, 'xlsx'), None, cancel, report)
+        assert final.state == jobs.CANCELLED
+        assert 3 <= final.rows < final.total
+        assert final.rows_per_minute > 0
+        assert tmpdir.join('output.xlsx').check()
+        assert tmpdir.join('output.xlsx.journal').check()  # kept to resume the cancelled run
+
+    def test_failed_save_keeps_crawl_error(self, tmpdir, monkeypatch):
+        def save_output(*args):
+            raise OSError('disk full')
+
+        monkeypatch.setattr(writer, 'save_output', save_output)
+        job = get_job(tmpdir)
+        job.options['crawler_class'] = FailingCrawler
+        with pytest.raises(RuntimeError):
+            jobs.run_job(job, None, threading.Event(), lambda snapshot: None)
+        with pytest.raises(OSError):  # nothing else to report once the crawl is done
+            jobs.run_job(get_job(tmpdir), None, threading.Event(), lambda snapshot: None)
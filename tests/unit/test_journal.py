@@ -0,0 +1,36 @@
+from src.alumnifinder.finder.journal import Journal
+
+
+class TestJournal:
+    """Contains unit tests for the crawl checkpoint journal."""
+
+    def test_resume(self, tmpdir):
+        path = str(tmpdir.join('run.xlsx.journal'))
+        journal = Journal(path, flush_every=1)
+        journal.record(2, [{'ROW_NUMBER': 2, 'PROFILE_LINK': 'https://www.linkedin.com/in/jane-jones/'},
+                           {'ROW_NUMBER': '', 'PROFILE_LINK': ''}])
+        journal.record(3, [])  # no match
+        journal.close()
+        with open(path, 'a') as journal_file:
+            journal_file.write('{"row": 4, "outp')  # crashed in the middle of a write
+
+        journal = Journal(path, resume=True)
+        assert journal.completed(2)
+        assert journal.completed(3)
+        assert not journal.completed(4)
+        assert journal.output(2)[0]['PROFILE_LINK'] == 'https://www.linkedin.com/in/jane-jones/'
+        assert journal.output(3) == []
+        journal.record(4, [])
+        journal.close()
+        assert Journal(path, resume=True).completed(4)
+        journal.remove()
+        assert not tmpdir.join('run.xlsx.journal').exists()
+
+    def test_no_resume(self, tmpdir):
+        path = str(tmpdir.join('run.xlsx.journal'))
+        journal = Journal(path)
+        journal.record(2, [])
+        journal.close()
+        journal = Journal(path, resume=False)
+        assert not journal.completed(2)
+        journal.close()
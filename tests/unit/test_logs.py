@@ -0,0 +1,22 @@
+import logging
+
+from src.alumnifinder.utils import logs
+
+
+class TestLogs:
+    """Contains unit tests for the logging setup of the entry points."""
+
+    def test_no_handler_on_import(self):
+        from src.alumnifinder.finder import crawler
+        assert crawler.logger.handlers == []
+
+    def test_configure_logging_once(self):
+        logger = logging.getLogger(logs.PACKAGE_LOGGER)
+        try:
+            handler = logs.configure_logging(logging.INFO)
+            assert logs.configure_logging(logging.WARNING) is handler
+            assert handler.level == logger.level == logging.WARNING
+            assert logger.handlers.count(handler) == 1
+        finally:
+            logger.handlers = [h for h in logger.handlers if not getattr(h, 'alumnifinder', False)]
+            logger.setLevel(logging.NOTSET)
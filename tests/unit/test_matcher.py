@@ -0,0 +1,49 @@
+from src.alumnifinder.finder import matcher
+from src.alumnifinder.utils import jsonreader
+
+PATTERNS = [{'category': 'schoolnames', 'data': ['university at buffalo', 'ub']},
+            {'category': 'degrees', 'data': [{'class': 'science', 'synonyms': ['bachelor of science', 'b.s.', 'm.s.']},
+                                             {'class': 'arts', 'synonyms': ['bachelor of arts', 'ba']}]}]
+
+
+class TestMatcher:
+    """Contains unit tests for the patterns.json synonym matchers."""
+
+    def test_synonyms_match_whole_words(self):
+        schools = matcher.compile_patterns(PATTERNS)['schoolnames']
+        assert schools.matches('University at Buffalo')
+        assert schools.matches('UB, School of Engineering')
+        assert schools.matches('universityatbuffalo')
+        assert not schools.matches('Public University')
+        assert not schools.matches('')
+        assert not schools.matches(float('nan'))
+
+    def test_classes(self):
+        degrees = matcher.compile_patterns(PATTERNS)['degrees']
+        assert degrees.names == ['science', 'arts']
+        assert degrees.classes('Bachelor of Science (B.S.), Computer Science') == {'science'}
+        assert degrees.classes('B.S. and BA') == {'science', 'arts'}
+        assert degrees.classes('Programs') == set()
+        assert degrees.mask('M.S.') == degrees.mask('MS') == degrees.mask('M.S') == 1
+
+    def test_no_match_across_initials(self):
+        patterns = matcher.compile_patterns(PATTERNS)
+        assert not patterns['degrees'].matches('M. S. Smith')
+        assert not patterns['degrees'].matches('B A Jones')
+        assert not patterns['schoolnames'].matches('U. B. Smith')
+        assert patterns['schoolnames'].matches('UB')
+
+    def test_patterns_json(self):
+        matchers = matcher.get_matchers()
+        assert matcher.SCHOOLS in matchers and matcher.DEGREES in matchers
+        assert matchers[matcher.SCHOOLS].matches('State University of New York at Buffalo')
+        assert matcher.get_matcher('missing').mask('anything') == 0
+        assert matchers[matcher.SCHOOLS].matches('UB')
+        assert not matchers[matcher.SCHOOLS].matches('Buffalo State College')  # another school of the same city
+        assert not matchers[matcher.SCHOOLS].matches('Club')
+
+    def test_patterns_not_shared(self):
+        patterns = jsonreader.get_patterns()
+        patterns[0]['data'].append('buffalo')
+        assert jsonreader.get_patterns() == jsonreader.load_patterns()
+        assert 'buffalo' not in jsonreader.get_patterns()[0]['data']
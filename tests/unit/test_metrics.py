@@ -0,0 +1,76 @@
+import csv
+import json
+
+import pytest
+
+from src.alumnifinder.finder.metrics import RunMetrics, WAIT, WORK, percentile, union_length
+
+
+class TestMetrics:
+    """Contains unit tests for the per-phase latency report."""
+
+    def test_percentile(self):
+        durations = [float(i) for i in range(1, 101)]
+        assert percentile(durations, 50) == 50.0
+        assert percentile(durations, 95) == 95.0
+        assert percentile(durations, 99) == 99.0
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([], 50) == 0.0
+
+    def test_report(self):
+        metrics = RunMetrics()
+        for seconds in (1.0, 2.0, 3.0):
+            metrics.record('Page-Load', seconds, WAIT)
+        metrics.record('Fine-Filter', 4.0)
+        metrics.row_done()
+        metrics.finish()
+        report = metrics.report()
+        phases = {entry['phase']: entry for entry in report['phases']}
+        assert phases['Page-Load']['count'] == 3
+        assert phases['Page-Load']['mean'] == 2.0
+        assert phases['Page-Load']['p50'] == 2.0
+        assert phases['Page-Load']['max'] == 3.0
+        assert phases['Fine-Filter']['kind'] == WORK
+        assert report['wait_seconds'] == 6.0
+        assert report['waiting'] == pytest.approx(3.0, abs=0.01)  # the 3 waits ended at about the same time
+        assert report['rows'] == 1
+
+    def test_union_length(self):
+        assert union_length([]) == 0.0
+        assert union_length([(0.0, 2.0), (1.0, 3.0), (5.0, 6.0), (5.5, 5.8)]) == 4.0
+
+    def test_overlapping_waits(self):
+        metrics = RunMetrics()
+        start = metrics.started
+        metrics.record('Page-Load', 2.0, WAIT, end=start + 2.0)  # two workers waiting at once
+        metrics.record('Page-Load', 2.0, WAIT, end=start + 3.0)
+        metrics.record('Fine-Filter', 4.0, end=start + 4.0)
+        metrics.finished = start + 4.0
+        report = metrics.report()
+        assert report['wait_seconds'] == 4.0
+        assert report['waiting'] == 3.0
+        assert report['working'] == pytest.approx(1.0)
+
+    def test_span_records_failures(self):
+        metrics = RunMetrics()
+        with pytest.raises(ValueError):
+            with metrics.span('Login'):
+                raise ValueError
+        assert len(metrics.spans['Login']) == 1
+
+    def test_export(self, tmpdir):
+        metrics = RunMetrics()
+        with metrics.span('Pause', WAIT):
+            pass
+        metrics.finish()
+        json_path = str(tmpdir.join('run.metrics.json'))
+        csv_path = str(tmpdir.join('run.metrics.csv'))
+        metrics.to_json(json_path)
+        metrics.to_csv(csv_path)
+        with open(json_path) as json_file:
+            assert json.load(json_file)['phases'][0]['phase'] == 'Pause'
+        with open(csv_path) as csv_file:
+            rows = list(csv.DictReader(csv_file))
+        assert rows[0]['phase'] == 'Pause'
+        assert rows[-1]['phase'] == 'rows_per_hour'
+        assert 'Pause' in metrics.summary()
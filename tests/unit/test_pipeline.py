@@ -0,0 +1,120 @@
+import json
+
+from pandas import DataFrame
+
+from src.alumnifinder.excel.writer import ResultSink
+from src.alumnifinder.finder import scoring
+from src.alumnifinder.finder.crawler import Crawler
+from src.alumnifinder.finder.journal import Journal
+from src.alumnifinder.finder.pipeline import CrawlPipeline
+from src.alumnifinder.finder.profile import Candidate, parse_profile
+from src.alumnifinder.finder.pruning import AuditLog
+from tests.conftest import get_test_data
+from tests.fixtures.site import Site, slugify
+
+SITE = Site(candidates=2, seed=3)
+
+
+class SiteCrawler(Crawler):
+    """Crawler searching and fetching the local stand-in site's pages without a browser."""
+
+    searches = []
+
+    def start_session(self):
+        self.driver = object()
+
+    def close_session(self):
+        self.driver = None
+
+    def search_candidates(self) -> list:
+        if self.row_first_name == 'kevin':
+            return []  # no match
+        self.searches.append(self.row_first_name)
+        name = '{} {}'.format(self.row_first_name, self.row_last_name)
+        return [Candidate(name.title(), '/in/{}/'.format(slugify(name, i))) for i in range(2)]
+
+    def fetch_profiles(self, links: list) -> list:
+        return [parse_profile(SITE.profile_page(link.strip('/').split('/')[1])) for link in links]
+
+
+def duplicated_data() -> DataFrame:
+    data = DataFrame(get_test_data())
+    data = data.iloc[[0, 1, 0, 2, 1, 0]].reset_index(drop=True)
+    data['ID_NUMBER'] = ['{:010d}'.format(i) for i in range(len(data))]
+    data.loc[2, 'FIRST_NAME'] = 'JANE'
+    return data
+
+
+def crawl_sequentially(data: DataFrame) -> list:
+    output = ResultSink()
+    SiteCrawler(input_data=data, output_data=output, pause=(0, 0), start_row=2).crawl_linkedin()
+    return output.records
+
+
+class TestPipeline:
+    """Contains unit tests for the staged crawl pipeline."""
+
+    def test_same_output_as_crawler(self):
+        data = DataFrame(get_test_data())
+        output = ResultSink()
+        pipeline = CrawlPipeline(data, output, browsers=3, queue_size=2, rate=0, start_row=2,
+                                 crawler_class=SiteCrawler)
+        pipeline.crawl_linkedin()
+        assert output.records == crawl_sequentially(data)
+        assert pipeline.metrics.rows == len(data)
+        assert 'Queue:Search' in pipeline.metrics.gauges
+        assert max(pipeline.metrics.gauges['Queue:Search']) <= 2
+
+    def test_resume_from_journal(self, tmpdir):
+        data = DataFrame(get_test_data())
+        path = str(tmpdir.join('run.xlsx.journal'))
+        journal = Journal(path)
+        journal.record(3, [{'ROW_NUMBER': 3, 'KEYWORD': 'restored'}])
+        output = ResultSink()
+        pipeline = CrawlPipeline(data, output, journal=journal, rate=0, start_row=2, crawler_class=SiteCrawler)
+        pipeline.crawl_linkedin()
+        journal.close()
+        keywords = [record.get('KEYWORD') for record in output.records if record.get('KEYWORD')]
+        assert keywords[:2] == ['Jane Jones', 'restored']
+        assert pipeline.metrics.rows == len(data) - 1
+        assert len(Journal(path, resume=True).completed_rows) == len(data)
+
+    def test_rows_of_a_name_searched_once(self):
+        data = duplicated_data()
+        SiteCrawler.searches = []
+        expected = crawl_sequentially(data)
+        assert sorted(SiteCrawler.searches) == ['jane', 'john', 'kathy']
+        SiteCrawler.searches = []
+        output = ResultSink()
+        CrawlPipeline(data, output, browsers=2, queue_size=1, rate=0, start_row=2,
+                      crawler_class=SiteCrawler).crawl_linkedin()
+        assert sorted(SiteCrawler.searches) == ['jane', 'john', 'kathy']
+        assert output.records == expected
+        assert sorted({record.get('ROW_NUMBER') for record in output.records} - {None, ''}) == [2, 3, 4, 5, 6, 7]
+
+    def test_pruning_audit(self, tmpdir):
+        path = str(tmpdir.join('run.xlsx.pruning.jsonl'))
+        audit = AuditLog(path)
+        pipeline = CrawlPipeline(duplicated_data(), ResultSink(), browsers=2, rate=0, start_row=2, audit=audit,
+                                 crawler_class=SiteCrawler)
+        pipeline.crawl_linkedin()
+        audit.close()
+        with open(path) as audit_file:
+            entries = [json.loads(line) for line in audit_file]
+        assert sorted(entry['rows'] for entry in entries) == [[2, 4, 7], [3, 6], [5]]  # one entry per name
+        assert all(len(entry['decisions']) == 2 for entry in entries)
+        assert 'Opened' in pipeline.metrics.gauges
+
+    def test_profiles_scored_once(self, monkeypatch):
+        calls = []
+        score_profile = scoring.score_profile
+
+        def counted(*args):
+            calls.append(args)
+            return score_profile(*args)
+
+        monkeypatch.setattr(scoring, 'score_profile', counted)
+        output = ResultSink()
+        CrawlPipeline(duplicated_data(), output, browsers=2, rate=0, start_row=2, prune_top_k=0, confident_score=0,
+                      crawler_class=SiteCrawler).crawl_linkedin()
+        assert len(calls) == len([record for record in output.records if record.get('PROFILE_LINK')])
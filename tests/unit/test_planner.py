@@ -0,0 +1,17 @@
+from pandas import DataFrame
+
+from src.alumnifinder.finder.planner import group_rows, name_key
+
+ROWS = DataFrame({'FIRST_NAME': ['Jane', 'John', ' jane ', 'Mary Ann', 'JOHN', 'mary  ann'],
+                  'LAST_NAME': ['Jones', 'James', 'JONES', 'Lee', 'James', 'Lee']}, index=range(5, 11))
+
+
+class TestPlanner:
+    """Contains unit tests for the search planner."""
+
+    def test_name_key(self):
+        assert name_key(' Mary  Ann ', 'LEE') == ('mary ann', 'lee')
+        assert name_key('Jane', 'Jones') != name_key('Jane', 'Jonas')
+
+    def test_group_rows(self):
+        assert group_rows(ROWS) == [[0, 2], [1, 4], [3, 5]]
@@ -0,0 +1,20 @@
+from time import monotonic
+
+from src.alumnifinder.finder.pool import pool_size
+from src.alumnifinder.finder.throttle import RateLimiter
+
+
+class TestPool:
+    """Contains unit tests for the worker pool sizing and the rate limiter."""
+
+    def test_pool_size(self):
+        assert pool_size(4, 100) == 4
+        assert pool_size(4, 2) == 2
+        assert pool_size(0, 100) >= 1
+
+    def test_rate_limiter(self):
+        limiter = RateLimiter(rate=50, burst=1)
+        start = monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        assert monotonic() - start >= 0.09  # 5 waits of 1/50s after the first page load
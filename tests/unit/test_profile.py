@@ -0,0 +1,59 @@
+from src.alumnifinder.finder.profile import Candidate, Profile, parse_profile, parse_search_results
+from tests import fixtures
+from tests.fixtures.site import Site
+
+
+def read_fixture(path: str) -> str:
+    with open(path) as html_file:
+        return html_file.read()
+
+
+class TestProfile:
+    """Contains unit tests for profile page parsing."""
+
+    def test_parse_jobs(self):
+        profile = parse_profile(read_fixture(fixtures.profile_path))
+        assert type(profile) is Profile
+        assert len(profile.jobs) == 2
+        assert profile.titles == ['Senior Software Engineer', 'Software Engineer Intern']
+        assert profile.companies == ['IBM', 'Amazon.com']
+        assert profile.locations == ['Buffalo, New York', 'Seattle, Washington']
+        assert 'Company Name\nIBM\n' in profile.jobs[0].description
+
+    def test_parse_educations(self):
+        profile = parse_profile(read_fixture(fixtures.profile_path))
+        assert len(profile.educations) == 2
+        assert profile.schools == ['University at Buffalo', 'Rochester Institute of Technology']
+        assert profile.degrees == ['Master of Science (MS)', 'Bachelor of Science (BS)']
+        assert profile.majors == ['Computer Science', '']
+        assert profile.years == ['2003', '1998']
+        assert profile.educations[0].details == 'Master of Science (MS)Computer Science'
+
+    def test_parse_empty(self):
+        profile = parse_profile(read_fixture(fixtures.empty_profile_path))
+        assert profile.jobs == []
+        assert profile.educations == []
+
+
+class TestSearchResults:
+    """Contains unit tests for search results page parsing."""
+
+    def test_parse_cards(self):
+        cards = parse_search_results(Site(candidates=3).search_page('jane jones Buffalo'))
+        assert [card.name for card in cards] == ['Jane Jones', 'Jane Jones B', 'Jane Jones C', 'Someone Else']
+        assert [card.link for card in cards][:2] == ['/in/jane-jones-0/', '/in/jane-jones-1/']
+        assert all(type(card) is Candidate and card.headline and card.location for card in cards)
+        assert ' at ' in cards[0].headline
+        assert ', ' in cards[0].location
+
+    def test_name_of_first_span_only(self):
+        page = ('<div class="search-result__info pt3 pb4 ph0"><a href="/in/jane/"><h3 id="ember1">'
+                '<span><span class="name actor-name">Jane &amp; Jones</span></span>'
+                '<span class="distance-badge"><span class="dist-value">2nd</span></span></h3></a></div>')
+        assert parse_search_results(page) == [Candidate('Jane & Jones', '/in/jane/')]
+
+    def test_parse_incomplete_cards(self):
+        page = ('<div class="search-result__info"><p class="subline-level-1">Out of network</p></div>'
+                '<div class="search-result__info"><a href="/in/jane/"><h3><span>Jane</span></h3></a></div>')
+        assert parse_search_results(page) == []
+        assert parse_search_results('<html><body>No results found</body></html>') == []
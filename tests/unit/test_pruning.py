@@ -0,0 +1,118 @@
+import json
+
+from src.alumnifinder.finder import pruning
+from src.alumnifinder.finder.profile import Candidate, Profile
+from src.alumnifinder.finder.scoring import score_profile
+from tests.unit.test_scoring import get_profile, get_row
+
+MATCH = Candidate('Jane Jones', '/in/match/', 'Senior Software Engineer at IBM', 'Buffalo, New York')
+STUDENT = Candidate('Jane Jones A', '/in/student/', 'Student at University at Buffalo', 'Austin, Texas')
+OTHER = Candidate('Jane Jones B', '/in/other/', 'Web Developer at Intel', 'Seattle, Washington')
+UNKNOWN = Candidate('Jane Jones C', '/in/unknown/')
+
+
+class Fetcher:
+    """fetch stand-in, the match's link serves the profile fixture, every other link an empty profile."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, links: list) -> list:
+        self.calls.append(list(links))
+        return [get_profile() if link == MATCH.link else Profile([], []) for link in links]
+
+
+def get_pruner(**kwargs) -> pruning.Pruner:
+    options = {'top_k': 2, 'threshold': 2, 'confident': 8, 'job_position': 'Senior Software Engineer',
+               'geolocation': 'Buffalo'}
+    options.update(kwargs)
+    return pruning.Pruner(**options)
+
+
+class TestPruner:
+    """Contains unit tests for candidate pruning."""
+
+    def test_rank(self):
+        ranked = get_pruner().rank([UNKNOWN, OTHER, STUDENT, MATCH], [get_row()])
+        assert [candidate for _, candidate, _ in ranked] == [MATCH, STUDENT, UNKNOWN, OTHER]
+        assert [position for position, _, _ in ranked] == [3, 2, 0, 1]
+        assert ranked[0][2].total == 4
+
+    def test_rank_by_best_row(self):
+        row = get_row(WORK_TITLE='Web Developer', WORK_COMPANY_NAME1='Intel')
+        pruner = get_pruner(job_position='', geolocation='')
+        assert [card.total for _, _, card in pruner.rank([MATCH, OTHER], [get_row()])] == [2, 0]
+        assert [card.total for _, _, card in pruner.rank([MATCH, OTHER], [get_row(), row])] == [2, 2]
+
+    def test_early_exit(self):
+        fetch = Fetcher()
+        opened, profiles, decisions, scores = get_pruner().open([OTHER, MATCH, STUDENT], [get_row()], fetch, 4)
+        assert fetch.calls == [[MATCH.link]]
+        assert opened == [MATCH]
+        assert profiles == [get_profile()]
+        assert [[score.total for score in row_scores] for row_scores in scores] == [[10]]
+        assert [(decision.candidate, decision.action) for decision in decisions] == [
+            (MATCH, pruning.OPENED), (STUDENT, pruning.SKIPPED), (OTHER, pruning.PRUNED)]
+        assert decisions[0].score == 10
+        assert decisions[1].score is None
+
+    def test_open_top_k_and_threshold(self):
+        fetch = Fetcher()
+        pruner = get_pruner(top_k=1, confident=0, job_position='Web Developer', geolocation='Seattle')
+        row = get_row(WORK_TITLE='', WORK_COMPANY_NAME1='')
+        opened, profiles, decisions, _ = pruner.open([STUDENT, OTHER, MATCH], [row], fetch, 2)
+        assert fetch.calls == [[OTHER.link]]  # STUDENT's card scores 1, below the threshold, and is not in the top 1
+        assert opened == [OTHER]
+        pruner.threshold = 1
+        fetch = Fetcher()
+        opened, profiles, decisions, _ = pruner.open([STUDENT, OTHER, MATCH], [row], fetch, 2)
+        assert fetch.calls == [[OTHER.link], [STUDENT.link]]
+        assert opened == [STUDENT, OTHER]  # in search result order
+
+    def test_open_without_card(self):
+        fetch = Fetcher()
+        unknown = Candidate('Jane Jones D', '/in/unknown-d/')
+        pruner = get_pruner(top_k=1, confident=0)
+        opened, _, decisions, _ = pruner.open([UNKNOWN, OTHER, unknown, MATCH], [get_row()], fetch, 4)
+        assert fetch.calls == [[MATCH.link], [UNKNOWN.link, unknown.link]]  # cached before cards were read
+        assert opened == [UNKNOWN, unknown, MATCH]
+        assert {decision.candidate: decision.action for decision in decisions}[OTHER] == pruning.PRUNED
+
+    def test_no_pruning(self):
+        fetch = Fetcher()
+        opened, profiles, decisions, _ = get_pruner(top_k=0, confident=0).open([OTHER, MATCH, UNKNOWN], [get_row()],
+                                                                               fetch, 2)
+        assert fetch.calls == [[MATCH.link], [OTHER.link, UNKNOWN.link]]
+        assert opened == [OTHER, MATCH, UNKNOWN]
+        assert len(profiles) == 3
+        assert {decision.action for decision in decisions} == {pruning.OPENED}
+
+    def test_every_row_needs_a_confident_match(self):
+        fetch = Fetcher()
+        rows = [get_row(), get_row(WORK_TITLE='Web Developer', WORK_COMPANY_NAME1='Intel', SCHOOL1='')]
+        opened, profiles, _, scores = get_pruner().open([OTHER, MATCH, STUDENT], rows, fetch, 4)
+        assert fetch.calls == [[MATCH.link], [OTHER.link]]
+        assert opened == [OTHER, MATCH]
+        assert len(scores) == 2 and all(len(row_scores) == len(rows) for row_scores in scores)  # one Score per row
+        assert scores[1] == [score_profile(row, profiles[1], 'Senior Software Engineer', 'Buffalo') for row in rows]
+
+
+class TestAuditLog:
+    """Contains unit tests for the pruning audit log."""
+
+    def test_record(self, tmpdir):
+        path = str(tmpdir.join('output.xlsx.pruning.jsonl'))
+        _, _, decisions, _ = get_pruner().open([OTHER, MATCH], [get_row()], Fetcher())
+        audit = pruning.AuditLog(path)
+        audit.record([2, 5], decisions)
+        audit.close()
+        audit = pruning.AuditLog(path, resume=True)
+        audit.record([3], [])
+        audit.close()
+        with open(path) as audit_file:
+            entries = [json.loads(line) for line in audit_file]
+        assert [entry['rows'] for entry in entries] == [[2, 5], [3]]
+        assert [(decision['link'], decision['action']) for decision in entries[0]['decisions']] == [
+            (MATCH.link, pruning.OPENED), (OTHER.link, pruning.SKIPPED)]
+        assert entries[0]['decisions'][0]['card_score'] == 4
+        assert entries[0]['decisions'][0]['card']['company'] == 1
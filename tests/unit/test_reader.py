@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.alumnifinder.excel import reader
+from src.alumnifinder.excel.handler import Handler
+from tests.conftest import get_test_data
+
+
+@pytest.fixture(scope='module')
+def export(tmpdir_factory):
+    """Writes the test data, with an extra column the crawler does not use, as .xlsx and .csv."""
+    data = pd.DataFrame(get_test_data())
+    data['NOTES'] = 'unused'
+    data.loc[3, 'WORK_TITLE'] = np.nan
+    directory = tmpdir_factory.mktemp('export')
+    xlsx_path = str(directory.join('export.xlsx'))
+    csv_path = str(directory.join('export.csv'))
+    data.to_excel(xlsx_path, index=False)
+    data.to_csv(csv_path, index=False)
+    return data, xlsx_path, csv_path
+
+
+class TestReader:
+    """Contains unit tests for the streaming input readers."""
+
+    @pytest.mark.parametrize('kind', ['xlsx', 'csv'])
+    def test_range(self, export, kind):
+        data, xlsx_path, csv_path = export
+        path = xlsx_path if kind == 'xlsx' else csv_path
+        rows = reader.read_range(path, 2, 6)
+        assert list(rows.index) == [2, 3, 4, 5]
+        assert list(rows.columns) == [column for column in data.columns if column in reader.INPUT_COLUMNS]
+        assert list(rows['ID_NUMBER']) == list(data['ID_NUMBER'][2:6])
+        assert list(rows['FIRST_NAME']) == list(data['FIRST_NAME'][2:6])
+        assert pd.isnull(rows.loc[3, 'WORK_TITLE'])
+
+    @pytest.mark.parametrize('kind', ['xlsx', 'csv'])
+    def test_chunks(self, export, kind):
+        data, xlsx_path, csv_path = export
+        path = xlsx_path if kind == 'xlsx' else csv_path
+        chunks = list(reader.iter_chunks(path, 1, None, columns=None, chunk_rows=4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+        assert list(pd.concat(chunks).index) == list(range(1, len(data)))
+        assert 'NOTES' in chunks[0].columns
+
+    def test_past_the_end(self, export):
+        data, xlsx_path, csv_path = export
+        assert len(reader.read_range(xlsx_path, 8, 500)) == len(data) - 8
+        assert len(reader.read_range(csv_path, 500, 600)) == 0
+
+    def test_invalid_file_type(self):
+        with pytest.raises(ValueError):
+            reader.read_headers('export.txt')
+
+    def test_numeric_ids_as_text(self, tmpdir):
+        data = pd.DataFrame({'ID_NUMBER': [1234, 5678], 'FIRST_NAME': ['Jane', 'John']})
+        xlsx_path, csv_path = str(tmpdir.join('ids.xlsx')), str(tmpdir.join('ids.csv'))
+        data.to_excel(xlsx_path, index=False)
+        data.to_csv(csv_path, index=False)
+        assert list(reader.read_range(xlsx_path)['ID_NUMBER']) == ['1234', '5678']
+        assert list(reader.read_range(csv_path)['ID_NUMBER']) == ['1234', '5678']
+        assert reader.id_text(1234.0) == '1234'
+        assert pd.isnull(reader.id_text(np.nan))
+
+    def test_handler_range(self, export):
+        data, xlsx_path, csv_path = export
+        handler = Handler(xlsx_path, start=3, end=5)  # spreadsheet rows, the header is row 1
+        assert 'NOTES' in handler.headers
+        assert list(handler.divided_data['FIRST_NAME']) == list(data['FIRST_NAME'][1:4])
+        assert handler.divided_data_size == 3
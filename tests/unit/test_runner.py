@@ -0,0 +1,51 @@
+import threading
+
+from src.alumnifinder.finder import job as jobs
+from src.alumnifinder.gui import runner
+
+
+def get_job(save_path: str) -> jobs.Job:
+    return jobs.Job('input.csv', save_path, None, None, 1, False, {}, 'xlsx', None)
+
+
+class TestRunner:
+    """Contains unit tests for the background job runner."""
+
+    def test_jobs_run_in_order(self):
+        ran = []
+
+        def execute(job, sessions, cancel, report):
+            ran.append(job.save_path)
+            return jobs.Progress(job, jobs.DONE, 1, 1, 60.0, 0.0, 0.0, 1.0, None)
+
+        job_runner = runner.JobRunner(execute=execute)
+        for name in ('a.xlsx', 'b.xlsx', 'c.xlsx'):
+            job_runner.submit(get_job(name))
+        job_runner.jobs.put(None)
+        job_runner.thread.join(5)
+        assert ran == ['a.xlsx', 'b.xlsx', 'c.xlsx']
+        states = [(snapshot.job.save_path, snapshot.state) for snapshot in job_runner.poll()]
+        assert ('a.xlsx', jobs.QUEUED) in states
+        assert ('a.xlsx', jobs.DONE) in states
+
+    def test_cancel_and_failure(self):
+        started = threading.Event()
+
+        def execute(job, sessions, cancel, report):
+            if job.save_path == 'fail.xlsx':
+                raise ValueError('broken input')
+            started.set()
+            assert cancel.wait(5)
+            return jobs.status(job, jobs.CANCELLED)
+
+        job_runner = runner.JobRunner(execute=execute)
+        job_runner.submit(get_job('slow.xlsx'))
+        job_runner.submit(get_job('fail.xlsx'))
+        assert started.wait(5)
+        job_runner.cancel()
+        job_runner.jobs.put(None)
+        job_runner.thread.join(5)
+        snapshots = [snapshot for snapshot in job_runner.poll() if snapshot.state != jobs.QUEUED]
+        assert [snapshot.state for snapshot in snapshots] == [jobs.CANCELLED, jobs.FAILED]
+        assert snapshots[1].error == 'broken input'
+        assert 'failed' in snapshots[1].describe()
@@ -0,0 +1,79 @@
+from src.alumnifinder.finder import scoring
+from src.alumnifinder.finder.profile import Candidate, Profile, parse_profile
+from tests import fixtures
+
+
+def get_row(**kwargs) -> dict:
+    """Returns an alumni row matching the profile fixture, columns can be overridden by kwargs."""
+    row = {'WORK_TITLE': 'Software Engineer', 'WORK_COMPANY_NAME1': 'IBM',
+           'SCHOOL1': 'School of Engineering & Applied Science', 'SCHOOL2': '', 'SCHOOL3': '',
+           'MAJOR1': 'Computer Science', 'MAJOR2': '', 'MAJOR3': '',
+           'DEGREE_CODE1': 'M.S.', 'DEGREE_CODE2': '', 'DEGREE_CODE3': '',
+           'DEGREE_YEAR1': 2003.0, 'DEGREE_YEAR2': float('nan'), 'DEGREE_YEAR3': float('nan')}
+    row.update(kwargs)
+    return row
+
+
+def get_profile() -> Profile:
+    with open(fixtures.profile_path) as html_file:
+        return parse_profile(html_file.read())
+
+
+class TestScoring:
+    """Contains unit tests for the offline scoring rules."""
+
+    def test_convert_str(self):
+        assert scoring.convert_str('Amazon.com, Inc.') == 'amazoncominc'
+
+    def test_check_degree(self):
+        assert scoring.check_degree('masterofsciencems', 'ms')
+        assert scoring.check_degree('bachelorofartsba', 'ba')
+        assert not scoring.check_degree('bachelorofartsba', 'bs')
+        assert scoring.check_degree('phdcomputerscience', 'phd')
+
+    def test_score_profile(self):
+        score = scoring.score_profile(get_row(), get_profile(), 'Senior Software Engineer', 'Buffalo')
+        assert type(score) is scoring.Score
+        assert score.job_title == 2
+        assert score.company == 1
+        assert score.position == 1
+        assert score.location == 1
+        assert score.school == 1
+        assert score.degree == 2
+        assert score.major == 1
+        assert score.grad_year == 1
+        assert score.total == 10
+
+    def test_score_card(self):
+        candidate = Candidate('Jane Jones', '/in/jane-jones/', 'Software Engineer at IBM', 'Buffalo, New York')
+        card = scoring.score_card(get_row(), candidate, 'Software Engineer', 'Buffalo')
+        assert type(card) is scoring.CardScore
+        assert card == scoring.CardScore(1, 1, 1, 1, 0)
+        assert card.total == 4
+        student = Candidate('Jane Jones', '/in/jane-jones/', 'Student at University at Buffalo', 'Rochester, New York')
+        assert scoring.score_card(get_row(), student, '', 'Buffalo') == scoring.CardScore(0, 0, 0, 0, 1)
+
+    def test_score_card_without_card(self):
+        candidate = Candidate('Jane Jones', '/in/jane-jones/')
+        assert scoring.score_card(get_row(WORK_TITLE=''), candidate, '', '').total == 0
+        assert scoring.score_card(get_row(), candidate, 'Software Engineer', 'Buffalo').total == 0
+
+    def test_score_empty_job(self):
+        score = scoring.score_profile(get_row(WORK_TITLE=float('nan')), get_profile())
+        assert score.job_title == 0
+        assert score.company == 0
+
+    def test_score_empty_profile(self):
+        score = scoring.score_profile(get_row(), Profile([], []), 'Software Engineer', 'Buffalo')
+        assert score.total == 0
+
+    def test_score_empty_degree_year(self):
+        row = get_row(SCHOOL2='School of Management', DEGREE_CODE2=float('nan'), MAJOR2=float('nan'))
+        score = scoring.score_profile(row, get_profile())  # DEGREE_YEAR2 is NaN
+        assert score.grad_year == 1
+
+    def test_sheet_year(self):
+        assert scoring.sheet_year(2003.0) == 2003
+        assert scoring.sheet_year('2003') == 2003
+        assert scoring.sheet_year(float('nan')) == 0
+        assert scoring.sheet_year('') == 0
@@ -0,0 +1,79 @@
+from selenium.common.exceptions import WebDriverException
+
+from src.alumnifinder.finder.session import SESSION_COOKIE, SessionManager
+
+
+class FakeDriver:
+    """Stands in for a Chrome WebDriver, logged in until it is quit or its cookies are cleared."""
+
+    def __init__(self):
+        self.cookies = {SESSION_COOKIE: {'name': SESSION_COOKIE, 'value': 'local'}}
+        self.alive = True
+
+    @property
+    def current_url(self) -> str:
+        if not self.alive:
+            raise WebDriverException('chrome not reachable')
+        return 'http://127.0.0.1/feed/'
+
+    def get_cookie(self, name: str):
+        return self.cookies.get(name)
+
+    def quit(self):
+        self.alive = False
+
+
+class LoginCrawler:
+    """Stands in for Crawler, counts the browsers it had to start and log in."""
+
+    def __init__(self):
+        self.driver = None
+        self.profile_dir = None
+        self.logins = 0
+
+    def open_session(self):
+        self.driver = FakeDriver()
+        self.logins += 1
+
+
+class TestSession:
+    """Contains unit tests for the warm browser session manager."""
+
+    def test_reuse(self):
+        sessions = SessionManager()
+        crawler = LoginCrawler()
+        for run in range(3):
+            session = sessions.acquire(crawler)
+            sessions.release(session)
+        assert crawler.logins == 1
+        assert session.runs == 3
+        sessions.close()
+        assert not crawler.driver.alive
+
+    def test_relaunch_dead_or_logged_out(self):
+        sessions = SessionManager()
+        crawler = LoginCrawler()
+        session = sessions.acquire(crawler)
+        session.driver.alive = False  # browser crashed
+        sessions.release(session)
+        session = sessions.acquire(crawler)
+        assert crawler.logins == 2
+        session.driver.cookies.clear()  # logged out
+        sessions.release(session)
+        sessions.acquire(crawler)
+        assert crawler.logins == 3
+
+    def test_relaunch_expired(self):
+        sessions = SessionManager(max_age=0)
+        crawler = LoginCrawler()
+        first = sessions.acquire(crawler)
+        sessions.release(first)
+        sessions.acquire(crawler)
+        assert crawler.logins == 2
+        assert not first.driver.alive
+
+    def test_one_session_per_worker(self):
+        sessions = SessionManager()
+        first = sessions.acquire(LoginCrawler())
+        second = sessions.acquire(LoginCrawler())
+        assert first.driver is not second.driver
@@ -0,0 +1,51 @@
+from http.cookiejar import CookieJar
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import HTTPCookieProcessor, build_opener
+
+import pytest
+
+from src.alumnifinder.finder.profile import parse_profile
+from tests.fixtures.site import Site
+
+
+@pytest.fixture(scope='module')
+def site():
+    site = Site(candidates=3)
+    site.base_url = site.start()
+    yield site
+    site.stop()
+
+
+class TestSite:
+    """Contains unit tests for the local stand-in site, checks it serves the markup the crawler targets."""
+
+    def test_login(self, site):
+        opener = build_opener(HTTPCookieProcessor(CookieJar()))
+        page = opener.open(site.base_url).read().decode('utf-8')
+        assert 'Log In or Sign Up' in page
+        assert 'class="login-email"' in page
+        assert 'id="login-submit"' in page
+        data = urlencode({'session_key': 'jane@example.com', 'session_password': 'secret'}).encode('utf-8')
+        opener.open(site.base_url + '/login', data)
+        page = opener.open(site.base_url).read().decode('utf-8')
+        assert 'class="ember-text-field ember-view"' in page
+
+    def test_search_results(self, site):
+        url = site.base_url + '/search/results/people/?keywords=jane+jones+Buffalo'
+        page = build_opener().open(url).read().decode()
+        assert page.count('class="search-result__info pt3 pb4 ph0"') == 4  # 3 candidates and an unrelated person
+        assert page == build_opener().open(url).read().decode()  # the same search always has the same results
+
+    def test_profile(self, site):
+        profiles = [parse_profile(build_opener().open(site.base_url + '/in/jane-jones-{}/'.format(i)).read().decode())
+                    for i in range(20)]
+        assert any(profile.jobs for profile in profiles)
+        assert any(profile.educations for profile in profiles)
+        for profile in profiles:
+            assert all(job.company for job in profile.jobs)
+            assert all(len(education.years) == 2 for education in profile.educations)
+
+    def test_not_found(self, site):
+        with pytest.raises(HTTPError):
+            build_opener().open(site.base_url + '/jobs/')
@@ -0,0 +1,61 @@
+from collections import deque
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from src.alumnifinder.finder.metrics import RunMetrics
+from src.alumnifinder.finder.waits import AdaptiveWait
+
+
+class FakeDriver:
+    """Stands in for a WebDriver whose page is parsed and holds the given elements."""
+
+    def __init__(self, elements: list):
+        self.elements = elements
+
+    def execute_script(self, script: str) -> str:
+        return 'complete'
+
+
+def present(driver):
+    if not driver.elements:
+        raise NoSuchElementException('absent')
+    return driver.elements[0]
+
+
+class TestWaits:
+    """Contains unit tests for the adaptive element waits."""
+
+    def test_present(self):
+        metrics = RunMetrics()
+        waits = AdaptiveWait(metrics)
+        assert waits.until(FakeDriver(['section']), 'Background', present) == 'section'
+        assert len(waits.samples['Background']) == 1
+        assert metrics.kinds['Wait:Background'] == 'wait'
+
+    def test_timeout_adapts(self):
+        waits = AdaptiveWait(ceiling=10, floor=0.2, factor=3, min_samples=3)
+        assert waits.timeout('Background') == 10  # nothing observed yet
+        for i in range(3):
+            waits.until(FakeDriver(['section']), 'Background', present)
+        assert waits.timeout('Background') == 0.2  # found right away, bounded by the floor
+        assert waits.timeout('Search-Results') == 10  # other waits keep their own samples
+        waits.samples['Background'] = [1.0, 2.0, 5.0]
+        assert waits.timeout('Background') == 10
+
+    def test_rolling_window(self):
+        waits = AdaptiveWait(ceiling=10, floor=0.2, factor=3, min_samples=3, window=3)
+        waits.samples['Background'] = deque([5.0], maxlen=3)
+        assert waits.timeout('Background') == 10
+        for i in range(3):
+            waits.until(FakeDriver(['section']), 'Background', present)
+        assert len(waits.samples['Background']) == 3  # the slow wait is dropped
+        assert waits.timeout('Background') == 0.2
+
+    def test_absent_fails_fast(self):
+        metrics = RunMetrics()
+        waits = AdaptiveWait(metrics, ceiling=10, floor=0.2, min_samples=1)
+        waits.samples['Background'] = [0.01]
+        with pytest.raises(TimeoutException):
+            waits.until(FakeDriver([]), 'Background', present)
+        assert metrics.spans['Wait:Background:Timeout'][0] < 1
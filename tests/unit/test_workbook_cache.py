@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.alumnifinder.excel import reader
+from src.alumnifinder.excel.cache import WorkbookCache
+from src.alumnifinder.excel.handler import Handler
+from tests.conftest import get_test_data
+
+
+@pytest.fixture
+def export(tmpdir):
+    data = pd.DataFrame(get_test_data())
+    data.loc[3, 'WORK_TITLE'] = np.nan
+    data['DEGREE_YEAR1'] = [2003.0, np.nan] * 5
+    xlsx_path = str(tmpdir.join('export.xlsx'))
+    data.to_excel(xlsx_path, index=False)
+    return xlsx_path
+
+
+class TestWorkbookCache:
+    """Contains unit tests for the columnar cache of input files."""
+
+    def test_same_rows_as_reader(self, tmpdir, export):
+        cache = WorkbookCache(str(tmpdir.join('workbooks')))
+        workbook = cache.open(export)
+        assert workbook.rows == 10
+        cached = workbook.read_range(2, 6)
+        parsed = reader.read_range(export, 2, 6)
+        assert list(cached.columns) == list(parsed.columns)
+        assert list(cached.index) == list(parsed.index)
+        for column in parsed.columns:
+            assert list(cached[column].fillna('')) == list(parsed[column].fillna('')), column
+        assert cached['DEGREE_YEAR1'].dtype == np.float64
+        assert len(workbook.read_range(8, 500)) == 2
+
+    def test_segments(self, tmpdir, export):
+        cache = WorkbookCache(str(tmpdir.join('workbooks')), chunk_rows=3)
+        workbook = cache.open(export)
+        assert workbook.segments == [0, 3, 6, 9]
+        parsed = reader.read_range(export)
+        for start, end in [(0, 10), (2, 7), (3, 6), (4, 5), (9, 10), (5, 5)]:
+            cached = workbook.read_range(start, end)
+            assert list(cached.index) == list(range(start, end))
+            for column in parsed.columns:
+                assert list(cached[column].fillna('')) == list(parsed[column][start:end].fillna('')), column
+
+    def test_input_columns_only(self, tmpdir):
+        data = pd.DataFrame(get_test_data())
+        data['NOTES'] = ['x' * 10000] + [''] * 9  # long free text the crawler does not use
+        csv_path = str(tmpdir.join('export.csv'))
+        data.to_csv(csv_path, index=False)
+        workbook = WorkbookCache(str(tmpdir.join('workbooks'))).open(csv_path)
+        assert 'NOTES' in workbook.headers
+        assert 'NOTES' not in workbook.columns
+        size = sum(os.path.getsize(os.path.join(workbook.directory, name)) for name in os.listdir(workbook.directory))
+        assert size < 10000
+        assert list(workbook.read_range(0, 2)['ID_NUMBER']) == list(data['ID_NUMBER'][:2])
+
+    def test_reuse_and_invalidate(self, tmpdir, export):
+        directory = str(tmpdir.join('workbooks'))
+        cache = WorkbookCache(directory)
+        first = cache.open(export).directory
+        assert cache.open(export).directory == first
+        stat = os.stat(export)
+        os.utime(export, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))  # modified
+        second = cache.open(export).directory
+        assert second != first
+        assert not os.path.exists(first)
+        assert os.listdir(directory) == [os.path.basename(second)]
+
+    def test_handler(self, tmpdir, export):
+        cache = WorkbookCache(str(tmpdir.join('workbooks')))
+        handler = Handler(export, start=3, end=5, cache=cache)
+        assert list(handler.divided_data['FIRST_NAME']) == ['John', 'Kathy', 'Kevin']
+        assert 'DEGREE_YEAR1' in handler.headers
@@ -0,0 +1,36 @@
+import json
+
+from pandas import DataFrame
+
+from src.alumnifinder.excel.writer import OUTPUT_COLUMNS, ResultSink
+
+
+class TestResultSink:
+    """Contains unit tests for the output result sink."""
+
+    def test_rows(self):
+        sink = ResultSink()
+        sink.set('ROW_NUMBER', 2)
+        sink.set('PROFILE_LINK', 'https://www.linkedin.com/in/jane-jones/')
+        sink.set('ACCURACY_SCORE', 7)
+        sink.end_row()
+        sink.set('ROW_NUMBER', '')
+        sink.end_row()
+        assert len(sink) == 2
+        frame = sink.to_frame()
+        assert type(frame) is DataFrame
+        assert list(frame.columns) == OUTPUT_COLUMNS
+        assert frame.loc[0, 'ACCURACY_SCORE'] == 7
+        assert frame.loc[0, 'JOB_TITLE'] == ''
+        assert frame.loc[1, 'ROW_NUMBER'] == ''
+
+    def test_empty(self):
+        assert len(ResultSink().to_frame()) == 0
+
+    def test_stream(self, tmpdir):
+        path = str(tmpdir.join('results.jsonl'))
+        sink = ResultSink(stream_path=path)
+        sink.append({'ROW_NUMBER': 2, 'KEYWORD': 'Jane Jones'})
+        sink.close()
+        with open(path) as stream:
+            assert [json.loads(line) for line in stream] == [{'ROW_NUMBER': 2, 'KEYWORD': 'Jane Jones'}]